@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Node Churn With and Without a NodePool
+
+This script runs two churn workloads on TemporaryHeadLinkedList, with plain
+Node allocation and with a NodePool that recycles deleted nodes:
+- steady: the list holds --live nodes; every step appends a value and
+  deletes the oldest one with delete_node
+- burst: every round appends --burst values with extend, then removes the
+  oldest --burst with delete_where
+
+For each it reports:
+- node allocations: nodes created during the workload
+- gc collections: garbage collector runs during the workload
+- gc pause ms: total time spent inside those collections
+- wall ms: time for the whole workload (best of --repeat runs)
+
+Every list reuses one temporary head node, so neither variant allocates
+a dummy node per delete_node or reverse call.
+
+Usage:
+    python benchmarks/bench_churn.py [--live 100000] [--steps 100000]
+        [--burst 10000] [--rounds 20] [--repeat 3]
+"""
+
+import argparse
+import gc
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import Node, NodePool, TemporaryHeadLinkedList
+
+
+class GCTimer:
+    """Count garbage collections and the time spent in them via gc.callbacks"""
+
+    def __init__(self):
+        self.collections = 0
+        self.pause = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.collections += 1
+            self.pause += time.perf_counter() - self._start
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def steady(llist, live, args):
+    """Append a value and delete the oldest one, args.steps times"""
+    for i in range(live, live + args.steps):
+        llist.append(i)
+        llist.delete_node(i - live)
+
+
+def burst(llist, live, args):
+    """Append args.burst values, then delete the oldest args.burst, per round"""
+    oldest = 0
+    for _ in range(args.rounds):
+        newest = oldest + live
+        llist.extend(range(newest, newest + args.burst))
+        oldest += args.burst
+        llist.delete_where(lambda value: value < oldest)
+
+
+def measure(workload, args, make_pool):
+    """Run a workload and return (allocations, collections, pause, wall)"""
+    best = None
+    for _ in range(args.repeat):
+        pool = make_pool()
+        llist = TemporaryHeadLinkedList()
+        llist.node_class = pool
+        llist.extend(range(args.live))
+        allocated = pool.allocated
+
+        gc.collect()
+        with GCTimer() as timer:
+            start = time.perf_counter()
+            workload(llist, args.live, args)
+            wall = time.perf_counter() - start
+        result = (pool.allocated - allocated, timer.collections, timer.pause, wall)
+        if best is None or wall < best[3]:
+            best = result
+    return best
+
+
+def main():
+    """Run both workloads with each allocator and print a table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--live", type=int, default=100_000,
+                        help="nodes in the list when each workload starts")
+    parser.add_argument("--steps", type=int, default=100_000,
+                        help="append/delete pairs in the steady workload")
+    parser.add_argument("--burst", type=int, default=10_000,
+                        help="nodes appended and deleted per burst round")
+    parser.add_argument("--rounds", type=int, default=20,
+                        help="rounds in the burst workload")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (best wall time is reported)")
+    args = parser.parse_args()
+
+    allocators = [
+        # A pool that keeps no free nodes allocates exactly like plain Node,
+        # and still counts its allocations
+        ("Node", lambda: NodePool(Node, max_size=0)),
+        ("NodePool", lambda: NodePool(Node, max_size=args.burst)),
+    ]
+
+    print("=" * 76)
+    print(f"NODE CHURN ({args.live:,} live nodes)")
+    print("=" * 76)
+    print(f"{'workload':<10}{'allocator':<12}{'node allocations':>18}"
+          f"{'gc collections':>16}{'gc pause ms':>13}{'wall ms':>10}")
+    for workload in (steady, burst):
+        for name, make_pool in allocators:
+            allocations, collections, pause, wall = measure(workload, args, make_pool)
+            print(f"{workload.__name__:<10}{name:<12}{allocations:>18,}"
+                  f"{collections:>16,}{pause * 1e3:>13.2f}{wall * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
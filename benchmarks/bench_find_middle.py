@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Two-Pass vs Single-Pass Middle Finding
+
+This script compares MultiplePassLinkedList.find_middle (two passes) with
+the slow-fast single pass, and with find_middle_streaming over a plain
+iterator that cannot be rewound. Memoization is bypassed so every run
+traverses the list. Pointer hops (reads of a node's next attribute) are
+counted with src.instrumentation.track_hops.
+
+Usage:
+    python benchmarks/bench_find_middle.py [--sizes 1000 100000 1000000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import MultiplePassLinkedList, find_middle_streaming
+from src.instrumentation import track_hops
+
+
+def best_time(func, repeat, setup=None):
+    """Return the fastest of several timed calls of func, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Time each middle-finding approach at each size and print a table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000],
+                        help="list lengths to measure")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed runs per case (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 94)
+    print("FIND MIDDLE: TWO-PASS VS SINGLE-PASS")
+    print("=" * 94)
+    print(f"{'nodes':>10}{'two-pass hops':>15}{'slow-fast hops':>16}"
+          f"{'two-pass ms':>14}{'slow-fast ms':>14}{'stream ms':>12}{'speedup':>12}")
+
+    for size in args.sizes:
+        llist = MultiplePassLinkedList()
+        llist.extend(range(size))
+
+        def two_pass():
+            llist._mutated()  # Invalidate the memoized result
+            llist.find_middle()
+
+        def slow_fast():
+            llist._mutated()
+            llist.find_middle(method="slow_fast")
+
+        with track_hops(llist) as stats:
+            two_pass()
+            slow_fast()
+        two_pass_hops = stats["find_middle[two_pass]"].hops
+        slow_fast_hops = stats["find_middle[slow_fast]"].hops
+
+        two_pass_time = best_time(two_pass, args.repeat)
+        slow_fast_time = best_time(slow_fast, args.repeat)
+        stream_time = best_time(find_middle_streaming, args.repeat,
+                                setup=lambda: (iter(range(size)),))
+        print(f"{size:>10,}{two_pass_hops:>15,}{slow_fast_hops:>16,}{two_pass_time * 1e3:>14.3f}{slow_fast_time * 1e3:>14.3f}"
+              f"{stream_time * 1e3:>12.3f}{two_pass_time / slow_fast_time:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
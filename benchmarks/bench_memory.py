@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Memory Cost per Node
+
+This script uses tracemalloc to measure how many bytes each node costs in
+every linked list class. It compares a dict-based node (the layout Node had
+before it used __slots__) against the current slot-based Node, and reports
+the array-backed ArrayLinkedList and the block-based UnrolledLinkedList
+for reference.
+
+Usage:
+    python benchmarks/bench_memory.py [--nodes N]
+"""
+
+import argparse
+import itertools
+import sys
+import os
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import (
+    Node,
+    ArrayLinkedList,
+    LinkedList,
+    MultiplePassLinkedList,
+    SlowFastLinkedList,
+    TemporaryHeadLinkedList,
+    UnrolledLinkedList
+)
+
+
+class DictNode:
+    """A node that stores its attributes in a per-instance __dict__."""
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+LIST_CLASSES = [
+    LinkedList,
+    MultiplePassLinkedList,
+    SlowFastLinkedList,
+    TemporaryHeadLinkedList,
+]
+
+NODE_CLASSES = [
+    ("dict (before)", DictNode),
+    ("slots (after)", Node),
+]
+
+
+def measure_bytes_per_node(list_class, node_class, nodes):
+    """Build a list of the given size and return the traced bytes per node"""
+    llist = list_class()
+    if node_class is not None:
+        llist.node_class = node_class
+    # Every node holds the same object so only the node itself is measured
+    data = itertools.repeat(0, nodes)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    llist.extend(data)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / nodes
+
+
+def main():
+    """Measure every list class with both node layouts and print a table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000,
+                        help="number of nodes to build per measurement")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"MEMORY PER NODE ({args.nodes:,} nodes)")
+    print("=" * 60)
+    print(f"{'List class':<26}{NODE_CLASSES[0][0]:>16}{NODE_CLASSES[1][0]:>16}")
+
+    for list_class in LIST_CLASSES:
+        row = [measure_bytes_per_node(list_class, node_class, args.nodes)
+               for _, node_class in NODE_CLASSES]
+        print(f"{list_class.__name__:<26}" + "".join(f"{b:>14.1f} B" for b in row))
+
+    array_bytes = measure_bytes_per_node(ArrayLinkedList, None, args.nodes)
+    print(f"{'ArrayLinkedList':<26}{'':>16}{array_bytes:>14.1f} B")
+    unrolled_bytes = measure_bytes_per_node(UnrolledLinkedList, None, args.nodes)
+    print(f"{'UnrolledLinkedList':<26}{'':>16}{unrolled_bytes:>14.1f} B")
+
+
+if __name__ == "__main__":
+    main()
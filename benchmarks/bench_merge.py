@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: K-Way Merge of Sorted Shards
+
+This script splits --nodes sorted integers round-robin into k sorted
+TemporaryHeadLinkedList shards and merges them three ways:
+- merge_sorted: relink the shards' nodes through a heap
+- lazy: build a new list from iter_merge_sorted, which leaves the shards
+  untouched and yields values one at a time
+- resort: copy every value into a Python list, sort it, and build a new
+  linked list from the result
+
+For each it reports the best wall time of --repeat runs, the time until
+the first merged value is available, and the peak memory traced by
+tracemalloc above what the shards already hold (in a separate, untimed run).
+
+Usage:
+    python benchmarks/bench_merge.py [--nodes 1000000] [--shards 10 100 1000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import os
+import time
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import TemporaryHeadLinkedList, merge_sorted, iter_merge_sorted
+
+
+def relink(shards):
+    """Merge by relinking nodes"""
+    return merge_sorted(shards)
+
+
+def lazy(shards):
+    """Build a new list from the lazy merge"""
+    values = iter_merge_sorted(shards)
+    first = next(values)
+    merged = TemporaryHeadLinkedList()
+    merged.append(first)
+    merged.extend(values)
+    return merged
+
+
+def resort(shards):
+    """Collect every value, sort and rebuild"""
+    values = [value for shard in shards for value in shard]
+    values.sort()
+    merged = TemporaryHeadLinkedList()
+    merged.extend(values)
+    return merged
+
+
+APPROACHES = [
+    ("merge_sorted", relink),
+    ("lazy", lazy),
+    ("resort", resort),
+]
+
+
+def make_shards(nodes, k):
+    """Deal 0 .. nodes - 1 round-robin into k sorted lists"""
+    shards = []
+    for i in range(k):
+        shard = TemporaryHeadLinkedList()
+        shard.extend(range(i, nodes, k))
+        shards.append(shard)
+    return shards
+
+
+def measure(approach, nodes, k, repeat):
+    """Return (best seconds, seconds to first value, peak extra bytes)"""
+    best = first = float("inf")
+    for _ in range(repeat):
+        shards = make_shards(nodes, k)
+        start = time.perf_counter()
+        approach(shards)
+        best = min(best, time.perf_counter() - start)
+
+        if approach is lazy:
+            shards = make_shards(nodes, k)
+            start = time.perf_counter()
+            next(iter_merge_sorted(shards))
+            first = min(first, time.perf_counter() - start)
+    if approach is not lazy:
+        first = best  # Nothing is available before the whole merge is done
+
+    shards = make_shards(nodes, k)
+    tracemalloc.start()
+    result = approach(shards)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, first, peak
+
+
+def main():
+    """Time and trace each approach for each shard count and print a table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1_000_000,
+                        help="total nodes across all shards")
+    parser.add_argument("--shards", type=int, nargs="+", default=[10, 100, 1000],
+                        help="numbers of shards to merge")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 66)
+    print(f"K-WAY MERGE ({args.nodes:,} nodes)")
+    print("=" * 66)
+    print(f"{'shards':>8}  {'approach':<14}{'ms':>10}{'first value ms':>16}{'peak extra MiB':>16}")
+    for k in args.shards:
+        for name, approach in APPROACHES:
+            seconds, first, peak = measure(approach, args.nodes, k, args.repeat)
+            print(f"{k:>8,}  {name:<14}{seconds * 1e3:>10.1f}{first * 1e3:>16.3f}{peak / 2**20:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
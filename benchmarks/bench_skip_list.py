@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Skip-List Positional Access vs Walking from the Head
+
+This script builds lists of each of --sizes integers and performs --ops
+positional operations at random positions (the same ones for every list):
+- SkipLinkedList: llist[i], insert(i, value) and delete_at(i) through the
+  width-annotated express lanes, and find_middle as llist[len // 2]
+- walk: the same operations on a MultiplePassLinkedList by walking i
+  nodes from the head, and its two-pass find_middle
+
+It reports the best wall time of --repeat runs in microseconds per
+operation (memoization bypassed for find_middle), then the time to build
+each list with extend.
+
+Usage:
+    python benchmarks/bench_skip_list.py [--sizes 1000 10000 100000 1000000] [--ops 200] [--repeat 3]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import MultiplePassLinkedList, Node, SkipLinkedList
+
+OPERATIONS = ["getitem", "insert", "delete_at", "find_middle"]
+
+
+def walk_to(llist, index):
+    """Return the node before position index, starting at the temporary head"""
+    node = llist._temporary_head()
+    for _ in range(index):
+        node = node.next
+    return node
+
+
+def walk_getitem(llist, index):
+    """Return the value at a position by walking to it"""
+    return walk_to(llist, index + 1).data
+
+
+def walk_insert(llist, index, value):
+    """Link a new node before a position by walking to its predecessor"""
+    prev = walk_to(llist, index)
+    node = Node(value)
+    node.next = prev.next
+    prev.next = node
+    if node.next is None:
+        llist.tail = node
+    llist.head = llist._sentinel.next
+    llist._size += 1
+    llist._mutated()
+
+
+def walk_delete_at(llist, index):
+    """Unlink the node at a position by walking to its predecessor"""
+    prev = walk_to(llist, index)
+    node = prev.next
+    prev.next = node.next
+    if node is llist.tail:
+        llist.tail = prev if prev is not llist._sentinel else None
+    llist.head = llist._sentinel.next
+    llist._size -= 1
+    llist._mutated()
+    return node.data
+
+
+def make_run(llist, operation, positions):
+    """Return a call performing the operation once at each position.
+
+    insert is followed by delete_at at the same position (and the other
+    way round), so the list keeps its size across repeats.
+    """
+    skip = isinstance(llist, SkipLinkedList)
+    getitem = llist.__getitem__ if skip else lambda i: walk_getitem(llist, i)
+    insert = llist.insert if skip else lambda i, v: walk_insert(llist, i, v)
+    delete_at = llist.delete_at if skip else lambda i: walk_delete_at(llist, i)
+
+    def run():
+        if operation == "getitem":
+            for index in positions:
+                getitem(index)
+        elif operation == "insert":
+            for index in positions:
+                insert(index, None)
+                delete_at(index)
+        elif operation == "delete_at":
+            for index in positions:
+                insert(index, delete_at(index))
+        else:
+            for _ in positions:
+                llist._mutated()
+                llist.find_middle()
+    return run
+
+
+def best_time(run, repeat):
+    """Return the fastest of several timed calls, with the collector paused"""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main():
+    """Time every operation at every size and print a table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000, 1_000_000],
+                        help="list lengths to measure")
+    parser.add_argument("--ops", type=int, default=200,
+                        help="random positions per operation")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (best is reported)")
+    args = parser.parse_args()
+
+    width = 26 + 12 * (len(OPERATIONS) + 1)
+    print("=" * width)
+    print(f"POSITIONAL ACCESS ({args.ops} random positions, µs per operation)")
+    print("=" * width)
+    print(f"{'size':>12}  {'list':<12}" + "".join(f"{op:>12}" for op in OPERATIONS) + f"{'extend ms':>12}")
+    for size in args.sizes:
+        positions = [random.Random(size + i).randrange(size) for i in range(args.ops)]
+        for name, factory in (("SkipLinkedList", SkipLinkedList), ("walk", MultiplePassLinkedList)):
+            llist = factory()
+            build = best_time(lambda: factory().extend(range(size)), 1)
+            llist.extend(range(size))
+            row = f"{size:>12,}  {name:<12}"
+            for operation in OPERATIONS:
+                seconds = best_time(make_run(llist, operation, positions), args.repeat)
+                row += f"{seconds / args.ops * 1e6:>12.2f}"
+            print(row + f"{build * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: In-Place Merge Sort vs Copy-Sort-Rebuild
+
+This script sorts a TemporaryHeadLinkedList of shuffled integers three ways:
+- merge sort: TemporaryHeadLinkedList.sort, which relinks the nodes
+- rebuild: copy the values into a Python list, sort it, and build a new
+  linked list from the result
+- write back: copy and sort the values, then store them back into the
+  existing nodes in order
+
+For each it reports the best wall time of --repeat runs and the peak memory
+traced by tracemalloc above what the unsorted list already holds. Memory is
+traced in a separate, untimed run.
+
+Usage:
+    python benchmarks/bench_sort.py [--sizes 1000 100000 1000000] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import TemporaryHeadLinkedList
+
+
+def merge_sort(llist):
+    """Sort the list in place by relinking its nodes"""
+    llist.sort()
+    return llist
+
+
+def rebuild(llist):
+    """Sort a copy of the values and build a new list from it"""
+    values = list(llist)
+    values.sort()
+    sorted_list = TemporaryHeadLinkedList()
+    sorted_list.extend(values)
+    return sorted_list
+
+
+def write_back(llist):
+    """Sort a copy of the values and store them back into the nodes"""
+    values = sorted(llist)
+    for node, value in zip(llist.iter_nodes(), values):
+        node.data = value
+    llist._mutated()
+    return llist
+
+
+APPROACHES = [
+    ("merge sort", merge_sort),
+    ("rebuild", rebuild),
+    ("write back", write_back),
+]
+
+
+def shuffled_list(values):
+    """Return a new list holding the given values"""
+    llist = TemporaryHeadLinkedList()
+    llist.extend(values)
+    return llist
+
+
+def measure(approach, values, repeat):
+    """Return (best seconds, peak extra bytes) for one approach"""
+    best = float("inf")
+    for _ in range(repeat):
+        llist = shuffled_list(values)
+        start = time.perf_counter()
+        result = approach(llist)
+        best = min(best, time.perf_counter() - start)
+        del llist, result
+
+    llist = shuffled_list(values)
+    tracemalloc.start()
+    result = approach(llist)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    """Time and trace each approach at each size and print a table"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000],
+                        help="list lengths to measure")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 58)
+    print("SORT: IN-PLACE MERGE SORT VS COPY-SORT-REBUILD")
+    print("=" * 58)
+    print(f"{'nodes':>10}  {'approach':<14}{'ms':>12}{'peak extra MiB':>18}")
+    for size in args.sizes:
+        values = list(range(size))
+        random.Random(size).shuffle(values)
+        for name, approach in APPROACHES:
+            seconds, peak = measure(approach, values, args.repeat)
+            print(f"{size:>10,}  {name:<14}{seconds * 1e3:>12.1f}{peak / 2**20:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
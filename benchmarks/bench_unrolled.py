@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Unrolled Linked List vs One Value per Node
+
+This script builds lists of --nodes integers and compares UnrolledLinkedList
+at each --block-sizes against the existing classes:
+- Node: the technique class for each operation (MultiplePassLinkedList
+  for find_middle, SlowFastLinkedList for find_cycle_start,
+  TemporaryHeadLinkedList for everything else), one Node per value
+- ArrayLinkedList: parallel data and next arrays
+
+It reports bytes per value (tracemalloc while building), then the best
+wall time of --repeat runs for each operation:
+- extend: build the list from a range
+- iterate: sum every value
+- find_middle: the middle value, with memoization bypassed
+- find_cycle_start: Floyd's algorithm on a cycle back to the middle
+- delete_node: delete the last value (a full scan), then append it back
+- reverse: reverse the whole list
+
+Usage:
+    python benchmarks/bench_unrolled.py [--nodes 1000000] [--block-sizes 16 64 256] [--repeat 3]
+"""
+
+import argparse
+import gc
+import itertools
+import sys
+import os
+import time
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import (
+    ArrayLinkedList,
+    MultiplePassLinkedList,
+    SlowFastLinkedList,
+    TemporaryHeadLinkedList,
+    UnrolledLinkedList
+)
+
+OPERATIONS = ["extend", "iterate", "find_middle", "find_cycle_start", "delete_node", "reverse"]
+
+
+def node_factory(operation):
+    """Return the Node-based class that implements an operation"""
+    if operation == "find_middle":
+        return MultiplePassLinkedList
+    if operation == "find_cycle_start":
+        return SlowFastLinkedList
+    return TemporaryHeadLinkedList
+
+
+def make_run(factory, operation, nodes):
+    """Prepare a list outside the timed region and return the call to time"""
+    if operation == "extend":
+        return lambda: factory().extend(range(nodes))
+    llist = factory()
+    llist.extend(range(nodes))
+    uncache = getattr(llist, "_mutated", lambda: None)
+    if operation == "iterate":
+        return lambda: sum(llist)
+    if operation == "find_middle":
+        return lambda: (uncache(), llist.find_middle())
+    if operation == "find_cycle_start":
+        llist.create_cycle(nodes // 2)
+        return lambda: (uncache(), llist.find_cycle_start())
+    if operation == "delete_node":
+        return lambda: (llist.delete_node(nodes - 1), llist.append(nodes - 1))
+    return llist.reverse
+
+
+def best_time(run, repeat):
+    """Return the fastest of several timed calls, with the collector paused"""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def bytes_per_value(factory, nodes):
+    """Return the traced bytes per value of a list holding one shared object"""
+    llist = factory()
+    data = itertools.repeat(0, nodes)
+    tracemalloc.start()
+    llist.extend(data)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / nodes
+
+
+def main():
+    """Measure every storage layout and print a table of times"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1_000_000,
+                        help="values per list")
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[16, 64, 256],
+                        help="UnrolledLinkedList block sizes to measure")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (best is reported)")
+    args = parser.parse_args()
+
+    layouts = [("Node", node_factory), ("ArrayLinkedList", lambda operation: ArrayLinkedList)]
+    for block_size in args.block_sizes:
+        layouts.append((f"Unrolled({block_size})",
+                        lambda operation, b=block_size: lambda: UnrolledLinkedList(b)))
+
+    width = 20 + 12 * (len(OPERATIONS) + 1)
+    print("=" * width)
+    print(f"UNROLLED VS ONE VALUE PER NODE ({args.nodes:,} values, ms)")
+    print("=" * width)
+    print(f"{'layout':<20}{'bytes/value':>12}" + "".join(f"{op[:11]:>12}" for op in OPERATIONS))
+    for name, factory_for in layouts:
+        row = f"{name:<20}{bytes_per_value(factory_for('extend'), args.nodes):>12.1f}"
+        for operation in OPERATIONS:
+            run = make_run(factory_for(operation), operation, args.nodes)
+            row += f"{best_time(run, args.repeat) * 1e3:>12.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
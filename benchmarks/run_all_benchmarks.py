@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for all linked list techniques.
+
+This script times the core operations of each technique at list sizes from
+10^2 up to --max-size and reports, for every operation and size:
+- ops_per_sec: operations per second (best of --repeat runs)
+- ns_per_node: nanoseconds per operation divided by the nodes it covers
+  (1 for append, the list size for everything else)
+- peak_bytes: peak memory traced by tracemalloc during one run
+
+Results are printed as JSON, or written to --output.
+
+With --check, the sizes and operations stored in the baseline file are
+rerun and compared against it. The run fails (exit status 1) if any case's
+ns_per_node is more than --tolerance slower than the baseline. Use
+--update-baseline to rewrite the baseline from a fresh run.
+
+Usage:
+    python benchmarks/run_all_benchmarks.py [--max-size 100000] [--repeat 3]
+        [--operations append reverse ...] [--output results.json]
+    python benchmarks/run_all_benchmarks.py --check [--tolerance 1.0]
+    python benchmarks/run_all_benchmarks.py --update-baseline [--max-size 10000]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import os
+import time
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import (
+    LinkedList,
+    MultiplePassLinkedList,
+    SlowFastLinkedList,
+    TemporaryHeadLinkedList,
+    DoublyLinkedList,
+    SkipLinkedList
+)
+
+LEN_CALLS = 1000
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _filled(list_class, size):
+    """Return a list_class instance holding 0 .. size - 1"""
+    llist = list_class()
+    llist.extend(range(size))
+    return llist
+
+
+def case_append(size):
+    """Build a list of size nodes with repeated append"""
+    llist = LinkedList()
+
+    def run():
+        for i in range(size):
+            llist.append(i)
+    return LinkedList, run, size, 1
+
+
+def case_len(size):
+    """Call len() LEN_CALLS times on a list of size nodes"""
+    llist = _filled(LinkedList, size)
+
+    def run():
+        for _ in range(LEN_CALLS):
+            len(llist)
+    return LinkedList, run, LEN_CALLS, size
+
+
+def case_find_middle(size):
+    """Find the middle with the two-pass technique"""
+    llist = _filled(MultiplePassLinkedList, size)
+
+    def run():
+        llist._mutated()  # Invalidate the memoized result
+        llist.find_middle()
+    return MultiplePassLinkedList, run, 1, size
+
+
+def case_find_cycle_start(size):
+    """Find the start of a cycle that returns to the middle node"""
+    llist = _filled(SlowFastLinkedList, size)
+    llist.create_cycle(size // 2)
+
+    def run():
+        llist._mutated()
+        llist.find_cycle_start()
+    return SlowFastLinkedList, run, 1, size
+
+
+def case_create_cycle(size):
+    """Link the tail back to the middle node"""
+    llist = _filled(SlowFastLinkedList, size)
+
+    def run():
+        llist.create_cycle(size // 2)
+    return SlowFastLinkedList, run, 1, size
+
+
+def case_find_middle_skip(size):
+    """Find the middle through the skip-list express lanes"""
+    llist = _filled(SkipLinkedList, size)
+
+    def run():
+        llist.find_middle()
+    return SkipLinkedList, run, 1, size
+
+
+def case_split_half(size):
+    """Cut the list into two halves that share its nodes"""
+    llist = _filled(SlowFastLinkedList, size)
+
+    def run():
+        llist.split_half()
+    return SlowFastLinkedList, run, 1, size
+
+
+def case_delete_node(size):
+    """Delete the last value (a full scan), then append it back"""
+    llist = _filled(TemporaryHeadLinkedList, size)
+
+    def run():
+        llist.delete_node(size - 1)
+        llist.append(size - 1)
+    return TemporaryHeadLinkedList, run, 1, size
+
+
+def case_delete_node_indexed(size):
+    """Delete the last value through the hash index, then append it back"""
+    llist = TemporaryHeadLinkedList(indexed=True)
+    llist.extend(range(size))
+
+    def run():
+        llist.delete_node(size - 1)
+        llist.append(size - 1)
+    return TemporaryHeadLinkedList, run, 1, size
+
+
+def case_reverse(size):
+    """Reverse the whole list"""
+    llist = _filled(TemporaryHeadLinkedList, size)
+
+    def run():
+        llist.reverse()
+    return TemporaryHeadLinkedList, run, 1, size
+
+
+def case_reverse_doubly(size):
+    """Reverse a doubly linked list by flipping its orientation"""
+    llist = _filled(DoublyLinkedList, size)
+
+    def run():
+        llist.reverse()
+    return DoublyLinkedList, run, 1, size
+
+
+CASES = {
+    "append": case_append,
+    "__len__": case_len,
+    "find_middle": case_find_middle,
+    "find_middle_skip": case_find_middle_skip,
+    "find_cycle_start": case_find_cycle_start,
+    "create_cycle": case_create_cycle,
+    "split_half": case_split_half,
+    "delete_node": case_delete_node,
+    "delete_node_indexed": case_delete_node_indexed,
+    "reverse": case_reverse,
+    "reverse_doubly": case_reverse_doubly,
+}
+
+
+def run_case(operation, size, repeat):
+    """Measure one operation at one size and return a result record"""
+    best = float("inf")
+    for _ in range(repeat):
+        list_class, run, ops, nodes = CASES[operation](size)
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    list_class, run, ops, nodes = CASES[operation](size)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "operation": operation,
+        "class": list_class.__name__,
+        "size": size,
+        "ops_per_sec": ops / best,
+        "ns_per_node": best / ops / nodes * 1e9,
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(sizes, repeat=3, operations=None):
+    """Run every selected operation at every size
+
+    Returns:
+        A JSON-serializable dict with environment info and the results
+    """
+    results = []
+    for operation in operations or CASES:
+        for size in sizes:
+            results.append(run_case(operation, size, repeat))
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """Compare a report against a baseline report
+
+    Args:
+        report: The fresh results from run_suite
+        baseline: The stored results from run_suite
+        tolerance: Allowed relative slowdown, e.g. 0.5 allows 50% slower
+
+    Returns:
+        A list of (result, baseline_result, slowdown, regressed) for every
+        case, where slowdown is the ratio of new to baseline ns_per_node
+        and regressed is True if it exceeds 1 + tolerance
+    """
+    stored = {(r["operation"], r["size"]): r for r in baseline["results"]}
+    comparisons = []
+    for result in report["results"]:
+        old = stored.get((result["operation"], result["size"]))
+        if old is not None:
+            slowdown = result["ns_per_node"] / old["ns_per_node"]
+            comparisons.append((result, old, slowdown, slowdown > 1 + tolerance))
+    return comparisons
+
+
+def check_baseline(path, tolerance, repeat=None):
+    """Rerun the baseline's cases and report regressions
+
+    Returns:
+        0 if no case regressed beyond the tolerance, 1 otherwise
+    """
+    with open(path) as fp:
+        baseline = json.load(fp)
+    sizes = sorted({r["size"] for r in baseline["results"]})
+    operations = list(dict.fromkeys(r["operation"] for r in baseline["results"]))
+    missing = [operation for operation in CASES if operation not in operations]
+    if missing:
+        print(f"⚠️  No baseline for {', '.join(missing)}; these cases are not checked. "
+              f"Run --update-baseline to add them.\n")
+    report = run_suite(sizes, repeat or baseline["repeat"],
+                       [operation for operation in operations if operation in CASES])
+
+    print(f"{'operation':<18}{'size':>9}{'baseline ns':>14}{'now ns':>12}{'ratio':>8}")
+    regressions = 0
+    for result, old, slowdown, failed in compare_to_baseline(report, baseline, tolerance):
+        regressions += failed
+        print(f"{result['operation']:<18}{result['size']:>9,}{old['ns_per_node']:>14.1f}"
+              f"{result['ns_per_node']:>12.1f}{slowdown:>7.2f}x" + ("  ❌ REGRESSION" if failed else ""))
+
+    if regressions:
+        print(f"\n💥 {regressions} case(s) slower than baseline by more than {tolerance:.0%}")
+        return 1
+    print(f"\n✅ No regressions beyond {tolerance:.0%}")
+    return 0
+
+
+def main():
+    """Parse arguments, run the suite and emit JSON"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=100_000,
+                        help="largest list size; sizes are powers of ten from 100 "
+                             "(use 10000000 for the full range)")
+    parser.add_argument("--repeat", type=int,
+                        help="timed runs per case, best is reported "
+                             "(default: 3, or the baseline's value with --check)")
+    parser.add_argument("--operations", nargs="+", choices=list(CASES),
+                        help="operations to run (default: all)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="baseline file for --check and --update-baseline")
+    parser.add_argument("--check", action="store_true",
+                        help="rerun the baseline cases and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="allowed relative slowdown for --check (1.0 = 2x slower)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="run the suite and overwrite the baseline file")
+    args = parser.parse_args()
+
+    if args.check:
+        return check_baseline(args.baseline, args.tolerance, args.repeat)
+    if args.update_baseline:
+        args.output = args.baseline
+
+    sizes = []
+    size = 100
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 10
+
+    report = run_suite(sizes, args.repeat or 3, args.operations)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fp:
+            fp.write(text + "\n")
+        print(f"Wrote {len(report['results'])} results to {args.output}")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
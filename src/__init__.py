@@ -8,19 +8,38 @@ different algorithmic techniques:
 - MultiplePassLinkedList: Demonstrates multiple pass technique
 - SlowFastLinkedList: Demonstrates slow-fast pointer technique
 - TemporaryHeadLinkedList: Demonstrates temporary head technique
+- ArrayLinkedList: Array-backed (struct-of-arrays) storage engine
+- DoublyLinkedList: Node handles with O(1) remove, insert_after and reverse
+- UnrolledLinkedList: Blocks of up to 64 values per node
+- SkipLinkedList: Skip-list lanes for O(log n) indexing, insert and delete_at
 """
 
-from .linked_list_base import Node, LinkedList
+from .linked_list_base import Node, NodePool, LinkedList, CycleInfo
 from .multiple_pass import MultiplePassLinkedList
-from .slow_fast import SlowFastLinkedList
-from .temporary_head import TemporaryHeadLinkedList
+from .slow_fast import SlowFastLinkedList, find_middle_streaming
+from .temporary_head import TemporaryHeadLinkedList, merge_sorted, iter_merge_sorted
+from .array_linked_list import ArrayLinkedList
+from .doubly_linked import DoublyLinkedList, DoublyNode
+from .unrolled_linked_list import UnrolledLinkedList
+from .skip_list import SkipLinkedList, SkipNode
 
 __all__ = [
     'Node',
+    'NodePool',
     'LinkedList',
     'MultiplePassLinkedList',
     'SlowFastLinkedList',
-    'TemporaryHeadLinkedList'
+    'CycleInfo',
+    'find_middle_streaming',
+    'TemporaryHeadLinkedList',
+    'merge_sorted',
+    'iter_merge_sorted',
+    'ArrayLinkedList',
+    'DoublyLinkedList',
+    'DoublyNode',
+    'UnrolledLinkedList',
+    'SkipLinkedList',
+    'SkipNode'
 ]
 
 __version__ = '1.0.0'
@@ -0,0 +1,266 @@
+from array import array
+from typing import Optional, Any, Iterable, Iterator, List
+
+NIL = -1
+
+
+class ArrayLinkedList:
+    """A singly linked list stored as parallel arrays (struct-of-arrays).
+
+    Instead of one Node object per element, node i is described by
+    data[i] and next[i], where next holds the index of the following node
+    or NIL (-1) for the end of the list. The next pointers live in a compact
+    array of machine integers, so per-node overhead is a list slot plus
+    8 bytes and traversals touch contiguous memory.
+
+    The class offers the LinkedList API (append, extend, print_list,
+    len, str) together with the techniques from MultiplePassLinkedList,
+    SlowFastLinkedList and TemporaryHeadLinkedList. Slots freed by
+    delete_node are kept on a free list and reused by later appends.
+
+    Attributes:
+        head: Index of the first node, or NIL if the list is empty
+        tail: Index of the last node, or NIL if the list is empty
+        data: Values indexed by slot
+        next: Index of the next node for each slot, NIL for None
+
+    Time Complexity: O(1) append, O(n) find_middle, find_cycle_start,
+                     delete_node and reverse
+    Space Complexity: O(1) extra for every operation
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty array-backed linked list."""
+        self.head: int = NIL
+        self.tail: int = NIL
+        self.data: List[Any] = []
+        self.next = array('q')
+        self._size = 0
+        self._free = NIL
+
+    def _allocate(self, data: Any) -> int:
+        """Return a slot holding data, reusing a freed slot if available.
+
+        Args:
+            data: The value to store in the slot
+
+        Returns:
+            The index of the slot, with its next pointer set to NIL
+        """
+        slot = self._free
+        if slot == NIL:
+            self.data.append(data)
+            self.next.append(NIL)
+            return len(self.data) - 1
+        self._free = self.next[slot]
+        self.data[slot] = data
+        self.next[slot] = NIL
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Put an unlinked slot on the free list.
+
+        Args:
+            slot: The index of the slot to free
+        """
+        self.data[slot] = None
+        self.next[slot] = self._free
+        self._free = slot
+
+    def append(self, data: Any) -> None:
+        """Add a new node with the given data to the end of the list.
+
+        Args:
+            data: The data to store in the new node
+        """
+        slot = self._allocate(data)
+        self._size += 1
+        if self.head == NIL:
+            self.head = slot
+            self.tail = slot
+            return
+        nxt = self.next
+        nxt[slot] = nxt[self.tail]
+        nxt[self.tail] = slot
+        self.tail = slot
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+
+        Args:
+            iterable: The items to append, in order
+        """
+        for data in iterable:
+            self.append(data)
+
+    def print_list(self) -> None:
+        """Print the list in a readable format (data -> data -> ... -> None)."""
+        print(self)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the list.
+
+        Returns:
+            The count of nodes in the list
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Lazily yield the data of each node, from head to tail.
+
+        Yields:
+            The data stored in each node
+        """
+        data, nxt = self.data, self.next
+        current = self.head
+        for _ in range(self._size):
+            yield data[current]
+            current = nxt[current]
+
+    def __str__(self) -> str:
+        """Return a string representation of the list.
+
+        The tail's next index is where a cycle starts, so a cyclic list
+        ends with "(cycle back to data)" as LinkedList does, without a
+        cycle-detection pass.
+
+        Returns:
+            A string in the format "data -> data -> ... -> None"
+        """
+        result = [str(data) for data in self]
+        if self.tail != NIL and self.next[self.tail] != NIL:
+            result.append(f"(cycle back to {self.data[self.next[self.tail]]})")
+        else:
+            result.append("None")
+        return " -> ".join(result)
+
+    def find_middle(self) -> Optional[Any]:
+        """Find the middle element.
+
+        The size is already known, so only the second pass of the
+        multiple-pass technique is needed. For even-length lists, returns
+        the second middle element, matching MultiplePassLinkedList.
+
+        Returns:
+            The data of the middle node, or None if the list is empty
+        """
+        if self.head == NIL:
+            return None
+        nxt = self.next
+        current = self.head
+        for _ in range(self._size // 2):
+            current = nxt[current]
+        return self.data[current]
+
+    def create_cycle(self, pos: int) -> bool:
+        """Create a cycle by connecting the last node to the node at given position.
+
+        Args:
+            pos: The 0-based position where the cycle should start.
+                 Must be non-negative and less than the list length.
+
+        Returns:
+            True if the cycle was created successfully, False otherwise.
+        """
+        if pos < 0 or pos >= self._size:
+            return False
+        nxt = self.next
+        cycle_node = self.head
+        for _ in range(pos):
+            cycle_node = nxt[cycle_node]
+        nxt[self.tail] = cycle_node
+        return True
+
+    def find_cycle_start(self) -> Optional[Any]:
+        """Find the start of a cycle using Floyd's cycle detection algorithm.
+
+        Returns:
+            The data of the node where the cycle starts, or None if no cycle exists.
+        """
+        nxt = self.next
+        slow = fast = self.head
+
+        # Phase 1: Detect cycle using slow and fast indices
+        while fast != NIL and nxt[fast] != NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+            if slow == fast:
+                break
+        else:
+            return None
+
+        # Phase 2: Find cycle start
+        slow = self.head
+        while slow != fast:
+            slow = nxt[slow]
+            fast = nxt[fast]
+        return self.data[slow]
+
+    def delete_node(self, value: Any) -> bool:
+        """Delete the first occurrence of a node with the given value.
+
+        NIL plays the role of the temporary head: a predecessor of NIL
+        means the match is the head node. If a cycle starts at the deleted
+        node, the tail's back-edge moves to the following node, or is
+        dropped when the node was the only one on the cycle.
+
+        Args:
+            value: The value to search for and delete
+
+        Returns:
+            True if the node was found and deleted, False otherwise
+        """
+        data, nxt = self.data, self.next
+        prev, current = NIL, self.head
+        for _ in range(self._size):
+            if data[current] == value:
+                following = nxt[current]
+                if nxt[self.tail] == current:
+                    if current == self.tail:
+                        following = NIL
+                    else:
+                        nxt[self.tail] = following
+                if prev == NIL:
+                    self.head = following
+                else:
+                    nxt[prev] = following
+                if current == self.tail:
+                    self.tail = prev
+                self._size -= 1
+                if self._size == 0:
+                    self.head = NIL
+                self._release(current)
+                return True
+            prev, current = current, nxt[current]
+        return False
+
+    def reverse(self) -> None:
+        """Reverse the list by rewriting the next indices.
+
+        Raises:
+            ValueError: If the list has a cycle
+        """
+        nxt = self.next
+        if self.tail != NIL and nxt[self.tail] != NIL:
+            raise ValueError("operation is not supported on a list with a cycle")
+        prev, current = NIL, self.head
+        for _ in range(self._size):
+            next_node = nxt[current]
+            nxt[current] = prev
+            prev, current = current, next_node
+        self.head, self.tail = prev, self.head
+
+# Example usage
+if __name__ == "__main__":
+    # Quick validation of functionality
+    llist = ArrayLinkedList()
+    llist.extend(range(1, 6))
+    print(f"List: {llist}")
+    print(f"Length: {len(llist)}, Middle: {llist.find_middle()}")
+
+    llist.delete_node(1)
+    llist.reverse()
+    print(f"Delete 1 and reverse: {llist}")
+
+    llist.create_cycle(1)
+    print(f"Cycle starts at: {llist.find_cycle_start()}")
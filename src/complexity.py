@@ -0,0 +1,334 @@
+import gc
+import math
+import re
+import statistics
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .linked_list_base import LinkedList
+from .multiple_pass import MultiplePassLinkedList
+from .skip_list import SkipLinkedList
+from .slow_fast import SlowFastLinkedList
+from .temporary_head import TemporaryHeadLinkedList
+
+# Growth classes ordered from best to worst, with the largest fitted
+# exponent each one accepts. O(log n) and O(n log n) are not told apart
+# from their neighbours at practical sizes, so they share a class.
+GROWTH_CLASSES = [("constant", 0.5), ("linear", 1.5), ("quadratic", 2.5), ("cubic", math.inf)]
+
+DOCUMENTED_GROWTH = {
+    "O(1)": "constant",
+    "O(log n)": "constant",
+    "O(k)": "linear",
+    "O(n)": "linear",
+    "O(n log n)": "linear",
+    "O(n^2)": "quadratic",
+}
+
+# Extra exponent accepted on top of the documented class's limit. The log
+# factor alone lifts a fitted O(n log n) exponent to about 1.1 at the
+# default sizes, and sort allocates nothing but touches every node on each
+# of its log n passes, so cache and scheduler noise push it past 1.5 under
+# load (1.55 to 1.72 measured). 1.85 still fails a quadratic sort.
+GROWTH_ALLOWANCE = {
+    "O(n log n)": 0.35,
+}
+
+DEFAULT_SIZES = (1_000, 2_000, 4_000, 8_000, 16_000, 32_000, 64_000)
+MIN_BATCH_TIME = 0.005
+
+_COMPLEXITY_PATTERN = re.compile(r"Time Complexity:\s*(O\([^)]*\))")
+
+
+class ScalingResult(NamedTuple):
+    """The outcome of measuring how one method scales.
+
+    Attributes:
+        name: "Class.method" of the measured method
+        sizes: The input sizes that were timed
+        seconds: The best time at each size
+        exponent: The fitted k in time ~ n^k
+        observed: The growth class of the exponent, e.g. "linear"
+        documented: The documented complexity, e.g. "O(n)", or None
+        ok: False if observed growth is worse than documented
+    """
+    name: str
+    sizes: List[int]
+    seconds: List[float]
+    exponent: float
+    observed: str
+    documented: Optional[str]
+    ok: bool
+
+
+def fit_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float:
+    """Fit time ~ c * n^k on log-log axes.
+
+    Uses the Theil-Sen estimator, the median of the slopes between every
+    pair of points, so a single size slowed down by the scheduler does not
+    skew the result the way it would a least-squares fit.
+
+    Args:
+        sizes: The input sizes, at least two of them distinct
+        seconds: The measured time at each size
+
+    Returns:
+        The growth exponent k
+
+    Example:
+        >>> round(fit_exponent([1, 2, 4], [1.0, 4.0, 16.0]), 3)
+        2.0
+    """
+    points = [(math.log(n), math.log(max(t, 1e-12))) for n, t in zip(sizes, seconds)]
+    slopes = [(y2 - y1) / (x2 - x1)
+              for i, (x1, y1) in enumerate(points)
+              for x2, y2 in points[i + 1:] if x2 != x1]
+    return statistics.median(slopes)
+
+
+def classify_exponent(exponent: float) -> str:
+    """Name the growth class of a fitted exponent.
+
+    Args:
+        exponent: The fitted k in time ~ n^k
+
+    Returns:
+        "constant", "linear", "quadratic" or "cubic"
+    """
+    for name, limit in GROWTH_CLASSES:
+        if exponent < limit:
+            return name
+    return GROWTH_CLASSES[-1][0]
+
+
+def documented_complexity(cls: type, method_name: str) -> Optional[str]:
+    """Read a method's documented time complexity from its docstrings.
+
+    The method's own docstring is searched for a "Time Complexity: O(...)"
+    line first, then the docstrings of the class and its bases.
+
+    Args:
+        cls: The class that owns or inherits the method
+        method_name: The name of the method
+
+    Returns:
+        The first big-O expression found, e.g. "O(n)", or None
+    """
+    docstrings = [getattr(cls, method_name).__doc__]
+    docstrings += [klass.__doc__ for klass in cls.__mro__]
+    for doc in docstrings:
+        match = _COMPLEXITY_PATTERN.search(doc or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def measure_scaling(build: Callable[[int], Callable[[], None]],
+                    sizes: Sequence[int] = DEFAULT_SIZES,
+                    repeat: int = 5,
+                    min_time: float = MIN_BATCH_TIME) -> List[float]:
+    """Time an operation at each size.
+
+    As with timeit, the operation is called in batches long enough to rise
+    above timer noise and the garbage collector is paused while timing.
+    Every size is timed once per round, and the best of the rounds is kept.
+    Full collections grow with the number of live nodes and would otherwise
+    make linear operations look superlinear.
+
+    Args:
+        build: Called with a size; prepares the input outside the timed
+               region and returns a zero-argument function to time. The
+               function must be safe to call repeatedly.
+        sizes: The input sizes to time
+        repeat: Rounds of batches; the fastest batch per size is kept
+        min_time: The shortest batch, in seconds
+
+    Returns:
+        The best time per call in seconds for each size
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        runs = [build(size) for size in sizes]
+        numbers = []
+        for run in runs:
+            number = 1
+            while _time_batch(run, number) < min_time:
+                number *= 2
+            numbers.append(number)
+        best = [math.inf] * len(runs)
+        for _ in range(repeat):
+            # Each round visits every size, so a slow spell on the machine
+            # is spread across sizes instead of looking like growth
+            for i, run in enumerate(runs):
+                best[i] = min(best[i], _time_batch(run, numbers[i]))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return [elapsed / number for elapsed, number in zip(best, numbers)]
+
+
+def _time_batch(run: Callable[[], None], number: int) -> float:
+    """Return the seconds taken by number calls of run."""
+    start = time.perf_counter()
+    for _ in range(number):
+        run()
+    return time.perf_counter() - start
+
+
+def check_scaling(cls: type, method_name: str,
+                  build: Callable[[int], Callable[[], None]],
+                  sizes: Sequence[int] = DEFAULT_SIZES,
+                  repeat: int = 5) -> ScalingResult:
+    """Measure a method and compare its growth with its documentation.
+
+    Args:
+        cls: The class whose method is measured
+        method_name: The name of the method, used to find its documentation
+        build: As for measure_scaling
+        sizes: The input sizes to time
+        repeat: Batches per size
+
+    Returns:
+        A ScalingResult; ok is False if the method grows faster than
+        documented, allowing for GROWTH_ALLOWANCE
+    """
+    seconds = measure_scaling(build, sizes, repeat)
+    exponent = fit_exponent(sizes, seconds)
+    observed = classify_exponent(exponent)
+    documented = documented_complexity(cls, method_name)
+    ok = True
+    if documented in DOCUMENTED_GROWTH:
+        limit = dict(GROWTH_CLASSES)[DOCUMENTED_GROWTH[documented]]
+        ok = exponent < limit + GROWTH_ALLOWANCE.get(documented, 0.0)
+    return ScalingResult(f"{cls.__name__}.{method_name}", list(sizes), seconds,
+                         exponent, observed, documented, ok)
+
+
+def _filled(cls: type, size: int) -> LinkedList:
+    """Return a list of the given class holding 0 .. size - 1."""
+    llist = cls()
+    llist.extend(range(size))
+    return llist
+
+
+def _build_append(size: int) -> Callable[[], None]:
+    llist = _filled(LinkedList, size)
+    return lambda: llist.append(None)
+
+
+def _build_extend(size: int) -> Callable[[], None]:
+    llist = LinkedList()
+    return lambda: llist.extend(range(size))
+
+
+def _build_len(size: int) -> Callable[[], None]:
+    llist = _filled(LinkedList, size)
+    return lambda: len(llist)
+
+
+def _build_str(size: int) -> Callable[[], None]:
+    llist = _filled(LinkedList, size)
+    return lambda: str(llist)
+
+
+def _uncached(llist: LinkedList, query: Callable[[], object]) -> Callable[[], None]:
+    """Wrap a memoized query so each call recomputes it."""
+    def run():
+        llist._mutated()
+        query()
+    return run
+
+
+def _build_find_middle(size: int) -> Callable[[], None]:
+    llist = _filled(MultiplePassLinkedList, size)
+    return _uncached(llist, llist.find_middle)
+
+
+def _build_find_cycle_start(size: int) -> Callable[[], None]:
+    llist = _filled(SlowFastLinkedList, size)
+    llist.create_cycle(size // 2)
+    return _uncached(llist, llist.find_cycle_start)
+
+
+def _build_create_cycle(size: int) -> Callable[[], None]:
+    llist = _filled(SlowFastLinkedList, size)
+    return lambda: llist.create_cycle(size - 1)
+
+
+def _build_delete_node(size: int) -> Callable[[], None]:
+    llist = _filled(TemporaryHeadLinkedList, size)
+    return lambda: llist.delete_node(size - 1)
+
+
+def _build_reverse(size: int) -> Callable[[], None]:
+    llist = _filled(TemporaryHeadLinkedList, size)
+    return llist.reverse
+
+
+def _build_sort(size: int) -> Callable[[], None]:
+    llist = _filled(TemporaryHeadLinkedList, size)
+    return llist.sort
+
+
+def _build_getitem(size: int) -> Callable[[], None]:
+    llist = _filled(SkipLinkedList, size)
+    return lambda: llist[size - 1]
+
+
+def _build_insert(size: int) -> Callable[[], None]:
+    llist = _filled(SkipLinkedList, size)
+    return lambda: (llist.insert(size // 2, None), llist.delete_at(size // 2))
+
+
+def _build_skip_find_middle(size: int) -> Callable[[], None]:
+    llist = _filled(SkipLinkedList, size)
+    return llist.find_middle
+
+
+# (class, method name, build function) for every public method checked by
+# verify_all. Every build returns a function that can be called repeatedly:
+# delete_node keeps scanning the whole list for a value it already removed,
+# sort makes every merge pass even over a list that is already sorted, and
+# each SkipLinkedList insert is undone by a delete_at at the same position.
+CASES = [
+    (LinkedList, "append", _build_append),
+    (LinkedList, "extend", _build_extend),
+    (LinkedList, "__len__", _build_len),
+    (LinkedList, "__str__", _build_str),
+    (MultiplePassLinkedList, "find_middle", _build_find_middle),
+    (SlowFastLinkedList, "find_cycle_start", _build_find_cycle_start),
+    (SlowFastLinkedList, "create_cycle", _build_create_cycle),
+    (TemporaryHeadLinkedList, "delete_node", _build_delete_node),
+    (TemporaryHeadLinkedList, "reverse", _build_reverse),
+    (TemporaryHeadLinkedList, "sort", _build_sort),
+    (SkipLinkedList, "__getitem__", _build_getitem),
+    (SkipLinkedList, "insert", _build_insert),
+    (SkipLinkedList, "find_middle", _build_skip_find_middle),
+]
+
+
+def verify_all(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 5) -> Dict[str, ScalingResult]:
+    """Check every registered method against its documented complexity.
+
+    Args:
+        sizes: The input sizes to time
+        repeat: Batches per size
+
+    Returns:
+        A ScalingResult for each case, keyed by "Class.method"
+    """
+    results = {}
+    for cls, method_name, build in CASES:
+        result = check_scaling(cls, method_name, build, sizes, repeat)
+        results[result.name] = result
+    return results
+
+
+# Example usage
+if __name__ == "__main__":
+    print(f"{'method':<42}{'documented':>11}{'exponent':>10}{'observed':>11}")
+    for result in verify_all().values():
+        flag = "" if result.ok else "  ❌ worse than documented"
+        print(f"{result.name:<42}{result.documented or '-':>11}"
+              f"{result.exponent:>10.2f}{result.observed:>11}{flag}")
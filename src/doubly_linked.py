@@ -0,0 +1,356 @@
+import functools
+from typing import Optional, Any, Callable, Iterable, Iterator, Tuple
+from .linked_list_base import Node, CycleInfo
+from .slow_fast import SlowFastLinkedList
+
+
+class DoublyNode(Node):
+    """A node with links in both directions.
+
+    Attributes:
+        data: The data stored in the node
+        next: Reference to the next node, or None if this is the last node
+        prev: Reference to the previous node, or None if this is the first node
+        owner: The token of the list the node belongs to, or None once removed
+    """
+
+    __slots__ = ('prev', 'owner')
+
+    def __init__(self, data: Any) -> None:
+        """Initialize a new, unlinked node.
+
+        Args:
+            data: The data to store in this node
+        """
+        super().__init__(data)
+        self.prev: Optional['DoublyNode'] = None
+        self.owner: Optional[object] = None
+
+
+# The slot descriptors themselves, which subclasses such as the counting
+# nodes of instrumentation.HopStats cannot override
+_NEXT_SLOT = Node.__dict__["next"]
+_PREV_SLOT = DoublyNode.__dict__["prev"]
+
+
+def _oriented(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an inherited traversal so a pending reversal is applied first."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._orient()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class DoublyLinkedList(SlowFastLinkedList):
+    """A doubly linked list with node handles and an O(1) reverse.
+
+    append and insert_after return the new node as a handle, which remove
+    and insert_after accept to unlink or link next to it in O(1) without
+    a search. find_middle, create_cycle, find_cycle_start and find_cycle
+    are inherited from SlowFastLinkedList, so this class can replace it or
+    TemporaryHeadLinkedList (delete_node and reverse are provided too).
+
+    reverse only flips an orientation flag and swaps head and tail. While
+    the flag is set, each node's prev link is its logical next link, and
+    append, insert_after, remove and iteration follow it. The traversals
+    inherited from SlowFastLinkedList read node.next directly, so they
+    first swap the two links of every node to clear the flag. That is
+    O(n), which those traversals cost anyway, and it happens once per
+    reversal. Handles stay valid throughout.
+
+    A cycle made with create_cycle only closes in the forward direction,
+    so reverse, remove and insert_after refuse to run on a cyclic list.
+
+    Time Complexity: O(1) append, remove, insert_after and reverse,
+                     O(n) find_middle, delete_node and cycle detection
+    Space Complexity: O(1), two extra references per node
+    """
+
+    node_class: type = DoublyNode
+
+    def __init__(self) -> None:
+        """Initialize an empty doubly linked list."""
+        super().__init__()
+        self._reversed = False
+        self._owner = object()  # Marks this list's nodes for _check_handle
+
+    def append(self, data: Any) -> DoublyNode:
+        """Add a new node with the given data to the end of the list.
+
+        As in LinkedList.append, on a list with a cycle the node is spliced
+        in before the cycle's back-edge.
+
+        Args:
+            data: The data to store in the new node
+
+        Returns:
+            The new node, usable as a handle for remove and insert_after
+
+        Example:
+            >>> llist = DoublyLinkedList()
+            >>> handle = llist.append(1)
+            >>> llist.append(2)
+            >>> llist.remove(handle)
+            1
+        """
+        forward, backward = self._links()
+        node = self.node_class(data)
+        node.owner = self._owner
+        tail = self.tail
+        setattr(node, backward, tail)
+        self._size += 1
+        self._mutated()
+        if tail is None:
+            self.head = self.tail = node
+            return node
+        setattr(node, forward, getattr(tail, forward))
+        setattr(tail, forward, node)
+        self.tail = node
+        return node
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+
+        Args:
+            iterable: The items to append, in order
+        """
+        if iterable is self:
+            iterable = list(iterable)  # Snapshot before the list starts growing
+        if self._reversed:
+            for data in iterable:
+                self.append(data)
+            return
+        last = self.tail
+        closing = last.next if last else None
+        added = 0
+        node_class, owner = self.node_class, self._owner
+        try:
+            for data in iterable:
+                node = node_class(data)
+                node.owner = owner
+                node.prev = last
+                if last is None:
+                    self.head = node
+                else:
+                    last.next = node
+                last = node
+                added += 1
+        finally:
+            # Commit the nodes linked so far, even if the iterable raised
+            self._size += added
+            self._mutated()
+            if last is not self.tail:
+                last.next = closing
+                self.tail = last
+
+    def iter_nodes(self) -> Iterator[DoublyNode]:
+        """Lazily yield each distinct node once, in the current orientation.
+
+        Yields:
+            The nodes of the list in order
+        """
+        if not self._reversed:
+            yield from super().iter_nodes()
+            return
+        node = self.head
+        while node is not None:
+            yield node
+            node = node.prev
+
+    def insert_after(self, handle: DoublyNode, data: Any) -> DoublyNode:
+        """Insert a new node directly after the given node.
+
+        Args:
+            handle: A node of this list, as returned by append or insert_after
+            data: The data to store in the new node
+
+        Returns:
+            The new node
+
+        Raises:
+            ValueError: If handle is not a current node of this list, or
+                        the list has a cycle
+        """
+        self._check_handle(handle)
+        forward, backward = self._links()
+        node = self.node_class(data)
+        node.owner = self._owner
+        following = getattr(handle, forward)
+        setattr(node, backward, handle)
+        setattr(node, forward, following)
+        if handle is self.tail:
+            self.tail = node
+        else:
+            setattr(following, backward, node)
+        setattr(handle, forward, node)
+        self._size += 1
+        self._mutated()
+        return node
+
+    def remove(self, handle: DoublyNode) -> Any:
+        """Unlink the given node in O(1) using its prev and next links.
+
+        The removed node is marked so that passing it again raises.
+
+        Args:
+            handle: A node of this list, as returned by append or insert_after
+
+        Returns:
+            The data of the removed node
+
+        Raises:
+            ValueError: If handle is not a current node of this list, or
+                        the list has a cycle
+        """
+        self._check_handle(handle)
+        forward, backward = self._links()
+        prev, next_node = getattr(handle, backward), getattr(handle, forward)
+        if prev is None:
+            self.head = next_node
+        else:
+            setattr(prev, forward, next_node)
+        if next_node is None:
+            self.tail = prev
+        else:
+            setattr(next_node, backward, prev)
+        handle.next = handle.prev = handle.owner = None  # Mark as removed
+        self._size -= 1
+        self._mutated()
+        return handle.data
+
+    def delete_node(self, value: Any) -> bool:
+        """Delete the first occurrence of a node with the given value.
+
+        The scan is O(n); the unlink itself needs no dummy head because
+        every node knows its predecessor.
+
+        Args:
+            value: The value to search for and delete
+
+        Returns:
+            True if the node was found and deleted, False otherwise
+        """
+        for node in self.iter_nodes():
+            if node.data == value:
+                self.remove(node)
+                return True
+        return False
+
+    def reverse(self) -> None:
+        """Reverse the list in O(1) by flipping its orientation.
+
+        No node is touched: from now on each node's prev link is read as
+        its next link and the other way round. Handles stay valid.
+
+        Raises:
+            ValueError: If the list has a cycle
+
+        Example:
+            >>> llist = DoublyLinkedList()
+            >>> llist.extend([1, 2, 3])
+            >>> llist.reverse()
+            >>> print(llist)
+            3 -> 2 -> 1 -> None
+        """
+        self._check_acyclic()
+        self._reversed = not self._reversed
+        self.head, self.tail = self.tail, self.head
+        self._mutated()
+
+    # The inherited traversals follow node.next, so they run on the nodes
+    # with any pending reversal applied
+    find_middle = _oriented(SlowFastLinkedList.find_middle)
+    create_cycle = _oriented(SlowFastLinkedList.create_cycle)
+    find_cycle_start = _oriented(SlowFastLinkedList.find_cycle_start)
+    find_cycle = _oriented(SlowFastLinkedList.find_cycle)
+    split_into = _oriented(SlowFastLinkedList.split_into)
+    _count_nodes = _oriented(SlowFastLinkedList._count_nodes)
+    _cycle_info = _oriented(SlowFastLinkedList._cycle_info)
+
+    def _take_nodes(self) -> Tuple[Optional[DoublyNode], Optional[DoublyNode], int]:
+        """Empty the list as LinkedList._take_nodes, in forward orientation.
+
+        The owner token is replaced, so every handle given out before is
+        rejected from now on, whoever takes the nodes over.
+        """
+        self._orient()
+        self._owner = object()
+        return super()._take_nodes()
+
+    def _orient(self) -> None:
+        """Apply a pending reversal, so node.next is the forward link again.
+
+        Swaps the two links of every node, O(n). Lists that are not
+        reversed return at once. The links are read through the raw slot
+        descriptors, so hop tracking does not count the swap.
+        """
+        if not self._reversed:
+            return
+        next_link, prev_link = _NEXT_SLOT, _PREV_SLOT
+        node = self.head
+        while node is not None:
+            following = prev_link.__get__(node)
+            prev_link.__set__(node, next_link.__get__(node))
+            next_link.__set__(node, following)
+            node = following
+        self._reversed = False
+
+    def _links(self) -> Tuple[str, str]:
+        """Return the names of the forward and backward links in the current orientation."""
+        return ("prev", "next") if self._reversed else ("next", "prev")
+
+    def _open_cycle_info(self) -> Optional[CycleInfo]:
+        """Return None for a reversed list, which cannot have a cycle."""
+        if self._reversed:
+            return None
+        return super()._open_cycle_info()
+
+    def _new_part(self, head: Optional[DoublyNode], tail: Optional[DoublyNode],
+                  size: int) -> 'DoublyLinkedList':
+        """Return a new list that owns the given chain, as split_into needs.
+
+        The chain's nodes are handed to the part's owner token, and the
+        first node's prev link into the previous part is cleared. This
+        walks the part once more.
+        """
+        part = super()._new_part(head, tail, size)
+        node = head
+        while node is not None:
+            node.owner = part._owner
+            node = node.next
+        if head is not None:
+            head.prev = None
+        return part
+
+    def _check_handle(self, handle: DoublyNode) -> None:
+        """Raise ValueError unless handle is a linked node of this acyclic list."""
+        self._check_acyclic()
+        if getattr(handle, "owner", None) is not self._owner:
+            raise ValueError("handle is not a node of this list")
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if create_cycle has closed the list into a cycle."""
+        if self._reversed:
+            return
+        if self.tail is not None and self.tail.next is not None:
+            raise ValueError("operation is not supported on a list with a cycle")
+
+
+# Example usage
+if __name__ == "__main__":
+    # Quick validation of functionality
+    llist = DoublyLinkedList()
+    handles = [llist.append(i) for i in range(1, 6)]
+    print(f"List: {llist}")
+
+    llist.remove(handles[2])
+    llist.insert_after(handles[0], 1.5)
+    print(f"Remove 3, insert 1.5 after 1: {llist}")
+
+    llist.reverse()
+    print(f"Reversed in O(1): {llist}")
+    print(f"Middle: {llist.find_middle()}")
+
+    llist.create_cycle(1)
+    print(f"Cycle starts at: {llist.find_cycle_start()}")
@@ -0,0 +1,281 @@
+import functools
+import inspect
+import itertools
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .linked_list_base import LinkedList, NodePool
+
+# Operations whose pointer hops are recorded, where the tracked list has them
+OPERATIONS = ("find_middle", "find_cycle_start", "find_cycle", "delete_node", "reverse", "__len__")
+
+
+class OpStats:
+    """Accumulated counts for one operation.
+
+    Attributes:
+        calls: Number of recorded calls
+        hops: Pointer dereferences, i.e. reads of a node's next attribute
+        visits: Node visits, i.e. reads of a node's data attribute
+    """
+
+    __slots__ = ("calls", "hops", "visits")
+
+    def __init__(self) -> None:
+        """Initialize zeroed counters."""
+        self.calls = 0
+        self.hops = 0
+        self.visits = 0
+
+    @property
+    def hops_per_call(self) -> float:
+        """Average pointer dereferences per call."""
+        return self.hops / self.calls if self.calls else 0.0
+
+    @property
+    def visits_per_call(self) -> float:
+        """Average node visits per call."""
+        return self.visits / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        return f"OpStats(calls={self.calls}, hops={self.hops}, visits={self.visits})"
+
+
+class HopStats:
+    """Per-operation pointer-hop counters for node-based linked lists.
+
+    Counting is switched on per list with track(). While a list is tracked
+    its nodes are swapped to a subclass of their node class whose data and
+    next attributes count every read, and the list is swapped to a subclass
+    whose operations record the reads made during each call. Leaving track()
+    swaps both back, so untracked lists run the plain code at full speed.
+
+    The swap itself is not cheap. Entering and leaving track() each walk
+    the whole list and reassign every node's class, and the entry
+    snapshot of the nodes is held for the whole block. That is O(n) time
+    and memory per block: about 1.8 s and 8 MiB for a million nodes,
+    whatever the block does. Track one block around a batch of calls,
+    not a block per call, and on production traffic track a sample of
+    lists rather than every request.
+
+    Operations that take a method argument are recorded per method, e.g.
+    "find_cycle_start[brent]", so techniques can be compared directly.
+    Reads made by an operation called from another tracked operation are
+    attributed to the outer call only. Memoized answers record zero hops.
+
+    Attributes:
+        operations: OpStats for each recorded operation, keyed by name
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set of counters."""
+        self.operations: Dict[str, OpStats] = {}
+        self._hops = 0
+        self._visits = 0
+        self._depth = 0
+        self._node_classes: Dict[type, type] = {}
+        self._list_classes: Dict[type, type] = {}
+
+    def __getitem__(self, name: str) -> OpStats:
+        """Return the counters for an operation, zeroed if never recorded."""
+        return self.operations.get(name, OpStats())
+
+    def reset(self) -> None:
+        """Discard every recorded count."""
+        self.operations.clear()
+
+    @contextmanager
+    def track(self, llist: LinkedList) -> Iterator['HopStats']:
+        """Count pointer hops in a list's operations for the duration of a block.
+
+        Every node is swapped to its counting class on entry and back on
+        exit, so each block costs O(n) time and memory on top of the
+        operations it records.
+
+        Time Complexity: O(n) to enter and to leave
+        Space Complexity: O(n) for the snapshot of the nodes
+
+        Args:
+            llist: The node-based list to instrument
+
+        Yields:
+            This HopStats object
+
+        Example:
+            >>> stats = HopStats()
+            >>> llist = MultiplePassLinkedList()
+            >>> llist.extend(range(10))
+            >>> with stats.track(llist):
+            ...     llist.find_middle()
+            5
+            >>> stats["find_middle[two_pass]"].hops
+            15
+        """
+        list_class = type(llist)
+        node_class = llist.node_class
+        own_node_class = "node_class" in vars(llist)
+        nodes = list(llist.iter_nodes())
+
+        for node in nodes:
+            node.__class__ = self._counting_node_class(type(node))
+        # A pooled list creates plain counting nodes while tracked
+        factory = node_class.node_class if isinstance(node_class, NodePool) else node_class
+        llist.node_class = self._counting_node_class(factory)
+        llist.__class__ = self._counting_list_class(list_class)
+        try:
+            yield self
+        finally:
+            llist.__class__ = list_class
+            if own_node_class:
+                llist.node_class = node_class
+            else:
+                del llist.node_class
+            # Nodes unlinked inside the block are restored as well
+            for node in itertools.chain(nodes, llist.iter_nodes()):
+                node.__class__ = self._original_class(type(node))
+
+    def _original_class(self, node_class: type) -> type:
+        """Map a counting node class back to the class it wraps."""
+        for original, counting in self._node_classes.items():
+            if counting is node_class:
+                return original
+        return node_class
+
+    def _counting_node_class(self, node_class: type) -> type:
+        """Return a subclass of node_class that counts reads into this object."""
+        if node_class in self._node_classes.values():
+            return node_class
+        counting = self._node_classes.get(node_class)
+        if counting is None:
+            counting = self._node_classes[node_class] = _make_counting_node(self, node_class)
+        return counting
+
+    def _counting_list_class(self, list_class: type) -> type:
+        """Return a subclass of list_class whose operations record their reads."""
+        counting = self._list_classes.get(list_class)
+        if counting is None:
+            namespace = {"__module__": list_class.__module__}
+            for name in OPERATIONS:
+                if hasattr(list_class, name):
+                    namespace[name] = self._recording(name, getattr(list_class, name))
+            counting = type(list_class.__name__, (list_class,), namespace)
+            self._list_classes[list_class] = counting
+        return counting
+
+    def _recording(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap an operation so each outermost call records its reads."""
+        signature = inspect.signature(func)
+        takes_method = "method" in signature.parameters
+
+        @functools.wraps(func)
+        def wrapper(llist, *args, **kwargs):
+            if self._depth:
+                return func(llist, *args, **kwargs)
+            key = name
+            if takes_method:
+                bound = signature.bind(llist, *args, **kwargs)
+                bound.apply_defaults()
+                key = f"{name}[{bound.arguments['method']}]"
+            hops, visits = self._hops, self._visits
+            self._depth += 1
+            try:
+                return func(llist, *args, **kwargs)
+            finally:
+                self._depth -= 1
+                stats = self.operations.get(key)
+                if stats is None:
+                    stats = self.operations[key] = OpStats()
+                stats.calls += 1
+                stats.hops += self._hops - hops
+                stats.visits += self._visits - visits
+        return wrapper
+
+    def __str__(self) -> str:
+        """Return a table of calls and average hops and visits per operation."""
+        lines = [f"{'operation':<28}{'calls':>8}{'hops/call':>12}{'visits/call':>13}"]
+        for name, stats in self.operations.items():
+            lines.append(f"{name:<28}{stats.calls:>8}{stats.hops_per_call:>12.1f}"
+                         f"{stats.visits_per_call:>13.1f}")
+        return "\n".join(lines)
+
+
+def _make_counting_node(stats: HopStats, node_class: type) -> type:
+    """Build a node_class subclass whose data and link reads count into stats.
+
+    Reads of prev count as hops too where node_class has it, since a
+    reversed DoublyLinkedList follows prev as its forward link.
+    """
+    def counted_link(name):
+        descriptor = getattr(node_class, name)
+
+        def get_link(node):
+            stats._hops += 1
+            return descriptor.__get__(node, node_class)
+
+        def set_link(node, value):
+            descriptor.__set__(node, value)
+
+        return property(get_link, set_link)
+
+    def get_data(node):
+        stats._visits += 1
+        return node_class.data.__get__(node, node_class)
+
+    def set_data(node, value):
+        node_class.data.__set__(node, value)
+
+    namespace = {
+        "__slots__": (),
+        "__module__": node_class.__module__,
+        "next": counted_link("next"),
+        "data": property(get_data, set_data),
+    }
+    if hasattr(node_class, "prev"):
+        namespace["prev"] = counted_link("prev")
+    return type(node_class.__name__, (node_class,), namespace)
+
+
+@contextmanager
+def track_hops(llist: LinkedList, stats: Optional[HopStats] = None) -> Iterator[HopStats]:
+    """Count pointer hops in a list's operations for the duration of a block.
+
+    Args:
+        llist: The node-based list to instrument
+        stats: Counters to add to, so several blocks or lists can share
+               one report. A new HopStats is created if omitted.
+
+    Yields:
+        The HopStats receiving the counts
+
+    Example:
+        >>> with track_hops(llist) as stats:
+        ...     llist.find_cycle_start(method="brent")
+        >>> stats["find_cycle_start[brent]"].hops_per_call
+    """
+    stats = HopStats() if stats is None else stats
+    with stats.track(llist):
+        yield stats
+
+
+# Example usage
+if __name__ == "__main__":
+    from .multiple_pass import MultiplePassLinkedList
+    from .slow_fast import SlowFastLinkedList
+
+    llist = MultiplePassLinkedList()
+    llist.extend(range(1000))
+    with track_hops(llist) as stats:
+        for method in ("two_pass", "slow_fast"):
+            llist._mutated()  # Invalidate the memoized result
+            llist.find_middle(method=method)
+        len(llist)
+        llist.delete_node(999)
+
+    cycle_list = SlowFastLinkedList()
+    cycle_list.extend(range(1000))
+    cycle_list.create_cycle(500)
+    with track_hops(cycle_list, stats):
+        for method in ("floyd", "brent"):
+            cycle_list._mutated()
+            cycle_list.find_cycle_start(method=method)
+    print(stats)
@@ -1,14 +1,23 @@
-from typing import Optional, Any
+import copy
+import io
+import reprlib
+import sys
+from typing import Optional, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, TextIO, Tuple
 
 
 class Node:
     """A node in a linked list.
     
+    Nodes use __slots__ instead of a per-instance __dict__, which makes each
+    node several times smaller. Arbitrary extra attributes cannot be set.
+    
     Attributes:
         data: The data stored in the node
         next: Reference to the next node, or None if this is the last node
     """
     
+    __slots__ = ('data', 'next')
+    
     def __init__(self, data: Any) -> None:
         """Initialize a new node.
         
@@ -19,6 +28,91 @@ class Node:
         self.next: Optional['Node'] = None
 
 
+class NodePool:
+    """A node factory that recycles unlinked nodes.
+    
+    Assign a pool as a list's node_class to enable it. New nodes are then
+    taken from the pool's free stack when one is available, and the
+    deletion methods hand the nodes they unlink back to the pool. A
+    workload that deletes and appends in bursts stops allocating, and so
+    stops triggering garbage collections, once the pool is warm. One pool
+    may be shared by several lists.
+    
+    Code that keeps references to nodes (for example from iter_nodes)
+    must not use them after the node is deleted, since it may be reused.
+    
+    Attributes:
+        node_class: The class of the nodes the pool creates
+        max_size: The most free nodes kept; further releases are dropped
+        allocated: The number of nodes created because the pool was empty
+    """
+    
+    def __init__(self, node_class: type = Node, max_size: int = 1024) -> None:
+        """Initialize an empty pool.
+        
+        Args:
+            node_class: The class of the nodes to create
+            max_size: The most free nodes to keep
+        """
+        self.node_class = node_class
+        self.max_size = max_size
+        self.allocated = 0
+        self._free: List[Node] = []
+    
+    def __call__(self, data: Any) -> Node:
+        """Return an unlinked node holding data, reusing a free node if any.
+        
+        Args:
+            data: The data to store in the node
+            
+        Returns:
+            A node whose next pointer is None
+        """
+        free = self._free
+        if free:
+            node = free.pop()
+            node.data = data
+            return node
+        self.allocated += 1
+        return self.node_class(data)
+    
+    def release(self, node: Node) -> None:
+        """Keep an unlinked node for reuse.
+        
+        The node's data and next pointer are cleared so the pool does not
+        keep other objects alive. Nodes of another class, or beyond
+        max_size, are left to the garbage collector.
+        
+        Args:
+            node: A node that is no longer linked into any list
+        """
+        if len(self._free) < self.max_size and type(node) is self.node_class:
+            node.data = None
+            node.next = None
+            self._free.append(node)
+    
+    def __len__(self) -> int:
+        """Return the number of free nodes in the pool."""
+        return len(self._free)
+    
+    def __reduce__(self) -> Tuple[type, Tuple[type, int]]:
+        """Pickle and copy as an empty pool with the same settings."""
+        return (self.__class__, (self.node_class, self.max_size))
+
+
+class CycleInfo(NamedTuple):
+    """Metadata describing a cycle in a linked list.
+    
+    Attributes:
+        start: The first node on the cycle
+        length: The number of nodes on the cycle (lambda)
+        tail_length: The number of nodes before the cycle starts (mu)
+    """
+    start: Node
+    length: int
+    tail_length: int
+
+
 class LinkedList:
     """A singly linked list implementation.
     
@@ -27,41 +121,208 @@ class LinkedList:
     
     Attributes:
         head: Reference to the first node, or None if the list is empty
+        tail: Reference to the last node, or None if the list is empty.
+              If a cycle has been created, this is the node whose next
+              pointer closes the cycle.
+        node_class: Class-level factory used to create nodes. Defaults to
+                    the slot-based Node; any class with data/next
+                    attributes and a one-argument constructor works, as
+                    does a NodePool to recycle deleted nodes.
+        debug: Class-level flag. When True, len() verifies the maintained
+               size counter against a real traversal of the list.
+        repr_limit: Class-level cap on the number of values shown by repr().
     """
     
+    node_class: type = Node
+    debug: bool = False
+    repr_limit: int = 10
+    
     def __init__(self) -> None:
         """Initialize an empty linked list."""
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self._size = 0
+        self._version = 0
+        self._cache: Dict[Any, Tuple[int, Any]] = {}
+        self._sentinel = Node(None)
 
     def append(self, data: Any) -> None:
         """Add a new node with the given data to the end of the list.
         
+        Uses the tail reference, so appending is O(1) rather than a walk
+        from the head. If the list has a cycle, the new node is spliced in
+        before the cycle's back-edge so the cycle is preserved.
+        
+        Time Complexity: O(1)
+        
         Args:
             data: The data to store in the new node
         """
-        new_node = Node(data)
+        new_node = self.node_class(data)
+        self._size += 1
+        self._mutated()
         if not self.head:
             self.head = new_node
+            self.tail = new_node
             return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
+        new_node.next = self.tail.next
+        self.tail.next = new_node
+        self.tail = new_node
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+        
+        The new nodes are linked in a single pass starting from the tail,
+        so extending by k items is O(k) regardless of the list length.
+        
+        Time Complexity: O(k)
+        
+        If the iterable raises, the items taken before the error stay
+        appended and the list remains consistent.
+        
+        Args:
+            iterable: The items to append, in order
+            
+        Example:
+            >>> llist = LinkedList()
+            >>> llist.extend([1, 2, 3])
+            >>> print(llist)
+            1 -> 2 -> 3 -> None
+        """
+        if iterable is self:
+            iterable = list(iterable)  # Snapshot before the list starts growing
+        last = self.tail
+        closing = last.next if last else None
+        added = 0
+        node_class = self.node_class
+        try:
+            for data in iterable:
+                new_node = node_class(data)
+                if last is None:
+                    self.head = new_node
+                else:
+                    last.next = new_node
+                last = new_node
+                added += 1
+        finally:
+            # Commit the nodes linked so far, even if the iterable raised
+            self._size += added
+            self._mutated()
+            if last is not self.tail:
+                last.next = closing
+                self.tail = last
 
     def print_list(self) -> None:
-        """Print the list in a readable format (data -> data -> ... -> None)."""
+        """Print the list in a readable format (data -> data -> ... -> None).
+        
+        If the list has a cycle, each node is printed once and the line ends
+        with a marker naming the node the cycle returns to. The output is
+        streamed to stdout with write_to.
+        """
+        self.write_to(sys.stdout)
+        sys.stdout.write("\n")
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Lazily yield the data of each node, from head to tail.
+        
+        On a list with a cycle each node is visited once.
+        
+        Yields:
+            The data stored in each node
+        """
+        for node in self.iter_nodes():
+            yield node.data
+    
+    def iter_nodes(self) -> Iterator[Node]:
+        """Lazily yield each distinct node once, from head to the end or cycle close.
+        
+        Cycle detection only runs when the tail's next pointer is set, so
+        on an acyclic list the first node is yielded in O(1).
+        
+        Yields:
+            The nodes of the list in order
+        """
+        cycle = self._open_cycle_info()
         current = self.head
+        if cycle:
+            for _ in range(cycle.tail_length + cycle.length):
+                yield current
+                current = current.next
+            return
         while current:
-            print(current.data, end=" -> ")
+            yield current
             current = current.next
-        print("None")
+    
+    def write_to(self, fp: TextIO, chunk_size: int = 1024) -> int:
+        """Stream the "data -> data -> ... -> None" rendering to a file object.
+        
+        At most chunk_size node strings are held in memory at once; each
+        chunk is joined and passed to fp.write in a single call.
+        
+        Args:
+            fp: A text file object with a write method
+            chunk_size: The number of nodes rendered per write call
+            
+        Returns:
+            The number of characters written
+            
+        Raises:
+            ValueError: If chunk_size is less than 1
+            
+        Example:
+            >>> llist = LinkedList()
+            >>> llist.extend([1, 2, 3])
+            >>> _ = llist.write_to(sys.stdout)
+            1 -> 2 -> 3 -> None
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        written = 0
+        chunk = []
+        for data in self:
+            chunk.append(str(data))
+            if len(chunk) == chunk_size:
+                chunk.append("")
+                written += fp.write(" -> ".join(chunk))
+                chunk = []
+        chunk.append(self._end_marker())
+        written += fp.write(" -> ".join(chunk))
+        return written
     
     def __len__(self) -> int:
         """Return the number of nodes in the list.
         
+        The size is a counter maintained by every mutator, so this is O(1).
+        When LinkedList.debug is set, the counter is checked against
+        _count_nodes() first.
+        
+        Time Complexity: O(1)
+        
         Returns:
-            The count of nodes in the list
+            The count of distinct nodes in the list, even if it has a cycle
+            
+        Raises:
+            AssertionError: If debug is enabled and the counter is out of sync
         """
+        if self.debug:
+            counted = self._count_nodes()
+            assert counted == self._size, (
+                f"size counter is {self._size} but traversal found {counted} nodes"
+            )
+        return self._size
+    
+    def _count_nodes(self) -> int:
+        """Count the distinct nodes by traversal.
+        
+        For a list with a cycle the count is tail length plus cycle length,
+        so the traversal always terminates.
+        
+        Returns:
+            The number of nodes found by traversal
+        """
+        cycle = self._cycle_info()
+        if cycle:
+            return cycle.tail_length + cycle.length
         count = 0
         current = self.head
         while current:
@@ -72,16 +333,265 @@ class LinkedList:
     def __str__(self) -> str:
         """Return a string representation of the list.
         
+        Time Complexity: O(n)
+        
         Returns:
-            A string in the format "data -> data -> ... -> None"
+            A string in the format "data -> data -> ... -> None". If the list
+            has a cycle, each node appears once and "None" is replaced by
+            "(cycle back to data)".
         """
-        if not self.head:
-            return "None"
+        buffer = io.StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+    
+    def __repr__(self) -> str:
+        """Return a bounded debugging representation of the list.
         
-        result = []
-        current = self.head
-        while current:
-            result.append(str(current.data))
-            current = current.next
-        result.append("None")
-        return " -> ".join(result)
+        At most repr_limit values are shown, and each value is abbreviated
+        with reprlib, so the result stays short however long the list is.
+        
+        Returns:
+            A string like "LinkedList([1, 2, 3, ...], len=1000)"
+        """
+        values = []
+        for data in self:
+            if len(values) == self.repr_limit:
+                values.append("...")
+                break
+            values.append(reprlib.repr(data))
+        parts = [f"[{', '.join(values)}]", f"len={self._size}"]
+        cycle = self._open_cycle_info()
+        if cycle:
+            parts.append(f"cycle_pos={cycle.tail_length}")
+        return f"{self.__class__.__name__}({', '.join(parts)})"
+    
+    def __reduce__(self) -> Tuple[type, Tuple[()], Dict[str, Any]]:
+        """Support pickling by flattening the list into a sequence of values.
+        
+        The default pickle protocol would recurse through each node's next
+        pointer and hit the recursion limit on lists longer than about a
+        thousand nodes. This state is built and restored iteratively in
+        linear time, and a cycle is recorded by its start position.
+        
+        Returns:
+            The class, empty constructor arguments and the flat state
+        """
+        return (self.__class__, (), self.__getstate__())
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the list as a flat, picklable state.
+        
+        Returns:
+            A dict with the node values in order, the position the cycle
+            returns to (or None), and any public instance settings such as
+            track_middle
+        """
+        cycle = self._cycle_info()
+        return {
+            "values": list(self),
+            "cycle_pos": cycle.tail_length if cycle else None,
+            "attrs": {name: value for name, value in vars(self).items()
+                      if not name.startswith("_") and name not in ("head", "tail")},
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the list from the state produced by __getstate__.
+        
+        Args:
+            state: The flat state to restore into this (empty) list
+        """
+        for name, value in state["attrs"].items():
+            setattr(self, name, value)
+        self.extend(state["values"])
+        if state["cycle_pos"] is not None:
+            cycle_node = self.head
+            for _ in range(state["cycle_pos"]):
+                cycle_node = cycle_node.next
+            self.tail.next = cycle_node
+            self._mutated()
+    
+    def __copy__(self) -> 'LinkedList':
+        """Return a shallow copy: new nodes holding the same data objects.
+        
+        Returns:
+            A list of the same class with the same values and cycle
+        """
+        new = self.__class__()
+        new.__setstate__(self.__getstate__())
+        return new
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'LinkedList':
+        """Return a deep copy, built iteratively from the flat state.
+        
+        Args:
+            memo: The copy module's memo of already copied objects
+            
+        Returns:
+            A list of the same class with deep copies of the values
+        """
+        new = self.__class__()
+        memo[id(self)] = new
+        new.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return new
+    
+    def _slow_fast_middle(self) -> Optional[Node]:
+        """Find the middle node in a single pass with slow and fast pointers.
+        
+        The fast pointer moves two nodes for every one of the slow pointer,
+        so when fast reaches the end, slow is at position len // 2. If the
+        pointers meet the list has a cycle, and the middle of its distinct
+        nodes is found by walking len // 2 nodes instead.
+        
+        Returns:
+            The middle node, or None if the list is empty
+        """
+        slow = fast = self.head
+        while fast and fast.next:
+            slow = slow.next
+            fast = fast.next.next
+            if fast is slow:
+                slow = self.head
+                for _ in range(self._size // 2):
+                    slow = slow.next
+                break
+        return slow
+    
+    def _temporary_head(self) -> Node:
+        """Return the list's reusable dummy node, linked to the head.
+        
+        Deletion and reversal use a temporary head so the first node needs
+        no special case. Reusing one sentinel per list avoids allocating a
+        throwaway node on every call. Callers set its next back to None
+        when done, so the sentinel never keeps deleted or recycled nodes
+        reachable.
+        """
+        sentinel = self._sentinel
+        sentinel.next = self.head
+        return sentinel
+    
+    def _take_nodes(self) -> Tuple[Optional[Node], Optional[Node], int]:
+        """Empty the list and hand over its chain of nodes, links intact.
+        
+        The caller becomes responsible for the nodes. Subclasses also reset
+        any state that refers to them.
+        
+        Returns:
+            The former head, tail and size
+        """
+        taken = (self.head, self.tail, self._size)
+        self.head = self.tail = None
+        self._size = 0
+        self._mutated()
+        return taken
+    
+    def _recycle(self, node: Node) -> None:
+        """Hand an unlinked node back to the list's NodePool, if it uses one."""
+        pool = self.node_class
+        if isinstance(pool, NodePool):
+            pool.release(node)
+    
+    def _end_marker(self) -> str:
+        """Return the text rendered after the last node."""
+        cycle = self._open_cycle_info()
+        if cycle:
+            return f"(cycle back to {cycle.start.data})"
+        return "None"
+    
+    @property
+    def version(self) -> int:
+        """The mutation version, incremented by every mutator.
+        
+        Query results are cached against this number. Code that relinks
+        nodes by hand instead of using the list's methods must call
+        _mutated() afterwards, or cached answers will be stale.
+        """
+        return self._version
+    
+    def _mutated(self) -> None:
+        """Record a structural change. Every mutator must call this."""
+        self._version += 1
+    
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return a query result memoized against the mutation version.
+        
+        Args:
+            key: Identifies the query (and its arguments)
+            compute: Computes the result when there is no current entry
+            
+        Returns:
+            The cached result if the list has not changed since it was
+            computed, otherwise the freshly computed result
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == self._version:
+            return entry[1]
+        value = compute()
+        self._cache[key] = (self._version, value)
+        return value
+    
+    def _cycle_info(self) -> Optional[CycleInfo]:
+        """Return the list's cycle metadata, detecting it on first use.
+        
+        The result is cached until the next mutation, so repeated
+        traversals do not rerun detection.
+        
+        Returns:
+            A CycleInfo(start, length, tail_length), or None if no cycle exists.
+        """
+        return self._cached("cycle", self._brent)
+    
+    def _open_cycle_info(self) -> Optional[CycleInfo]:
+        """Return _cycle_info(), or None at once if the tail ends the list.
+        
+        Every mutator keeps tail current, so a tail whose next pointer is
+        None proves the list is acyclic without a detection pass. A missing
+        tail proves nothing (it may have been cleared by hand), so the
+        list is then checked in full.
+        """
+        tail = self.tail
+        if tail is not None and tail.next is None:
+            return None
+        return self._cycle_info()
+    
+    def _brent(self) -> Optional[CycleInfo]:
+        """Detect a cycle with Brent's algorithm in O(1) extra memory.
+        
+        The hare moves one step at a time and the tortoise teleports to the
+        hare whenever the number of steps reaches the next power of two.
+        When they meet, the steps since the last teleport give the cycle
+        length directly. The start is then found by giving one pointer a
+        head start of length nodes and advancing both together.
+        
+        Returns:
+            A CycleInfo(start, length, tail_length), or None if no cycle exists.
+        """
+        if not self.head:
+            return None
+
+        # Phase 1: Find the cycle length
+        power = 1
+        tortoise = hare = self.head
+        while True:
+            for length in range(1, power + 1):
+                hare = hare.next
+                if hare is None:
+                    return None
+                if hare is tortoise:
+                    break
+            else:
+                tortoise = hare
+                power *= 2
+                continue
+            break
+
+        # Phase 2: Find the cycle start
+        tortoise = hare = self.head
+        for _ in range(length):
+            hare = hare.next
+        tail_length = 0
+        while tortoise is not hare:
+            tortoise = tortoise.next
+            hare = hare.next
+            tail_length += 1
+
+        return CycleInfo(tortoise, length, tail_length)
@@ -0,0 +1,137 @@
+from typing import Optional, Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only this module needs it
+    np = None
+
+from .array_linked_list import ArrayLinkedList, NIL
+
+
+def _require_numpy() -> None:
+    """Raise ImportError if NumPy is not installed."""
+    if np is None:
+        raise ImportError(
+            "list ranking requires NumPy; install it with 'pip install numpy'"
+        )
+
+
+def pointer_jump(next_indices) -> "np.ndarray":
+    """Compute each slot's distance to the end of its chain (Wyllie's algorithm).
+
+    Every slot starts with a distance of 1 to its successor (0 if it has
+    none). In each round, all slots simultaneously add their successor's
+    distance and jump their successor pointer to the successor's successor.
+    The chains halve in length every round, so the loop finishes after
+    O(log n) vectorized rounds.
+
+    Args:
+        next_indices: Next index for each slot, NIL (-1) for the end of a
+                      chain. Must not contain cycles.
+
+    Returns:
+        An int64 array where entry i is the number of hops from slot i to
+        the last node of its chain
+
+    Example:
+        >>> pointer_jump([1, 2, -1]).tolist()
+        [2, 1, 0]
+    """
+    _require_numpy()
+    succ = np.array(next_indices, dtype=np.int64)
+    dist = (succ != NIL).astype(np.int64)
+
+    active = np.flatnonzero(succ != NIL)
+    while active.size:
+        targets = succ[active]
+        dist[active] += dist[targets]
+        succ[active] = succ[targets]
+        active = active[succ[active] != NIL]
+    return dist
+
+
+def list_ranks(llist: ArrayLinkedList) -> "np.ndarray":
+    """Compute every slot's position from the head of an ArrayLinkedList.
+
+    A cycle created with create_cycle is cut at the tail first, and slots
+    on the free list are excluded, so the result is well defined for any
+    list state.
+
+    Args:
+        llist: The list to rank
+
+    Returns:
+        An int64 array indexed by slot, holding the 0-based position of that
+        node from the head, or -1 for slots that are not in the list
+    """
+    _require_numpy()
+    next_indices = np.frombuffer(llist.next, dtype=np.int64).copy()
+    if llist.tail != NIL:
+        next_indices[llist.tail] = NIL
+
+    free = []
+    slot = llist._free
+    while slot != NIL:
+        free.append(slot)
+        slot = llist.next[slot]
+    next_indices[free] = NIL
+
+    ranks = (len(llist) - 1) - pointer_jump(next_indices)
+    ranks[free] = -1
+    return ranks
+
+
+def list_order(llist: ArrayLinkedList) -> "np.ndarray":
+    """Return the slots of an ArrayLinkedList in list order.
+
+    This inverts list_ranks with a single scatter, so entry k is the slot
+    of the node at position k. Computing it once turns any number of later
+    positional lookups into plain array indexing.
+
+    Args:
+        llist: The list to order
+
+    Returns:
+        An int64 array of length len(llist) holding slot indices
+    """
+    ranks = list_ranks(llist)
+    in_list = np.flatnonzero(ranks >= 0)
+    order = np.empty(len(llist), dtype=np.int64)
+    order[ranks[in_list]] = in_list
+    return order
+
+
+def kth_element(llist: ArrayLinkedList, k: int) -> Any:
+    """Return the data of the node at position k using list ranking.
+
+    Args:
+        llist: The list to index
+        k: The 0-based position from the head
+
+    Returns:
+        The data stored at position k
+
+    Raises:
+        IndexError: If k is not a valid position
+    """
+    if not 0 <= k < len(llist):
+        raise IndexError("list index out of range")
+    slot = np.flatnonzero(list_ranks(llist) == k)[0]
+    return llist.data[slot]
+
+
+def find_middle(llist: ArrayLinkedList) -> Optional[Any]:
+    """Find the middle element using list ranking instead of a pointer walk.
+
+    Uses the same position as MultiplePassLinkedList.find_middle: for
+    even-length lists, returns the second middle element.
+
+    Args:
+        llist: The list to search
+
+    Returns:
+        The data of the middle node, or None if the list is empty
+    """
+    if not len(llist):
+        return None
+    return kth_element(llist, len(llist) // 2)
@@ -1,5 +1,7 @@
-from typing import Optional, Any
-from .linked_list_base import LinkedList
+from typing import Optional, Any, Iterable, Tuple
+from .linked_list_base import LinkedList, Node
+
+MIDDLE_METHODS = ("two_pass", "slow_fast")
 
 
 class MultiplePassLinkedList(LinkedList):
@@ -9,23 +11,137 @@ class MultiplePassLinkedList(LinkedList):
     element of a linked list. It uses two passes: first to count nodes, then
     to traverse to the middle position.
     
-    Time Complexity: O(n)
+    With track_middle=True the list also keeps a pointer to the middle node,
+    updated in O(1) by append and delete_node, so find_middle is O(1).
+    
+    Time Complexity: O(n), O(1) for repeated calls on an unchanged list
+                     or with track_middle enabled
     Space Complexity: O(1)
     """
     
-    def find_middle(self) -> Optional[Any]:
+    def __init__(self, track_middle: bool = False) -> None:
+        """Initialize an empty list.
+        
+        Args:
+            track_middle: Maintain a middle-node pointer incrementally
+        """
+        super().__init__()
+        self.track_middle = track_middle
+        self._middle: Optional[Node] = None
+    
+    def append(self, data: Any) -> None:
+        """Add a new node with the given data to the end of the list.
+        
+        With track_middle enabled, the middle pointer moves one node forward
+        whenever the new length is even.
+        
+        Args:
+            data: The data to store in the new node
+        """
+        super().append(data)
+        if self.track_middle:
+            if self._middle is None:
+                self._middle = self.head
+            elif self._size % 2 == 0:
+                self._middle = self._middle.next
+    
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+        
+        With track_middle enabled, the middle pointer is advanced once for
+        the whole batch.
+        
+        Args:
+            iterable: The items to append, in order
+        """
+        old_size = self._size
+        try:
+            super().extend(iterable)
+        finally:
+            # Items appended before an error still move the middle
+            if self.track_middle and self._size != old_size:
+                if self._middle is None:
+                    self._middle = self.head
+                for _ in range(self._size // 2 - old_size // 2):
+                    self._middle = self._middle.next
+    
+    def delete_node(self, value: Any) -> bool:
+        """Delete the first occurrence of a node with the given value.
+        
+        Uses a dummy node as in TemporaryHeadLinkedList.delete_node. With
+        track_middle enabled, the scan also remembers the node just before
+        the middle, so the middle pointer can be fixed in O(1) whether the
+        deleted node was before, at or after the middle.
+        
+        Args:
+            value: The value to search for and delete
+            
+        Returns:
+            True if the node was found and deleted, False otherwise
+        """
+        dummy = self._temporary_head()  # Reuse the list's temporary head node
+        prev, current = dummy, self.head
+        index = 0
+        middle_index = self._size // 2
+        before_middle = None
+
+        while current:
+            if current.data == value:
+                prev.next = current.next
+                self.head = dummy.next  # Update in case head was deleted
+                dummy.next = None  # Unlink the temporary head again
+                if current is self.tail:
+                    self.tail = prev if prev is not dummy else None
+                if self.track_middle:
+                    if self._size % 2:
+                        # Odd length: the middle index stays the same
+                        if index <= middle_index:
+                            self._middle = self._middle.next
+                    elif index >= middle_index:
+                        # Even length: the middle index moves back by one
+                        self._middle = before_middle if index > middle_index else prev
+                self._size -= 1
+                self._mutated()
+                self._recycle(current)
+                return True
+            if index == middle_index - 1:
+                before_middle = current
+            prev, current = current, current.next
+            index += 1
+
+        dummy.next = None
+        return False
+    
+    def _take_nodes(self) -> Tuple[Optional[Node], Optional[Node], int]:
+        """Empty the list as LinkedList._take_nodes and drop the middle pointer."""
+        self._middle = None
+        return super()._take_nodes()
+    
+    def find_middle(self, method: str = "two_pass") -> Optional[Any]:
         """Find the middle element using the multiple-pass technique.
         
+        The result is memoized against the list's mutation version, so
+        repeated calls between writes answer in O(1). With track_middle
+        enabled the maintained middle pointer is returned directly.
+        
         This method makes two passes through the list:
         1. First pass: Count the total number of nodes
         2. Second pass: Traverse to the middle position
         
-        For even-length lists, returns the first middle element.
-        For example, in a list [1, 2, 3, 4], returns 2.
+        The middle is the node at position len // 2, so for even-length
+        lists the second middle element is returned.
+        For example, in a list [1, 2, 3, 4], returns 3.
+        
+        Args:
+            method: "two_pass" (default) or "slow_fast", which finds the
+                    same node in a single pass with slow and fast pointers
         
         Returns:
             The data of the middle node, or None if the list is empty
             
+        Raises:
+            ValueError: If method is not one of MIDDLE_METHODS
+            
         Example:
             >>> llist = MultiplePassLinkedList()
             >>> for i in range(1, 6):
@@ -33,6 +149,23 @@ class MultiplePassLinkedList(LinkedList):
             >>> llist.find_middle()
             3
         """
+        if method not in MIDDLE_METHODS:
+            raise ValueError(
+                f"unknown find_middle method {method!r}; expected one of {MIDDLE_METHODS}"
+            )
+        if self.track_middle:
+            return self._middle.data if self._middle else None
+        if method == "slow_fast":
+            return self._cached(("find_middle", method), self._find_middle_slow_fast)
+        return self._cached("find_middle", self._find_middle_two_pass)
+
+    def _find_middle_slow_fast(self) -> Optional[Any]:
+        """Find the middle in one pass without consulting the cache."""
+        middle = self._slow_fast_middle()
+        return middle.data if middle else None
+
+    def _find_middle_two_pass(self) -> Optional[Any]:
+        """Run the two passes of find_middle without consulting the cache."""
         if not self.head:
             return None
 
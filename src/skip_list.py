@@ -0,0 +1,326 @@
+import operator
+import random
+from typing import Optional, Any, Iterable, List, Sequence, Tuple
+from .linked_list_base import LinkedList, Node
+
+# The most express lanes above the node chain; enough for 2^32 nodes
+MAX_LEVEL = 32
+
+
+class SkipNode(Node):
+    """A node with width-annotated express lanes above its next pointer.
+
+    Attributes:
+        data: The data stored in the node
+        next: Reference to the next node, or None if this is the last node
+        lanes: For each express level, the next node that reaches it
+        widths: For each express level, how many positions that link skips
+    """
+
+    __slots__ = ('lanes', 'widths')
+
+    def __init__(self, data: Any) -> None:
+        """Initialize a new node with no express lanes.
+
+        Args:
+            data: The data to store in this node
+        """
+        # Set every slot here rather than calling Node.__init__, which
+        # is a measurable share of extend's time
+        self.data = data
+        self.next: Optional['SkipNode'] = None
+        # Most nodes have no lanes; they share one empty tuple, which
+        # delete_at restores before a node goes back to a NodePool
+        self.lanes: Sequence[Optional['SkipNode']] = ()
+        self.widths: Sequence[int] = ()
+
+
+class SkipLinkedList(LinkedList):
+    """A linked list with an indexable skip-list layer for positional access.
+
+    The nodes form the ordinary singly linked chain, so iteration, printing
+    and every LinkedList traversal work unchanged. Each node also reaches a
+    random number of express lanes (one more with probability 1/2), and
+    each lane link records its width, the number of positions it skips. A
+    search for position i runs down the lanes from the top, summing widths,
+    so llist[i], insert, delete_at and find_middle take O(log n) expected
+    time instead of a walk from the head.
+
+    The list's reusable temporary head is the header of every lane, so
+    inserting and deleting at position 0 need no special case.
+
+    Time Complexity: O(log n) expected for indexing, insert, delete_at and
+                     find_middle, O(1) amortized extend per item
+    Space Complexity: O(1) expected lane links per node
+    """
+
+    node_class: type = SkipNode
+
+    def __init__(self) -> None:
+        """Initialize an empty list with no express lanes."""
+        super().__init__()
+        self._sentinel = self._header = SkipNode(None)
+        self._header.lanes, self._header.widths = [], []
+        self._random = random.Random()
+
+    def append(self, data: Any) -> None:
+        """Add a new node with the given data to the end of the list.
+
+        Time Complexity: O(log n) expected
+
+        Args:
+            data: The data to store in the new node
+        """
+        self.insert(self._size, data)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+
+        The last node on each lane is found once, and then each new node
+        is linked behind it in O(1) expected time. If the iterable raises,
+        the items taken before the error stay appended.
+
+        Args:
+            iterable: The items to append, in order
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        header = self._temporary_head()
+        update, positions, prev = self._locate(self._size)
+        position = self._size
+        node_class = self.node_class
+        getrandbits, top = self._random.getrandbits, 1 << MAX_LEVEL
+        try:
+            for data in iterable:
+                node = node_class(data)
+                prev.next = prev = node
+                bits = getrandbits(MAX_LEVEL) | top
+                levels = (bits & -bits).bit_length() - 1
+                if levels:
+                    node.lanes = [None] * levels
+                    node.widths = [0] * levels
+                    if levels > len(update):
+                        self._add_levels(levels, update, positions)
+                    for level in range(levels):
+                        update[level].lanes[level] = node
+                        update[level].widths[level] = position - positions[level]
+                        update[level], positions[level] = node, position
+                position += 1
+        finally:
+            # Commit the nodes linked so far, even if the iterable raised
+            if prev is not header:
+                self.tail = prev
+            self.head = header.next
+            self._size = position
+            self._mutated()
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the value at a position, counting from the end if negative.
+
+        Time Complexity: O(log n) expected
+
+        Args:
+            index: The position, as for a Python list
+
+        Returns:
+            The value at that position
+
+        Raises:
+            IndexError: If the position is out of range
+
+        Example:
+            >>> llist = SkipLinkedList()
+            >>> llist.extend("abcde")
+            >>> llist[3], llist[-1]
+            ('d', 'e')
+        """
+        index = self._check_index(index)
+        return self._locate(index + 1)[2].data
+
+    def insert(self, index: int, data: Any) -> None:
+        """Insert a value before a position, as list.insert does.
+
+        Negative positions count from the end, and positions past either
+        end insert at that end.
+
+        Time Complexity: O(log n) expected
+
+        Args:
+            index: The position the new value will have
+            data: The data to store in the new node
+
+        Example:
+            >>> llist = SkipLinkedList()
+            >>> llist.extend([1, 3])
+            >>> llist.insert(1, 2)
+            >>> print(llist)
+            1 -> 2 -> 3 -> None
+        """
+        index = operator.index(index)
+        if index < 0:
+            index = max(index + self._size, 0)
+        index = min(index, self._size)
+
+        header = self._temporary_head()
+        update, positions, prev = self._locate(index)
+        node = self.node_class(data)
+        levels = self._random_level()
+        if levels:
+            node.lanes = [None] * levels
+            node.widths = [0] * levels
+            if levels > len(update):
+                self._add_levels(levels, update, positions)
+        node.next = prev.next
+        prev.next = node
+        if node.next is None:
+            self.tail = node
+        for level in range(len(update)):
+            before = update[level]
+            if level < len(node.lanes):
+                # Split the link that spans the new position in two
+                skipped = index - positions[level]
+                node.lanes[level] = before.lanes[level]
+                node.widths[level] = before.widths[level] - skipped + 1
+                before.lanes[level] = node
+                before.widths[level] = skipped
+            else:
+                before.widths[level] += 1
+        self.head = header.next
+        self._size += 1
+        self._mutated()
+
+    def delete_at(self, index: int) -> Any:
+        """Remove and return the value at a position.
+
+        Time Complexity: O(log n) expected
+
+        Args:
+            index: The position, counting from the end if negative
+
+        Returns:
+            The value that was removed
+
+        Raises:
+            IndexError: If the position is out of range
+
+        Example:
+            >>> llist = SkipLinkedList()
+            >>> llist.extend([1, 2, 3])
+            >>> llist.delete_at(0)
+            1
+        """
+        index = self._check_index(index)
+        header = self._temporary_head()
+        update, _, prev = self._locate(index)
+        node = prev.next
+        for level in range(len(update)):
+            before = update[level]
+            if before.lanes[level] is node:
+                before.lanes[level] = node.lanes[level]
+                before.widths[level] += node.widths[level] - 1
+            else:
+                before.widths[level] -= 1
+        prev.next = node.next
+        if node is self.tail:
+            self.tail = prev if prev is not header else None
+        while header.lanes and header.lanes[-1] is None:
+            header.lanes.pop()
+            header.widths.pop()
+        self.head = header.next
+        self._size -= 1
+        self._mutated()
+        data = node.data
+        node.lanes = node.widths = ()
+        self._recycle(node)
+        return data
+
+    def find_middle(self) -> Optional[Any]:
+        """Find the middle element through the express lanes.
+
+        Returns the value at position len // 2, as the other list classes
+        do, without walking half the list.
+
+        Time Complexity: O(log n) expected
+
+        Returns:
+            The data of the middle node, or None if the list is empty
+        """
+        if not self._size:
+            return None
+        return self[self._size // 2]
+
+    def _check_index(self, index: int) -> int:
+        """Return index as a non-negative position, or raise IndexError."""
+        index = operator.index(index)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+        return index
+
+    def _locate(self, index: int) -> Tuple[List[SkipNode], List[int], SkipNode]:
+        """Find the nodes before a position on every lane.
+
+        Args:
+            index: A position from 0 to len
+
+        Returns:
+            For each express level, the last node before index and its
+            position (-1 for the header), then the node at index - 1 on
+            the chain itself (the header for index 0)
+        """
+        node = self._temporary_head()
+        position = -1
+        levels = len(node.lanes)
+        update: List[SkipNode] = [node] * levels
+        positions = [-1] * levels
+        for level in reversed(range(levels)):
+            while True:
+                following = node.lanes[level]
+                if following is None or position + node.widths[level] >= index:
+                    break
+                position += node.widths[level]
+                node = following
+            update[level], positions[level] = node, position
+        for _ in range(index - 1 - position):
+            node = node.next
+        return update, positions, node
+
+    def _random_level(self) -> int:
+        """Return a node's number of express lanes: k with probability 2^-(k+1)."""
+        bits = self._random.getrandbits(MAX_LEVEL) | 1 << MAX_LEVEL
+        return (bits & -bits).bit_length() - 1  # Trailing zero bits
+
+    def _add_levels(self, levels: int, update: List[SkipNode], positions: List[int]) -> None:
+        """Raise the header to the given number of lanes.
+
+        The new lanes start empty at the header, so update and positions
+        grow with them.
+        """
+        header = self._header
+        while len(header.lanes) < levels:
+            header.lanes.append(None)
+            header.widths.append(0)
+            update.append(header)
+            positions.append(-1)
+
+    def _take_nodes(self) -> Tuple[Optional[Node], Optional[Node], int]:
+        """Empty the list as LinkedList._take_nodes and drop the express lanes."""
+        self._header.lanes.clear()
+        self._header.widths.clear()
+        return super()._take_nodes()
+
+# Example usage
+if __name__ == "__main__":
+    # Quick validation of functionality
+    llist = SkipLinkedList()
+    llist.extend(range(10))
+    print(f"List: {llist}")
+    print(f"llist[7] = {llist[7]}, llist[-1] = {llist[-1]}, Middle: {llist.find_middle()}")
+
+    llist.insert(0, "first")
+    llist.insert(5, "fifth")
+    print(f"Insert at 0 and 5: {llist}")
+
+    print(f"delete_at(5) = {llist.delete_at(5)}, delete_at(-1) = {llist.delete_at(-1)}")
+    print(f"List: {llist}, Middle: {llist.find_middle()}")
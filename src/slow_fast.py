@@ -1,5 +1,10 @@
-from typing import Optional, Any
-from .linked_list_base import LinkedList
+from collections import deque
+from collections.abc import Sequence, Sized
+from itertools import islice
+from typing import Optional, Any, Iterable, List, Tuple
+from .linked_list_base import LinkedList, Node, CycleInfo
+
+CYCLE_METHODS = ("floyd", "brent")
 
 
 class SlowFastLinkedList(LinkedList):
@@ -7,12 +12,39 @@ class SlowFastLinkedList(LinkedList):
     
     This class demonstrates Floyd's cycle detection algorithm (also known as the
     "tortoise and hare" algorithm) for detecting cycles in linked lists and
-    finding the start of the cycle.
+    finding the start of the cycle. Brent's algorithm is available as an
+    alternative engine.
     
     Time Complexity: O(n)
     Space Complexity: O(1)
     """
     
+    def find_middle(self) -> Optional[Any]:
+        """Find the middle element in a single pass with slow and fast pointers.
+        
+        The slow pointer moves one node while the fast pointer moves two, so
+        when fast runs off the end, slow is at the middle. This returns the
+        same node as MultiplePassLinkedList.find_middle (position len // 2)
+        without a separate counting pass. It also works on a cyclic list,
+        where it returns the middle of the distinct nodes.
+        
+        Returns:
+            The data of the middle node, or None if the list is empty
+            
+        Example:
+            >>> llist = SlowFastLinkedList()
+            >>> for i in range(1, 6):
+            ...     llist.append(i)
+            >>> llist.find_middle()
+            3
+        """
+        return self._cached("find_middle", self._find_middle_slow_fast)
+
+    def _find_middle_slow_fast(self) -> Optional[Any]:
+        """Run find_middle's single pass without consulting the cache."""
+        middle = self._slow_fast_middle()
+        return middle.data if middle else None
+
     def create_cycle(self, pos: int) -> bool:
         """Create a cycle by connecting the last node to the node at given position.
         
@@ -33,41 +65,45 @@ class SlowFastLinkedList(LinkedList):
             >>> llist.create_cycle(1)  # Creates cycle: 5 -> 2
             True
         """
-        if pos < 0:
+        if pos < 0 or not self.head:
             return False
-            
-        cycle_node = None
-        current = self.head
-        count = 0
-        last = None
-
-        # Find the node at position and last node
-        while current:
-            if count == pos:
-                cycle_node = current
-            last = current
-            current = current.next
-            count += 1
+
+        # Walk to the node at position, stopping if we pass the tail
+        cycle_node = self.head
+        for _ in range(pos):
+            if cycle_node is self.tail:
+                return False
+            cycle_node = cycle_node.next
 
         # Connect last node to cycle_node
-        if last and cycle_node:
-            last.next = cycle_node
-            return True
-        return False
+        self.tail.next = cycle_node
+        self._mutated()
+        return True
 
-    def find_cycle_start(self) -> Optional[Any]:
-        """Find the start of a cycle using Floyd's cycle detection algorithm.
+    def find_cycle_start(self, method: str = "floyd") -> Optional[Any]:
+        """Find the start of a cycle using Floyd's or Brent's algorithm.
         
-        This method implements the slow-fast pointer technique (Floyd's algorithm)
-        to detect if there's a cycle in the linked list and find where it starts.
+        With the default method, this implements the slow-fast pointer
+        technique (Floyd's algorithm) to detect if there's a cycle in the
+        linked list and find where it starts.
         
         The algorithm works in two phases:
         1. Detection: Use slow (1 step) and fast (2 steps) pointers to detect a cycle
         2. Finding start: Reset slow to head, move both at same speed until they meet
         
+        The result is memoized against the list's mutation version, so
+        repeated calls between writes answer in O(1).
+        
+        Args:
+            method: "floyd" (default) or "brent". Brent's algorithm finds
+                    the same node with fewer pointer moves in practice.
+        
         Returns:
             The data of the node where the cycle starts, or None if no cycle exists.
             
+        Raises:
+            ValueError: If method is not one of CYCLE_METHODS
+            
         Example:
             >>> llist = SlowFastLinkedList()
             >>> for i in range(1, 6):
@@ -75,21 +111,22 @@ class SlowFastLinkedList(LinkedList):
             >>> llist.create_cycle(1)  # Cycle starts at position 1 (value 2)
             >>> llist.find_cycle_start()
             2
+            >>> llist.find_cycle_start(method="brent")
+            2
         """
-        if not self.head or not self.head.next:
-            return None
+        self._check_method(method)
+        return self._cached(("find_cycle_start", method),
+                            lambda: self._find_cycle_start(method))
 
-        # Phase 1: Detect cycle using slow and fast pointers
-        slow = self.head
-        fast = self.head
+    def _find_cycle_start(self, method: str) -> Optional[Any]:
+        """Run find_cycle_start's algorithm without consulting the cache."""
+        if method == "brent":
+            info = self._cycle_info()
+            return info.start.data if info else None
 
-        # Move slow by 1, fast by 2 until they meet or reach end
-        while fast and fast.next:
-            slow = slow.next           # Moves one step
-            fast = fast.next.next      # Moves two steps
-            if slow == fast:          # Cycle detected
-                break
-        else:
+        # Phase 1: Detect cycle using slow and fast pointers
+        fast = self._floyd_meeting_point()
+        if fast is None:
             return None  # No cycle if fast reaches end
 
         # Phase 2: Find cycle start
@@ -101,6 +138,215 @@ class SlowFastLinkedList(LinkedList):
 
         return slow.data  # Return data at cycle start
 
+    def find_cycle(self, method: str = "floyd") -> Optional[CycleInfo]:
+        """Find the cycle start node, cycle length and tail length in one call.
+        
+        In the usual notation, the tail length is mu (the number of nodes
+        before the cycle) and the cycle length is lambda. Like
+        find_cycle_start, the result is memoized against the mutation version.
+        
+        Args:
+            method: "floyd" (default) or "brent"
+            
+        Returns:
+            A CycleInfo(start, length, tail_length), or None if no cycle exists.
+            
+        Raises:
+            ValueError: If method is not one of CYCLE_METHODS
+            
+        Example:
+            >>> llist = SlowFastLinkedList()
+            >>> for i in range(1, 6):
+            ...     llist.append(i)
+            >>> llist.create_cycle(1)
+            True
+            >>> info = llist.find_cycle()
+            >>> info.start.data, info.length, info.tail_length
+            (2, 4, 1)
+        """
+        self._check_method(method)
+        if method == "brent":
+            return self._cycle_info()
+        return self._cached(("find_cycle", method), self._floyd_cycle)
+
+    def _floyd_cycle(self) -> Optional[CycleInfo]:
+        """Compute find_cycle's result with Floyd's algorithm."""
+        meeting = self._floyd_meeting_point()
+        if meeting is None:
+            return None
+
+        # Walk once around the cycle from the meeting point to measure it
+        length = 1
+        current = meeting.next
+        while current is not meeting:
+            current = current.next
+            length += 1
+
+        # Phase 2 as in find_cycle_start, counting the steps taken
+        tail_length = 0
+        slow, fast = self.head, meeting
+        while slow is not fast:
+            slow = slow.next
+            fast = fast.next
+            tail_length += 1
+
+        return CycleInfo(slow, length, tail_length)
+
+    def split_half(self) -> Tuple['SlowFastLinkedList', 'SlowFastLinkedList']:
+        """Cut the list into a front and a back half, sharing its nodes.
+        
+        The back half starts at the middle node (position len // 2, as
+        returned by find_middle), so for odd lengths it is the longer one.
+        The fast pointer of find_middle only exists to discover where the
+        list ends; the maintained length already says so, and the slow
+        pointer's walk alone reaches the cut. The back half keeps the old
+        tail, so only the front half is walked. No node is copied, and
+        this list is left empty.
+        
+        Time Complexity: O(n), len // 2 pointer hops
+        
+        Returns:
+            The front and back halves, as new lists of this class
+            
+        Raises:
+            ValueError: If the list has a cycle
+            
+        Example:
+            >>> llist = SlowFastLinkedList()
+            >>> llist.extend([1, 2, 3, 4, 5])
+            >>> front, back = llist.split_half()
+            >>> print(front, back)
+            1 -> 2 -> None 3 -> 4 -> 5 -> None
+        """
+        front, back = self.split_into(2)
+        return front, back
+    
+    def split_into(self, k: int) -> List['SlowFastLinkedList']:
+        """Cut the list into k consecutive parts, sharing its nodes.
+        
+        Part i holds the nodes from position len * i // k up to
+        len * (i + 1) // k, so part sizes differ by at most one and
+        split_into(2) matches split_half. If k exceeds the length, some
+        parts are empty. The list is walked once, stopping at the last
+        cut, and left empty.
+        
+        Time Complexity: O(n)
+        
+        Args:
+            k: The number of parts, at least 1
+            
+        Returns:
+            The k parts in order, as new lists of this class
+            
+        Raises:
+            ValueError: If k is less than 1 or the list has a cycle
+            
+        Example:
+            >>> llist = SlowFastLinkedList()
+            >>> llist.extend(range(7))
+            >>> [len(part) for part in llist.split_into(3)]
+            [2, 2, 3]
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        if self.tail is not None and self.tail.next is not None:
+            raise ValueError("cannot split a list with a cycle")
+        head, tail, size = self._take_nodes()
+        parts = []
+        node = head
+        for i in range(k):
+            count = size * (i + 1) // k - size * i // k
+            if count == 0:
+                parts.append(self._new_part(None, None, 0))
+                continue
+            if i == k - 1:
+                parts.append(self._new_part(node, tail, count))
+                break
+            part_head = part_tail = node
+            for _ in range(count - 1):
+                part_tail = part_tail.next
+            node = part_tail.next
+            part_tail.next = None
+            parts.append(self._new_part(part_head, part_tail, count))
+        return parts
+    
+    def _new_part(self, head: Optional[Node], tail: Optional[Node],
+                  size: int) -> 'SlowFastLinkedList':
+        """Return a new list of this class that owns the given chain of nodes."""
+        part = self.__class__()
+        part.head, part.tail, part._size = head, tail, size
+        part._mutated()
+        return part
+    
+    @staticmethod
+    def _check_method(method: str) -> None:
+        """Raise ValueError for an unknown cycle detection method."""
+        if method not in CYCLE_METHODS:
+            raise ValueError(
+                f"unknown cycle detection method {method!r}; "
+                f"expected one of {CYCLE_METHODS}"
+            )
+
+    def _floyd_meeting_point(self) -> Optional[Node]:
+        """Run phase 1 of Floyd's algorithm.
+        
+        Returns:
+            The node where the slow and fast pointers meet, or None if the
+            fast pointer reaches the end of the list
+        """
+        slow = self.head
+        fast = self.head
+
+        # Move slow by 1, fast by 2 until they meet or reach end
+        while fast and fast.next:
+            slow = slow.next           # Moves one step
+            fast = fast.next.next      # Moves two steps
+            if slow == fast:          # Cycle detected
+                return fast
+        return None
+
+def find_middle_streaming(iterable: Iterable[Any]) -> Optional[Any]:
+    """Find the middle item of any iterable in a single pass.
+    
+    This is the slow-fast idea applied to a stream: reading the input is the
+    fast pointer, and the front of a buffer trails it at half speed as the
+    slow pointer. The middle is the item at position n // 2, matching
+    find_middle on the list classes.
+    
+    Memory trade-off:
+    - Sequences are indexed directly: O(1) memory and no iteration.
+    - Other sized iterables (len() is known) are skipped forward to the
+      middle with islice: O(1) memory.
+    - Plain iterators such as file or socket readers have unknown length,
+      so the last ceil(n / 2) items must be buffered: O(n) memory. Any
+      single-pass algorithm over such a stream needs that much, since any
+      of those items could still turn out to be the middle.
+    
+    Args:
+        iterable: The items to search. Iterators are consumed.
+        
+    Returns:
+        The middle item, or None if the iterable is empty
+        
+    Example:
+        >>> find_middle_streaming(iter([1, 2, 3, 4, 5]))
+        3
+    """
+    if isinstance(iterable, Sequence):
+        return iterable[len(iterable) // 2] if len(iterable) else None
+    if isinstance(iterable, Sized):
+        return next(islice(iterable, len(iterable) // 2, None), None)
+
+    window = deque()
+    count = 0
+    for item in iterable:
+        window.append(item)
+        count += 1
+        # The slow pointer advances on every second item
+        if count % 2 == 0:
+            window.popleft()
+    return window[0] if window else None
+
 # Example usage
 if __name__ == "__main__":
     # Quick validation of functionality
@@ -116,6 +362,8 @@ if __name__ == "__main__":
     llist.create_cycle(1)  # Creates cycle: 5 -> 2
     cycle_start = llist.find_cycle_start()
     print(f"After creating cycle at position 1: {cycle_start}")
+    info = llist.find_cycle(method="brent")
+    print(f"Brent: start={info.start.data}, length={info.length}, tail={info.tail_length}")
     
     # Test edge cases
     empty_list = SlowFastLinkedList()
@@ -124,3 +372,10 @@ if __name__ == "__main__":
     single_list = SlowFastLinkedList()
     single_list.append(42)
     print(f"Single element cycle: {single_list.find_cycle_start()}")
+    
+    # Test splitting
+    split_list = SlowFastLinkedList()
+    split_list.extend(range(1, 8))
+    front, back = split_list.split_half()
+    print(f"Split in half: {front} | {back}")
+    print(f"Back in 3 parts: {[str(part) for part in back.split_into(3)]}")
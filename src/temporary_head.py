@@ -1,4 +1,6 @@
-from typing import Optional, Any
+import heapq
+from collections import defaultdict, deque
+from typing import Optional, Any, Callable, Deque, Dict, Iterable, Iterator, Tuple
 from .linked_list_base import LinkedList, Node
 
 
@@ -10,16 +12,76 @@ class TemporaryHeadLinkedList(LinkedList):
     handle edge cases uniformly, especially when the head node needs to be
     modified.
     
-    Time Complexity: O(n) for both delete and reverse operations
-    Space Complexity: O(1)
+    With indexed=True the list also keeps a hash index from each value to
+    its nodes in list order, plus each node's predecessor, so delete_node
+    finds and unlinks the first occurrence in O(1) expected time and a
+    miss returns immediately. Values must then be hashable, and matching
+    follows dict lookup (hash, then identity or ==) instead of a scan.
+    
+    sort is a bottom-up merge sort that relinks nodes behind the same
+    temporary head, so it needs no copy of the values.
+    
+    Time Complexity: O(n) for both delete and reverse operations,
+                     O(1) expected delete_node with indexed enabled,
+                     O(n log n) for sort
+    Space Complexity: O(1), O(n) for the index when enabled
     """
     
+    def __init__(self, indexed: bool = False) -> None:
+        """Initialize an empty list.
+        
+        Args:
+            indexed: Maintain a value-to-nodes index for delete_node
+        """
+        super().__init__()
+        self.indexed = indexed
+        self._index: Dict[Any, Deque[Node]] = defaultdict(deque)
+        self._pred: Dict[Node, Optional[Node]] = {}
+    
+    def append(self, data: Any) -> None:
+        """Add a new node with the given data to the end of the list.
+        
+        With indexed enabled, the node is added to the end of its value's
+        occurrences and its predecessor is recorded.
+        
+        Args:
+            data: The data to store in the new node
+            
+        Raises:
+            TypeError: If indexed is enabled and data is unhashable
+        """
+        if not self.indexed:
+            super().append(data)
+            return
+        hash(data)  # Fail before linking a node that cannot be indexed
+        prev = self.tail
+        super().append(data)
+        self._pred[self.tail] = prev
+        self._index[data].append(self.tail)
+    
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+        
+        With indexed enabled, each item is appended and indexed in turn,
+        which is still O(k) for k items.
+        
+        Args:
+            iterable: The items to append, in order
+        """
+        if not self.indexed:
+            super().extend(iterable)
+            return
+        if iterable is self:
+            iterable = list(iterable)
+        for data in iterable:
+            self.append(data)
+    
     def delete_node(self, value: Any) -> bool:
         """Delete the first occurrence of a node with the given value.
         
         This method uses the temporary head technique to simplify deletion,
-        especially when deleting the head node. A dummy node is created to
-        act as a temporary head, making the deletion logic uniform for all positions.
+        especially when deleting the head node. The list's dummy node is linked
+        in to act as a temporary head, making the deletion logic uniform for all positions.
         
         Args:
             value: The value to search for and delete
@@ -36,20 +98,160 @@ class TemporaryHeadLinkedList(LinkedList):
             >>> llist.delete_node(1)  # Delete head node
             True
         """
-        dummy = Node(0)  # Create temporary head node
-        dummy.next = self.head
+        if self.indexed:
+            return self._delete_indexed(value)
+        dummy = self._temporary_head()  # Reuse the list's temporary head node
         prev, current = dummy, self.head
         
         while current:
             if current.data == value:
                 prev.next = current.next
                 self.head = dummy.next  # Update in case head was deleted
+                dummy.next = None  # Unlink the temporary head again
+                self._size -= 1
+                self._mutated()
+                if current is self.tail:
+                    self.tail = prev if prev is not dummy else None
+                self._recycle(current)
                 return True
             prev, current = current, current.next
             
-        self.head = dummy.next  # Update head (though it shouldn't have changed)
+        dummy.next = None  # The head never changes when nothing is deleted
         return False
 
+    def delete_all(self, values: Iterable[Any]) -> int:
+        """Delete every node whose value is one of the given values.
+        
+        Hashable values are collected into a set, so the whole list is
+        cleaned in one dummy-head pass instead of a delete_node scan per
+        value. Unhashable values are compared with == one by one.
+        
+        Time Complexity: O(n + k) for k values
+        
+        Args:
+            values: The values to remove
+            
+        Returns:
+            The number of nodes deleted
+            
+        Example:
+            >>> llist = TemporaryHeadLinkedList()
+            >>> llist.extend([1, 2, 3, 2, 1])
+            >>> llist.delete_all([1, 2])
+            4
+        """
+        hashable, unhashable = set(), []
+        for value in values:
+            try:
+                hashable.add(value)
+            except TypeError:
+                unhashable.append(value)
+
+        def matches(data: Any) -> bool:
+            try:
+                if data in hashable:
+                    return True
+            except TypeError:
+                pass  # Unhashable data can only equal an unhashable value
+            return bool(unhashable) and any(data == value for value in unhashable)
+
+        return self._delete_matching(matches)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Delete every node whose value satisfies a predicate, in one pass.
+        
+        If the predicate raises, the nodes already removed stay removed and
+        the list is left consistent.
+        
+        Time Complexity: O(n)
+        
+        Args:
+            predicate: Called with each value; a true result deletes the node
+            
+        Returns:
+            The number of nodes deleted
+            
+        Example:
+            >>> llist = TemporaryHeadLinkedList()
+            >>> llist.extend(range(10))
+            >>> llist.delete_where(lambda x: x % 2)
+            5
+        """
+        return self._delete_matching(predicate)
+
+    def delete_first_n(self, value: Any, n: int) -> int:
+        """Delete the first n occurrences of a value.
+        
+        The pass stops as soon as n nodes have been removed. With indexed
+        enabled each occurrence is found through the index instead.
+        
+        Time Complexity: O(n) scanning, O(k) expected with indexed enabled
+        
+        Args:
+            value: The value to remove
+            n: The most occurrences to remove
+            
+        Returns:
+            The number of nodes deleted, at most n
+            
+        Raises:
+            ValueError: If n is negative
+            
+        Example:
+            >>> llist = TemporaryHeadLinkedList()
+            >>> llist.extend([7, 1, 7, 7])
+            >>> llist.delete_first_n(7, 2)
+            2
+            >>> print(llist)
+            1 -> 7 -> None
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        if self.indexed:
+            removed = 0
+            while removed < n and self._delete_indexed(value):
+                removed += 1
+            return removed
+        return self._delete_matching(lambda data: data == value, limit=n)
+
+    def _delete_matching(self, matches: Callable[[Any], bool],
+                         limit: Optional[int] = None) -> int:
+        """Unlink every matching node in one pass behind a temporary head.
+
+        Args:
+            matches: Called with each value; a true result deletes the node
+            limit: Stop after this many deletions, or None for no limit
+
+        Returns:
+            The number of nodes deleted
+        """
+        dummy = self._temporary_head()
+        prev, current = dummy, self.head
+        removed = 0
+
+        try:
+            while current and removed != limit:
+                next_node = current.next
+                if matches(current.data):
+                    prev.next = next_node
+                    if current is self.tail:
+                        self.tail = prev if prev is not dummy else None
+                    removed += 1
+                    self._recycle(current)
+                else:
+                    prev = current
+                current = next_node
+        finally:
+            # Commit what was removed, even if matches raised part way
+            self.head = dummy.next
+            dummy.next = None
+            if removed:
+                self._size -= removed
+                self._mutated()
+                if self.indexed:
+                    self._rebuild_index()
+        return removed
+
     def reverse(self) -> None:
         """Reverse the linked list using the temporary head technique.
         
@@ -58,7 +260,7 @@ class TemporaryHeadLinkedList(LinkedList):
         reversal operation.
         
         The algorithm works by:
-        1. Creating a temporary head node
+        1. Linking the list's temporary head node in front of the head
         2. Reversing the links between nodes
         3. Updating the actual head to point to the new first node
         4. Fixing the old head's next pointer
@@ -75,9 +277,8 @@ class TemporaryHeadLinkedList(LinkedList):
         if not self.head:
             return
 
-        # Create a temporary head node pointing to the actual head
-        temp_head = Node(0)  # Dummy node with arbitrary value
-        temp_head.next = self.head
+        # Take the temporary head node, pointing to the actual head
+        temp_head = self._temporary_head()
 
         prev = temp_head
         current = self.head
@@ -95,9 +296,295 @@ class TemporaryHeadLinkedList(LinkedList):
         # Update the actual head
         # prev is the new head, temp_head.next is the old head
         self.head = prev
+        self.tail = temp_head.next
+        self._mutated()
         # Fix the old head's next pointer (which points to temp_head)
         if temp_head.next:
             temp_head.next.next = None
+        temp_head.next = None
+        if self.indexed:
+            self._reverse_index()
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """Sort the list in place with a stable, bottom-up merge sort.
+
+        Nodes are relinked, never copied. Each pass cuts the list into runs
+        of width nodes and merges neighbouring pairs behind the list's
+        temporary head, so the first merged node needs no special case and
+        the sorted prefix always ends at a known tail. Width doubles each
+        pass until one run remains, with no recursion and no buffer.
+
+        As with list.sort, only < is used to compare, equal items keep
+        their order (also when reverse is set), and reverse=True sorts in
+        descending order. key is called once per node per pass, rather than
+        once per item, since caching the keys would cost O(n) memory.
+
+        If key or a comparison raises, the list still holds every node,
+        in a partly sorted order.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(1)
+
+        Args:
+            key: Called with each value to produce the value compared
+            reverse: Sort in descending order
+
+        Raises:
+            ValueError: If the list has a cycle
+
+        Example:
+            >>> llist = TemporaryHeadLinkedList()
+            >>> llist.extend([3, 1, 2])
+            >>> llist.sort()
+            >>> print(llist)
+            1 -> 2 -> 3 -> None
+        """
+        if self.tail is not None and self.tail.next is not None:
+            raise ValueError("cannot sort a list with a cycle")
+        size = self._size
+        if size < 2:
+            return
+        dummy = self._temporary_head()
+        tail, rest = dummy, self.head
+        merging = False
+        width = 1
+        try:
+            while width < size:
+                tail, rest = dummy, dummy.next
+                while rest:
+                    # Cut two runs of up to width nodes off the front of rest
+                    left = left_end = rest
+                    for _ in range(width - 1):
+                        if left_end.next is None:
+                            break
+                        left_end = left_end.next
+                    right = left_end.next
+                    if right is None:
+                        tail.next = left  # A lone last run is already sorted
+                        tail = left_end
+                        rest = None
+                        continue
+                    right_end = right
+                    for _ in range(width - 1):
+                        if right_end.next is None:
+                            break
+                        right_end = right_end.next
+                    rest = right_end.next
+                    left_end.next = right_end.next = None
+                    merging = True
+
+                    # Merge them onto the sorted prefix, taking the left node
+                    # unless the right one strictly precedes it
+                    left_key = left.data if key is None else key(left.data)
+                    right_key = right.data if key is None else key(right.data)
+                    while True:
+                        if left_key < right_key if reverse else right_key < left_key:
+                            tail.next = tail = right
+                            right = right.next
+                            if right is None:
+                                tail.next = left
+                                tail = left_end
+                                break
+                            right_key = right.data if key is None else key(right.data)
+                        else:
+                            tail.next = tail = left
+                            left = left.next
+                            if left is None:
+                                tail.next = right
+                                tail = right_end
+                                break
+                            left_key = left.data if key is None else key(left.data)
+                    merging = False
+                width *= 2
+        except BaseException:
+            # Relink the pieces in the middle of a pass so no node is lost
+            if merging:
+                tail.next = left
+                left_end.next = right
+                tail = right_end
+            tail.next = rest
+            while tail.next is not None:
+                tail = tail.next
+            raise
+        finally:
+            self.head = dummy.next
+            dummy.next = None
+            self.tail = tail
+            self._mutated()
+            if self.indexed:
+                self._rebuild_index()
+
+    def _take_nodes(self) -> Tuple[Optional[Node], Optional[Node], int]:
+        """Empty the list as LinkedList._take_nodes and clear the index."""
+        self._index.clear()
+        self._pred.clear()
+        return super()._take_nodes()
+
+    def _delete_indexed(self, value: Any) -> bool:
+        """Unlink the first node holding value using the index."""
+        try:
+            nodes = self._index.get(value)
+        except TypeError:
+            return False  # Unhashable values are never stored
+        if not nodes:
+            return False
+        node = nodes.popleft()
+        if not nodes:
+            del self._index[value]
+        prev = self._pred.pop(node)
+        next_node = node.next
+        if prev is None:
+            self.head = next_node
+        else:
+            prev.next = next_node
+        if next_node is not None:
+            self._pred[next_node] = prev
+        if node is self.tail:
+            self.tail = prev
+        self._size -= 1
+        self._mutated()
+        self._recycle(node)
+        return True
+
+    def _rebuild_index(self) -> None:
+        """Recompute the index and predecessors with one walk of the list."""
+        self._index.clear()
+        self._pred.clear()
+        prev = None
+        for node in self.iter_nodes():
+            self._index[node.data].append(node)
+            self._pred[node] = prev
+            prev = node
+
+    def _reverse_index(self) -> None:
+        """Bring the index in line with a reversed list.
+
+        Every value's occurrences now appear in the opposite order, and
+        each node's predecessor is the node that used to follow it.
+        """
+        for nodes in self._index.values():
+            nodes.reverse()
+        prev = None
+        for node in self.iter_nodes():
+            self._pred[node] = prev
+            prev = node
+
+def merge_sorted(lists: Iterable[LinkedList],
+                 key: Optional[Callable[[Any], Any]] = None) -> TemporaryHeadLinkedList:
+    """Merge sorted lists into one by relinking their nodes.
+    
+    A heap holds the front node of each non-empty list. The smallest is
+    linked behind a temporary head and replaced by its successor, so the
+    merged list is built without allocating a node. When one list is left
+    its remaining nodes are attached in one step. Equal items keep their
+    order, and items from earlier lists come first.
+    
+    The input lists are emptied. If key or a comparison raises, every node
+    is moved into the first list instead, merged prefix first.
+    
+    Time Complexity: O(N log k) for N nodes in k lists
+    Space Complexity: O(k)
+    
+    Args:
+        lists: Acyclic lists, each sorted by key
+        key: Called with each value to produce the value compared
+        
+    Returns:
+        A new TemporaryHeadLinkedList holding every node
+        
+    Raises:
+        ValueError: If a list has a cycle or is passed more than once
+        
+    Example:
+        >>> a, b = TemporaryHeadLinkedList(), TemporaryHeadLinkedList()
+        >>> a.extend([1, 4, 7])
+        >>> b.extend([2, 3, 8])
+        >>> print(merge_sorted([a, b]))
+        1 -> 2 -> 3 -> 4 -> 7 -> 8 -> None
+    """
+    lists = list(lists)
+    if len({id(llist) for llist in lists}) != len(lists):
+        raise ValueError("cannot merge a list with itself")
+    for llist in lists:
+        # Ask the list, since tail.next is not a cycle's back-edge in every
+        # class (a reversed DoublyLinkedList reads its links the other way)
+        if llist._open_cycle_info() is not None:
+            raise ValueError("cannot merge a list with a cycle")
+
+    chains = [llist._take_nodes() for llist in lists]
+    fronts = [head for head, _, _ in chains]  # Next unmerged node of each list
+    merged = TemporaryHeadLinkedList()
+    dummy = merged._temporary_head()
+    tail = dummy
+    try:
+        heap = [(node.data if key is None else key(node.data), i, node)
+                for i, node in enumerate(fronts) if node is not None]
+        heapq.heapify(heap)
+        # The list index breaks ties, so nodes themselves are never compared
+        while len(heap) > 1:
+            _, i, node = heap[0]
+            tail.next = tail = node
+            node = fronts[i] = node.next
+            if node is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (node.data if key is None else key(node.data), i, node))
+        if heap:
+            i = heap[0][1]
+            tail.next = fronts[i]
+            tail = chains[i][1]
+            fronts[i] = None
+    except BaseException:
+        # Hand every node to the first list: the merged prefix, then what
+        # is left of each list in order
+        for i, node in enumerate(fronts):
+            if node is not None:
+                tail.next = node
+                tail = chains[i][1]
+        lists[0].head = dummy.next
+        dummy.next = None
+        lists[0].tail = tail if tail is not dummy else None
+        lists[0]._size = sum(size for _, _, size in chains)
+        lists[0]._mutated()
+        if getattr(lists[0], "indexed", False):
+            lists[0]._rebuild_index()
+        raise
+    merged.head = dummy.next
+    dummy.next = None
+    merged.tail = tail if tail is not dummy else None
+    merged._size = sum(size for _, _, size in chains)
+    return merged
+
+
+def iter_merge_sorted(lists: Iterable[LinkedList],
+                      key: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+    """Lazily yield the values of sorted lists in merged order.
+    
+    The lazy counterpart of merge_sorted: the lists are left untouched and
+    each value is produced on demand from a heap of k front items, so a
+    consumer can start before the merge finishes. Iterating an acyclic
+    list runs no cycle detection, so the first value costs O(k). The lists
+    must not be changed while the iterator is in use.
+    
+    Time Complexity: O(log k) per value, O(N log k) in total
+    Space Complexity: O(k)
+    
+    Args:
+        lists: Lists, each sorted by key
+        key: Called with each value to produce the value compared
+        
+    Yields:
+        The values of every list in sorted order; ties keep list order
+        
+    Example:
+        >>> a, b = TemporaryHeadLinkedList(), TemporaryHeadLinkedList()
+        >>> a.extend([1, 4])
+        >>> b.extend([2, 3])
+        >>> next(iter_merge_sorted([a, b]))
+        1
+    """
+    return heapq.merge(*lists, key=key)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -127,3 +614,30 @@ if __name__ == "__main__":
     empty_list = TemporaryHeadLinkedList()
     empty_list.reverse()
     print(f"Empty list reverse: {empty_list}")
+    
+    # Test indexed deletion
+    indexed = TemporaryHeadLinkedList(indexed=True)
+    indexed.extend([1, 2, 1, 3])
+    indexed.delete_node(1)
+    print(f"Indexed delete first 1: {indexed}")
+    
+    # Test batch deletion
+    batch = TemporaryHeadLinkedList()
+    batch.extend(range(10))
+    print(f"delete_all([0, 9]): {batch.delete_all([0, 9])}, List: {batch}")
+    print(f"delete_where(odd): {batch.delete_where(lambda x: x % 2)}, List: {batch}")
+    
+    # Test in-place sort
+    unsorted = TemporaryHeadLinkedList()
+    unsorted.extend([5, 2, 4, 1, 3])
+    unsorted.sort(reverse=True)
+    print(f"Sorted descending: {unsorted}")
+    
+    # Test k-way merge
+    shards = []
+    for start in range(3):
+        shard = TemporaryHeadLinkedList()
+        shard.extend(range(start, 12, 3))
+        shards.append(shard)
+    print(f"Lazy merge: {list(iter_merge_sorted(shards))}")
+    print(f"Merged by relinking: {merge_sorted(shards)}")
@@ -0,0 +1,456 @@
+import copy
+from itertools import islice
+from typing import Optional, Any, Dict, Iterable, Iterator, List, Tuple
+
+DEFAULT_BLOCK_SIZE = 64
+
+
+class Block:
+    """A node of an unrolled linked list, holding up to block_size values.
+
+    Attributes:
+        values: The values stored in the block, in order
+        next: Reference to the next block, or None if this is the last block
+    """
+
+    __slots__ = ('values', 'next')
+
+    def __init__(self, values: List[Any]) -> None:
+        """Initialize a new, unlinked block.
+
+        Args:
+            values: The list of values the block takes ownership of
+        """
+        self.values = values
+        self.next: Optional['Block'] = None
+
+
+class UnrolledLinkedList:
+    """A singly linked list whose nodes each hold a block of values.
+
+    Every Block stores up to block_size values in a Python list, so the
+    per-value cost is one list slot plus the block's overhead shared by
+    up to block_size values, and a traversal follows one next pointer per
+    block instead of one per value. Appends fill the tail block before
+    linking a new one. When delete_node leaves a block other than the
+    last under half full, the block absorbs its successor if both fit in
+    one, and otherwise takes values from the front of it until both are
+    at least half full. A cycle's first block is left alone, so its first
+    value stays the cycle start.
+
+    The class offers the LinkedList API (append, extend, print_list,
+    len, iter, str) together with the techniques from
+    MultiplePassLinkedList, SlowFastLinkedList and TemporaryHeadLinkedList,
+    each working on blocks rather than single values.
+
+    Attributes:
+        head: The first block, or None if the list is empty
+        tail: The last block, or None if the list is empty. If a cycle has
+              been created, this is the block whose next pointer closes it.
+        block_size: The most values a block holds
+
+    Time Complexity: O(1) amortized append, O(n / B) find_middle and
+                     find_cycle_start, O(n) delete_node and reverse for
+                     block size B, with the per-value work done in C
+    Space Complexity: O(1) extra for every operation
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        """Initialize an empty unrolled linked list.
+
+        Args:
+            block_size: The most values stored in one block
+
+        Raises:
+            ValueError: If block_size is less than 1
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        self.head: Optional[Block] = None
+        self.tail: Optional[Block] = None
+        self.block_size = block_size
+        self._size = 0
+        self._dummy = Block([])  # Reusable temporary head for delete_node
+
+    def append(self, data: Any) -> None:
+        """Add a value to the end of the list.
+
+        The value goes into the tail block, or a new block once it is full.
+        On a list with a cycle the value still precedes the back-edge.
+
+        Args:
+            data: The value to append
+        """
+        tail = self.tail
+        if tail is None:
+            self.head = self.tail = Block([data])
+        elif len(tail.values) < self.block_size:
+            tail.values.append(data)
+        else:
+            block = Block([data])
+            block.next = tail.next
+            tail.next = block
+            self.tail = block
+        self._size += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of an iterable to the end of the list.
+
+        The tail block is topped up first, then the items are cut into
+        full blocks with islice, without a per-item append call. If the
+        iterable raises, the items taken before the error stay appended.
+
+        Args:
+            iterable: The items to append, in order
+        """
+        items = iter(list(iterable) if iterable is self else iterable)
+        block_size = self.block_size
+        tail = self.tail
+        before = len(tail.values) if tail is not None else 0
+        added = 0
+        values: List[Any] = []
+        try:
+            if tail is not None:
+                tail.values.extend(islice(items, block_size - before))
+            while True:
+                values = []
+                values.extend(islice(items, block_size))  # Keeps what was read if it raises
+                if len(values) < block_size:
+                    return
+                self._link_block(values)
+                added += block_size
+                values = []
+        finally:
+            # Link and count everything taken, even if the iterable raised
+            if values:
+                self._link_block(values)
+                added += len(values)
+            if tail is not None:
+                added += len(tail.values) - before
+            self._size += added
+
+    def _link_block(self, values: List[Any]) -> None:
+        """Link a new block after the tail, before a cycle's back-edge if any."""
+        block = Block(values)
+        tail = self.tail
+        if tail is None:
+            self.head = block
+        else:
+            block.next = tail.next
+            tail.next = block
+        self.tail = block
+
+    def print_list(self) -> None:
+        """Print the list in a readable format (data -> data -> ... -> None)."""
+        print(self)
+
+    def __len__(self) -> int:
+        """Return the number of values in the list.
+
+        Returns:
+            The count of values in the list
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Lazily yield each value, from head to tail.
+
+        On a list with a cycle each value is visited once.
+
+        Yields:
+            The values of every block in order
+        """
+        remaining = self._size
+        block = self.head
+        while remaining > 0:
+            yield from block.values
+            remaining -= len(block.values)
+            block = block.next
+
+    def __str__(self) -> str:
+        """Return a string representation of the list.
+
+        A cycle always returns to the first value of a block, so a cyclic
+        list ends with "(cycle back to data)" as LinkedList does, without
+        a cycle-detection pass.
+
+        Returns:
+            A string in the format "data -> data -> ... -> None"
+        """
+        result = [str(data) for data in self]
+        if self.tail is not None and self.tail.next is not None:
+            result.append(f"(cycle back to {self.tail.next.values[0]})")
+        else:
+            result.append("None")
+        return " -> ".join(result)
+
+    def __repr__(self) -> str:
+        """Return a short debugging representation of the list.
+
+        Returns:
+            A string like "UnrolledLinkedList(len=1000, blocks=16, block_size=64)"
+        """
+        return (f"{self.__class__.__name__}(len={self._size}, "
+                f"blocks={self._count_blocks()}, block_size={self.block_size})")
+
+    def __reduce__(self) -> Tuple[type, Tuple[()], Dict[str, Any]]:
+        """Support pickling by flattening the list into a sequence of values.
+
+        As with LinkedList, the default protocol would recurse through each
+        block's next pointer and hit the recursion limit on long lists.
+
+        Returns:
+            The class, empty constructor arguments and the flat state
+        """
+        return (self.__class__, (), self.__getstate__())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the list as a flat, picklable state.
+
+        Returns:
+            A dict with the values in order, the position the cycle returns
+            to (or None), and the public settings such as block_size
+        """
+        return {
+            "values": list(self),
+            "cycle_pos": self._cycle_position(),
+            "attrs": {name: value for name, value in vars(self).items()
+                      if not name.startswith("_") and name not in ("head", "tail")},
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the list from the state produced by __getstate__.
+
+        Args:
+            state: The flat state to restore into this (empty) list
+        """
+        for name, value in state["attrs"].items():
+            setattr(self, name, value)
+        self.extend(state["values"])
+        if state["cycle_pos"] is not None:
+            self.create_cycle(state["cycle_pos"])
+
+    def __copy__(self) -> 'UnrolledLinkedList':
+        """Return a shallow copy: new blocks holding the same data objects.
+
+        Returns:
+            A list with the same block size, values and cycle
+        """
+        new = self.__class__()
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'UnrolledLinkedList':
+        """Return a deep copy, built iteratively from the flat state.
+
+        Args:
+            memo: The copy module's memo of already copied objects
+
+        Returns:
+            A list with the same block size and deep copies of the values
+        """
+        new = self.__class__()
+        memo[id(self)] = new
+        new.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return new
+
+    def _cycle_position(self) -> Optional[int]:
+        """Return the position of the value a cycle returns to, or None."""
+        start = self.tail.next if self.tail is not None else None
+        if start is None:
+            return None
+        position, block = 0, self.head
+        while block is not start:
+            position += len(block.values)
+            block = block.next
+        return position
+
+    def _count_blocks(self) -> int:
+        """Count the distinct blocks, which together hold every value once."""
+        count = 0
+        remaining = self._size
+        block = self.head
+        while remaining > 0:
+            remaining -= len(block.values)
+            block = block.next
+            count += 1
+        return count
+
+    def find_middle(self) -> Optional[Any]:
+        """Find the middle value by skipping whole blocks.
+
+        The size is known, so as in ArrayLinkedList only the second pass of
+        the multiple-pass technique is needed, and it moves a block at a
+        time. For even-length lists, returns the second middle value,
+        matching MultiplePassLinkedList.
+
+        Returns:
+            The middle value, or None if the list is empty
+        """
+        if self._size == 0:
+            return None
+        position = self._size // 2
+        block = self.head
+        while position >= len(block.values):
+            position -= len(block.values)
+            block = block.next
+        return block.values[position]
+
+    def create_cycle(self, pos: int) -> bool:
+        """Create a cycle by connecting the last block to the value at given position.
+
+        Links only join blocks, so the block holding that value is split
+        first if the value is not already the first in its block.
+
+        Args:
+            pos: The 0-based position where the cycle should start.
+                 Must be non-negative and less than the list length.
+
+        Returns:
+            True if the cycle was created successfully, False otherwise.
+        """
+        if pos < 0 or pos >= self._size:
+            return False
+        block = self.head
+        while pos >= len(block.values):
+            pos -= len(block.values)
+            block = block.next
+        if pos:
+            rest = Block(block.values[pos:])
+            del block.values[pos:]
+            rest.next = block.next
+            block.next = rest
+            if block is self.tail:
+                self.tail = rest
+            block = rest
+        self.tail.next = block
+        return True
+
+    def find_cycle_start(self) -> Optional[Any]:
+        """Find the start of a cycle with Floyd's algorithm over blocks.
+
+        A cycle always returns to the first value of a block, so the
+        tortoise and hare only visit blocks.
+
+        Returns:
+            The value where the cycle starts, or None if no cycle exists.
+        """
+        slow = fast = self.head
+
+        # Phase 1: Detect cycle using slow and fast block pointers
+        while fast and fast.next:
+            slow = slow.next
+            fast = fast.next.next
+            if slow is fast:
+                break
+        else:
+            return None
+
+        # Phase 2: Find cycle start
+        slow = self.head
+        while slow is not fast:
+            slow = slow.next
+            fast = fast.next
+        return slow.values[0]
+
+    def delete_node(self, value: Any) -> bool:
+        """Delete the first occurrence of a value.
+
+        Each block is searched in C with the in operator, so values are
+        matched by identity or == as in a list. A dummy block in front of the head
+        acts as the temporary head, so unlinking an emptied first block
+        needs no special case. A block left less than half full absorbs
+        its successor when both fit in one block, or else borrows values
+        from it.
+
+        Args:
+            value: The value to search for and delete
+
+        Returns:
+            True if a value was found and deleted, False otherwise
+        """
+        dummy = self._dummy
+        dummy.next = self.head
+        prev, block = dummy, self.head
+        remaining = self._size
+        try:
+            while remaining > 0:
+                values = block.values
+                remaining -= len(values)
+                if value not in values:
+                    prev, block = block, block.next
+                    continue
+                del values[values.index(value)]
+                self._size -= 1
+                if not values:
+                    self._unlink(prev, block, dummy)
+                else:
+                    self._rebalance(block)
+                return True
+            return False
+        finally:
+            dummy.next = None  # Keep no block reachable from the dummy
+
+    def _unlink(self, prev: Block, block: Block, dummy: Block) -> None:
+        """Remove an emptied block, moving a cycle's back-edge off it."""
+        tail = self.tail
+        if self._size == 0:
+            self.head = self.tail = None
+            return
+        if tail.next is block:
+            tail.next = block.next if block is not tail else None
+        prev.next = block.next if block is not tail else tail.next
+        if block is tail:
+            self.tail = prev
+        self.head = dummy.next
+
+    def _rebalance(self, block: Block) -> None:
+        """Refill an underfull block from the next one, merging them if both fit."""
+        following = block.next
+        if (following is None or block is self.tail or following is self.tail.next
+                or len(block.values) >= self.block_size // 2):
+            return
+        total = len(block.values) + len(following.values)
+        if total <= self.block_size:
+            block.values.extend(following.values)
+            block.next = following.next
+            if following is self.tail:
+                self.tail = block
+            return
+        # total > block_size here, so an even split leaves each block
+        # holding at least block_size // 2 values
+        moved = total // 2 - len(block.values)
+        block.values.extend(following.values[:moved])
+        del following.values[:moved]
+
+    def reverse(self) -> None:
+        """Reverse the list by reversing the block links and each block.
+
+        Raises:
+            ValueError: If the list has a cycle
+        """
+        if self.tail is not None and self.tail.next is not None:
+            raise ValueError("operation is not supported on a list with a cycle")
+        prev, block = None, self.head
+        while block:
+            block.values.reverse()
+            next_block = block.next
+            block.next = prev
+            prev, block = block, next_block
+        self.head, self.tail = prev, self.head
+
+
+# Example usage
+if __name__ == "__main__":
+    # Quick validation of functionality
+    llist = UnrolledLinkedList(block_size=4)
+    llist.extend(range(1, 11))
+    print(f"List: {llist}")
+    print(f"{llist!r}, Middle: {llist.find_middle()}")
+
+    llist.delete_node(1)
+    llist.reverse()
+    print(f"Delete 1 and reverse: {llist}")
+
+    llist.create_cycle(3)
+    print(f"Cycle starts at: {llist.find_cycle_start()}")
@@ -2,8 +2,15 @@
 """
 Test runner for all linked list unit tests.
 This script runs all test files and provides a comprehensive summary.
+
+With --perf, it also runs the wall-clock complexity tests (which are skipped
+by default, as timing on a busy machine is unreliable), then reruns the core
+benchmarks and compares them against benchmarks/baseline.json, failing if
+any case regressed beyond --tolerance.
 """
 
+import argparse
+import subprocess
 import unittest
 import sys
 import os
@@ -45,8 +52,27 @@ def run_test_file(test_module_name):
             'output': f"Error importing {test_module_name}: {str(e)}"
         }
 
+def run_perf_check(tolerance):
+    """Run the benchmark regression gate and return its exit status"""
+    print("\n" + "=" * 60)
+    print("PERFORMANCE REGRESSION CHECK")
+    print("=" * 60)
+    script = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'run_all_benchmarks.py')
+    sys.stdout.flush()
+    return subprocess.call([sys.executable, script, '--check', '--tolerance', str(tolerance)])
+
 def main():
     """Run all tests and display summary"""
+    parser = argparse.ArgumentParser(description="Run all linked list unit tests.")
+    parser.add_argument('--perf', action='store_true',
+                        help='also run the timing tests and compare benchmarks '
+                             'against the stored baseline')
+    parser.add_argument('--tolerance', type=float, default=1.0,
+                        help='allowed relative slowdown for --perf (1.0 = 2x slower)')
+    args = parser.parse_args()
+    if args.perf:
+        os.environ['LINKED_LIST_TIMING_TESTS'] = '1'
+
     print("=" * 60)
     print("LINKED LIST UNIT TESTS")
     print("=" * 60)
@@ -56,7 +82,14 @@ def main():
         'test_linked_list_base',
         'test_multiple_pass',
         'test_slow_fast',
-        'test_temporary_head'
+        'test_temporary_head',
+        'test_array_linked_list',
+        'test_doubly_linked',
+        'test_list_ranking',
+        'test_complexity',
+        'test_instrumentation',
+        'test_unrolled_linked_list',
+        'test_skip_list'
     ]
 
     results = []
@@ -98,10 +131,14 @@ def main():
 
     if total_failures == 0 and total_errors == 0:
         print("\n🎉 ALL TESTS PASSED! 🎉")
-        return 0
+        status = 0
     else:
         print(f"\n💥 {total_failures + total_errors} TEST(S) FAILED")
-        return 1
+        status = 1
+
+    if args.perf and run_perf_check(args.tolerance) != 0:
+        status = 1
+    return status
 
 if __name__ == '__main__':
     sys.exit(main())
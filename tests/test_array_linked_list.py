@@ -0,0 +1,150 @@
+import unittest
+from io import StringIO
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.array_linked_list import ArrayLinkedList, NIL
+from src.multiple_pass import MultiplePassLinkedList
+
+
+class TestArrayLinkedList(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.llist = ArrayLinkedList()
+
+    def _get_list_as_array(self):
+        """Helper method to convert linked list to array for easy testing"""
+        result = []
+        current = self.llist.head
+        while current != NIL:
+            result.append(self.llist.data[current])
+            current = self.llist.next[current]
+        return result
+
+    def test_empty_list(self):
+        """Test an empty list has no head, tail or length"""
+        self.assertEqual(self.llist.head, NIL)
+        self.assertEqual(self.llist.tail, NIL)
+        self.assertEqual(len(self.llist), 0)
+        self.assertEqual(str(self.llist), "None")
+
+    def test_append_and_extend(self):
+        """Test append and extend link values in order"""
+        self.llist.append(1)
+        self.llist.extend([2, 3, 4])
+        self.assertEqual(self._get_list_as_array(), [1, 2, 3, 4])
+        self.assertEqual(len(self.llist), 4)
+        self.assertEqual(self.llist.data[self.llist.tail], 4)
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> None")
+        self.assertEqual(list(self.llist), [1, 2, 3, 4])
+
+    def test_print_list(self):
+        """Test printing a list with multiple elements"""
+        self.llist.extend(range(1, 4))
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+
+        self.llist.print_list()
+
+        sys.stdout = sys.__stdout__
+        self.assertEqual(captured_output.getvalue().strip(), "1 -> 2 -> 3 -> None")
+
+    def test_find_middle_matches_multiple_pass(self):
+        """Test find_middle agrees with MultiplePassLinkedList for many lengths"""
+        self.assertIsNone(self.llist.find_middle())
+        for length in range(1, 12):
+            with self.subTest(length=length):
+                array_list = ArrayLinkedList()
+                node_list = MultiplePassLinkedList()
+                array_list.extend(range(length))
+                node_list.extend(range(length))
+                self.assertEqual(array_list.find_middle(), node_list.find_middle())
+
+    def test_find_cycle_start(self):
+        """Test cycle creation and Floyd's detection on indices"""
+        self.llist.extend(range(1, 6))
+        self.assertIsNone(self.llist.find_cycle_start())
+
+        self.assertFalse(self.llist.create_cycle(-1))
+        self.assertFalse(self.llist.create_cycle(5))
+        self.assertTrue(self.llist.create_cycle(1))
+        self.assertEqual(self.llist.find_cycle_start(), 2)
+
+        # str() is bounded by the size, so a cycle cannot hang it
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> 5 -> (cycle back to 2)")
+        with self.assertRaises(ValueError):
+            self.llist.reverse()
+
+    def test_delete_node(self):
+        """Test deleting head, middle, tail and missing values"""
+        self.llist.extend(range(1, 6))
+
+        self.assertTrue(self.llist.delete_node(1))
+        self.assertTrue(self.llist.delete_node(3))
+        self.assertTrue(self.llist.delete_node(5))
+        self.assertFalse(self.llist.delete_node(99))
+
+        self.assertEqual(self._get_list_as_array(), [2, 4])
+        self.assertEqual(self.llist.data[self.llist.tail], 4)
+        self.assertEqual(len(self.llist), 2)
+
+        self.assertTrue(self.llist.delete_node(2))
+        self.assertTrue(self.llist.delete_node(4))
+        self.assertEqual(self.llist.head, NIL)
+        self.assertEqual(self.llist.tail, NIL)
+
+    def test_delete_cycle_start(self):
+        """Test deleting the node a cycle starts at moves the back-edge"""
+        self.llist.extend(range(5))
+        self.llist.create_cycle(1)
+        self.assertTrue(self.llist.delete_node(1))
+        self.assertEqual(self.llist.find_cycle_start(), 2)
+        self.llist.append(9)
+        self.assertEqual(self.llist.find_cycle_start(), 2)
+        self.assertEqual(list(self.llist), [0, 2, 3, 4, 9])
+
+        # Deleting the tail when it is the whole cycle removes the cycle
+        self.llist.create_cycle(4)
+        self.assertTrue(self.llist.delete_node(9))
+        self.assertIsNone(self.llist.find_cycle_start())
+        self.assertEqual(str(self.llist), "0 -> 2 -> 3 -> 4 -> None")
+
+    def test_deleted_slots_are_reused(self):
+        """Test that appends after deletions reuse freed slots"""
+        self.llist.extend(range(1, 6))
+        self.llist.delete_node(2)
+        self.llist.delete_node(4)
+
+        self.llist.append(6)
+        self.llist.append(7)
+        self.assertEqual(len(self.llist.data), 5)
+        self.assertEqual(self._get_list_as_array(), [1, 3, 5, 6, 7])
+
+    def test_reverse(self):
+        """Test reversing empty, single and multiple element lists"""
+        self.llist.reverse()
+        self.assertEqual(self._get_list_as_array(), [])
+
+        self.llist.append(1)
+        self.llist.reverse()
+        self.assertEqual(self._get_list_as_array(), [1])
+
+        self.llist.extend([2, 3, 4])
+        self.llist.reverse()
+        self.assertEqual(self._get_list_as_array(), [4, 3, 2, 1])
+
+        self.llist.append(0)
+        self.assertEqual(self._get_list_as_array(), [4, 3, 2, 1, 0])
+
+    def test_delete_then_reverse(self):
+        """Test combining the temporary head operations"""
+        self.llist.extend(range(1, 6))
+        self.llist.delete_node(3)
+        self.llist.reverse()
+        self.assertEqual(self._get_list_as_array(), [5, 4, 2, 1])
+        self.assertEqual(self.llist.find_middle(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import math
+import unittest
+from unittest import mock
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src import complexity
+from src.complexity import (
+    check_scaling,
+    classify_exponent,
+    documented_complexity,
+    fit_exponent
+)
+from src.linked_list_base import LinkedList
+from src.temporary_head import TemporaryHeadLinkedList
+
+# The wall-clock tests below fit exponents to timings, which a busy machine
+# can skew, so they only run when asked for (run_all_tests.py --perf sets it)
+TIMING_TESTS = os.environ.get("LINKED_LIST_TIMING_TESTS") == "1"
+
+
+class TestComplexityHelpers(unittest.TestCase):
+    def test_fit_exponent(self):
+        """Test the fitted exponent of exact power laws"""
+        sizes = [1000, 2000, 4000, 8000]
+        for exponent in (0, 1, 2):
+            with self.subTest(exponent=exponent):
+                seconds = [3e-9 * n ** exponent for n in sizes]
+                self.assertAlmostEqual(fit_exponent(sizes, seconds), exponent)
+
+    def test_classify_exponent(self):
+        """Test that exponents map to the expected growth classes"""
+        self.assertEqual(classify_exponent(0.1), "constant")
+        self.assertEqual(classify_exponent(1.2), "linear")
+        self.assertEqual(classify_exponent(2.0), "quadratic")
+        self.assertEqual(classify_exponent(3.1), "cubic")
+
+    def test_documented_complexity(self):
+        """Test reading complexity from method, then class docstrings"""
+        self.assertEqual(documented_complexity(LinkedList, "append"), "O(1)")
+        self.assertEqual(documented_complexity(LinkedList, "__len__"), "O(1)")
+        self.assertEqual(documented_complexity(TemporaryHeadLinkedList, "reverse"), "O(n)")
+        self.assertIsNone(documented_complexity(LinkedList, "print_list"))
+
+    def test_growth_worse_than_documented_is_flagged(self):
+        """Test check_scaling's verdict on synthetic quadratic timings"""
+        sizes = [200, 400, 800, 1600]
+        quadratic = [1e-9 * n * n for n in sizes]
+        with mock.patch.object(complexity, "measure_scaling", return_value=quadratic):
+            result = check_scaling(LinkedList, "append", lambda size: None, sizes=sizes)
+        self.assertAlmostEqual(result.exponent, 2.0)
+        self.assertEqual(result.observed, "quadratic")
+        self.assertEqual(result.documented, "O(1)")
+        self.assertFalse(result.ok)
+
+    def test_n_log_n_has_its_own_allowance(self):
+        """Test a noisy O(n log n) fit passes while quadratic growth fails"""
+        sizes = [1000, 2000, 4000, 8000]
+        noisy = [1e-9 * n * math.log(n) * (n / 1000) ** 0.5 for n in sizes]
+        quadratic = [1e-9 * n * n for n in sizes]
+        results = []
+        for seconds in (noisy, quadratic):
+            with mock.patch.object(complexity, "measure_scaling", return_value=seconds):
+                results.append(check_scaling(TemporaryHeadLinkedList, "sort",
+                                             lambda size: None, sizes=sizes))
+        noisy_result, quadratic_result = results
+        self.assertEqual(noisy_result.documented, "O(n log n)")
+        self.assertEqual(noisy_result.observed, "quadratic")  # Past the linear limit
+        self.assertTrue(noisy_result.ok)
+        self.assertFalse(quadratic_result.ok)
+
+
+@unittest.skipUnless(TIMING_TESTS, "timing tests are opt-in: set LINKED_LIST_TIMING_TESTS=1")
+class TestEmpiricalComplexity(unittest.TestCase):
+    SIZES = complexity.DEFAULT_SIZES
+
+    def test_quadratic_method_is_flagged(self):
+        """Test that measured growth worse than documented is reported"""
+        def build(size):
+            llist = LinkedList()
+            llist.extend(range(size))
+
+            def run():
+                # An O(n) walk per element makes building the list O(n^2)
+                for _ in range(size):
+                    for _ in llist.iter_nodes():
+                        pass
+            return run
+
+        result = check_scaling(LinkedList, "append", build, sizes=[200, 400, 800, 1600], repeat=3)
+        self.assertGreater(result.exponent, 1.5)
+        self.assertFalse(result.ok)
+
+    def _observed(self, build):
+        """Return the growth class measured for a build function"""
+        seconds = complexity.measure_scaling(build, self.SIZES, repeat=5)
+        return classify_exponent(fit_exponent(self.SIZES, seconds))
+
+    def test_append_is_constant(self):
+        """Test that append does not slow down as the list grows"""
+        self.assertEqual(self._observed(complexity._build_append), "constant")
+
+    def test_len_is_constant(self):
+        """Test that len() does not walk the list"""
+        self.assertEqual(self._observed(complexity._build_len), "constant")
+
+    def test_skip_list_positions_are_sublinear(self):
+        """Test that SkipLinkedList reaches a position without walking to it"""
+        builds = {
+            "__getitem__": complexity._build_getitem,
+            "insert": complexity._build_insert,
+            "find_middle": complexity._build_skip_find_middle,
+        }
+        for name, build in builds.items():
+            with self.subTest(method=name):
+                self.assertEqual(self._observed(build), "constant")
+
+    def test_traversals_are_linear(self):
+        """Test that the O(n) techniques scale linearly"""
+        builds = {
+            "find_middle": complexity._build_find_middle,
+            "find_cycle_start": complexity._build_find_cycle_start,
+            "delete_node": complexity._build_delete_node,
+            "reverse": complexity._build_reverse,
+        }
+        for name, build in builds.items():
+            with self.subTest(method=name):
+                self.assertEqual(self._observed(build), "linear")
+
+    def test_verify_all_matches_documentation(self):
+        """Test that no registered method scales worse than documented"""
+        results = complexity.verify_all(sizes=self.SIZES)
+        self.assertIn("MultiplePassLinkedList.find_middle", results)
+        for name, result in results.items():
+            with self.subTest(method=name):
+                self.assertIsNotNone(result.documented)
+                self.assertTrue(result.ok, f"{name} grew with exponent {result.exponent:.2f}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,283 @@
+import copy
+import pickle
+import random
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.doubly_linked import DoublyLinkedList, DoublyNode
+from src.instrumentation import track_hops
+from src.multiple_pass import MultiplePassLinkedList
+from src.temporary_head import merge_sorted
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.llist = DoublyLinkedList()
+
+    def _assert_links(self, expected):
+        """Check values forward from head and backward from tail"""
+        # A reversed list reads each node's prev link as its next link
+        next_link, prev_link = ("prev", "next") if self.llist._reversed else ("next", "prev")
+        forward, backward = [], []
+        current = self.llist.head
+        while current:
+            forward.append(current.data)
+            current = getattr(current, next_link)
+        current = self.llist.tail
+        while current:
+            backward.append(current.data)
+            current = getattr(current, prev_link)
+        self.assertEqual(forward, expected)
+        self.assertEqual(backward, expected[::-1])
+        self.assertEqual(len(self.llist), len(expected))
+
+    def test_append_returns_handles(self):
+        """Test append and extend link nodes in both directions"""
+        first = self.llist.append(1)
+        self.llist.extend([2, 3])
+        last = self.llist.append(4)
+        self.assertIsInstance(first, DoublyNode)
+        self.assertIs(first, self.llist.head)
+        self.assertIs(last, self.llist.tail)
+        self.assertEqual(last.data, 4)
+        self._assert_links([1, 2, 3, 4])
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> None")
+
+    def test_extend_keeps_items_taken_before_an_error(self):
+        """Test a failing iterable leaves both directions consistent"""
+        def failing_reader():
+            yield 1
+            yield 2
+            raise OSError("read failed")
+
+        self.llist.append(0)
+        with self.assertRaises(OSError):
+            self.llist.extend(failing_reader())
+        self.llist.append(3)
+        self._assert_links([0, 1, 2, 3])
+
+    def test_remove(self):
+        """Test removing middle, head, tail and the only node by handle"""
+        handles = [self.llist.append(i) for i in range(1, 6)]
+        self.assertEqual(self.llist.remove(handles[2]), 3)
+        self.assertEqual(self.llist.remove(handles[0]), 1)
+        self.assertEqual(self.llist.remove(handles[4]), 5)
+        self._assert_links([2, 4])
+
+        self.llist.remove(handles[1])
+        self.llist.remove(handles[3])
+        self._assert_links([])
+        self.assertIsNone(self.llist.head)
+        self.assertIsNone(self.llist.tail)
+
+    def test_insert_after(self):
+        """Test inserting after the head, a middle node and the tail"""
+        a = self.llist.append("a")
+        c = self.llist.append("c")
+        b = self.llist.insert_after(a, "b")
+        self.llist.insert_after(c, "d")
+        self.llist.insert_after(b, "b2")
+        self._assert_links(["a", "b", "b2", "c", "d"])
+        self.assertEqual(self.llist.tail.data, "d")
+
+    def test_invalid_handles(self):
+        """Test removed and foreign handles are rejected"""
+        handle = self.llist.append(1)
+        self.llist.append(2)
+        self.llist.remove(handle)
+        with self.assertRaises(ValueError):
+            self.llist.remove(handle)
+        with self.assertRaises(ValueError):
+            self.llist.insert_after(handle, 3)
+
+        other = DoublyLinkedList()
+        foreign = other.append(1)
+        with self.assertRaises(ValueError):
+            self.llist.remove(foreign)
+        self._assert_links([2])
+        self.assertEqual(list(other), [1])
+
+    def test_reverse_is_logical(self):
+        """Test reverse flips orientation without relinking nodes"""
+        handles = [self.llist.append(i) for i in range(1, 6)]
+        links = [(node.next, node.prev) for node in handles]
+        version = self.llist.version
+
+        self.llist.reverse()
+        self._assert_links([5, 4, 3, 2, 1])
+        self.assertEqual([(node.next, node.prev) for node in handles], links)
+        self.assertGreater(self.llist.version, version)
+
+        # Handles stay valid and operations follow the new orientation
+        self.llist.remove(handles[4])
+        self.llist.insert_after(handles[0], 0)
+        self.llist.append(-1)
+        self._assert_links([4, 3, 2, 1, 0, -1])
+
+        self.llist.reverse()
+        self._assert_links([-1, 0, 1, 2, 3, 4])
+
+    def test_reverse_does_not_affect_other_lists(self):
+        """Test each list flips only its own nodes"""
+        other = DoublyLinkedList()
+        other.extend([1, 2, 3])
+        self.llist.extend([1, 2, 3])
+        self.llist.reverse()
+        self.assertEqual(list(self.llist), [3, 2, 1])
+        self.assertEqual(list(other), [1, 2, 3])
+
+    def test_find_middle_matches_multiple_pass(self):
+        """Test find_middle agrees with MultiplePassLinkedList, reversed or not"""
+        for length in range(0, 10):
+            with self.subTest(length=length):
+                llist = DoublyLinkedList()
+                llist.extend(range(length))
+                llist.reverse()
+                reference = MultiplePassLinkedList()
+                reference.extend(reversed(range(length)))
+                self.assertEqual(llist.find_middle(), reference.find_middle())
+
+    def test_cycle_detection(self):
+        """Test cycle creation and detection, and that edits refuse cycles"""
+        handles = [self.llist.append(i) for i in range(1, 6)]
+        self.llist.reverse()
+        self.assertIsNone(self.llist.find_cycle_start())
+        self.assertTrue(self.llist.create_cycle(1))
+        for method in ("floyd", "brent"):
+            with self.subTest(method=method):
+                self.assertEqual(self.llist.find_cycle_start(method=method), 4)
+        self.assertEqual(str(self.llist), "5 -> 4 -> 3 -> 2 -> 1 -> (cycle back to 4)")
+
+        for operation in (self.llist.reverse,
+                          lambda: self.llist.remove(handles[2]),
+                          lambda: self.llist.insert_after(handles[2], 0)):
+            with self.assertRaises(ValueError):
+                operation()
+
+        self.llist.append(0)  # Spliced in before the back-edge
+        self.assertEqual(self.llist.find_cycle().length, 5)
+
+    def test_delete_node(self):
+        """Test deleting by value, first occurrence only"""
+        self.llist.extend([1, 2, 1, 3])
+        self.assertTrue(self.llist.delete_node(1))
+        self.assertFalse(self.llist.delete_node(99))
+        self._assert_links([2, 1, 3])
+
+    def test_copy_and_pickle(self):
+        """Test copies keep the logical order and reverse independently"""
+        self.llist.extend([1, 2, 3])
+        self.llist.reverse()
+        for clone in (copy.copy(self.llist), copy.deepcopy(self.llist),
+                      pickle.loads(pickle.dumps(self.llist))):
+            with self.subTest(clone=clone):
+                self.assertEqual(list(clone), [3, 2, 1])
+                clone.reverse()
+                self.assertEqual(list(clone), [1, 2, 3])
+                self.assertEqual(list(self.llist), [3, 2, 1])
+
+    def test_nodes_are_plain_doubly_nodes(self):
+        """Test reverse leaves node types alone and handles pickle"""
+        handles = [self.llist.append(i) for i in range(3)]
+        self.llist.reverse()
+        self.llist.insert_after(handles[1], 1.5)
+        self.assertIs(DoublyLinkedList.node_class, DoublyNode)
+        self.assertTrue(all(type(node) is DoublyNode for node in self.llist.iter_nodes()))
+        self.assertEqual(list(self.llist), [2, 1, 1.5, 0])
+
+        self.llist.remove(handles[0])
+        clone = pickle.loads(pickle.dumps(handles[0]))
+        self.assertIs(type(clone), DoublyNode)
+        self.assertEqual(clone.data, 0)
+
+    def test_random_workload(self):
+        """Test a random mix of operations against a Python list"""
+        rng = random.Random(3)
+        expected, handles = [], []
+        for step in range(500):
+            roll = rng.random()
+            if roll < 0.4 or not handles:
+                handles.append(self.llist.append(step))
+                expected.append(step)
+            elif roll < 0.6:
+                handle = handles[rng.randrange(len(handles))]
+                # Values are unique steps, so index() finds the handle's position
+                expected.insert(expected.index(handle.data) + 1, step)
+                handles.append(self.llist.insert_after(handle, step))
+            elif roll < 0.9:
+                handle = handles.pop(rng.randrange(len(handles)))
+                expected.remove(self.llist.remove(handle))
+            else:
+                self.llist.reverse()
+                expected.reverse()
+            self.assertEqual(list(self.llist), expected, step)
+        self._assert_links(expected)
+
+    def test_hop_tracking_follows_orientation(self):
+        """Test pointer hops are counted correctly across a reverse"""
+        self.llist.extend(range(10))
+        with track_hops(self.llist) as stats:
+            self.llist.reverse()
+            self.assertEqual(list(self.llist), list(range(9, -1, -1)))
+            self.llist._mutated()
+            self.llist.find_middle()
+        self.assertEqual(stats["reverse"].hops, 1)  # Only the cycle check reads a link
+        self.assertGreater(stats["find_middle"].hops, 0)
+        self.assertEqual(list(self.llist), list(range(9, -1, -1)))
+        self.llist.reverse()
+        self._assert_links(list(range(10)))
+
+    def test_reverse_is_not_counted_as_hops(self):
+        """Test applying a pending reversal adds no hops to the next query"""
+        forward = DoublyLinkedList()
+        forward.extend(range(100))
+        self.llist.extend(range(99, -1, -1))
+        self.llist.reverse()
+        hops = []
+        for llist in (forward, self.llist):
+            with track_hops(llist) as stats:
+                self.assertEqual(llist.find_middle(), 50)
+            hops.append(stats["find_middle"].hops)
+        self.assertEqual(hops[0], hops[1])
+
+    def test_merge_takes_nodes_and_invalidates_handles(self):
+        """Test merge_sorted accepts reversed lists and retires their handles"""
+        handles = [self.llist.append(i) for i in (1, 3, 5)]
+        other = DoublyLinkedList()
+        other.extend([4, 2])
+        other.reverse()  # tail.next is a link to 4, yet there is no cycle
+        merged = merge_sorted([self.llist, other])
+        self.assertEqual(list(merged), [1, 2, 3, 4, 5])
+
+        for operation in (lambda: self.llist.remove(handles[1]),
+                          lambda: self.llist.insert_after(handles[0], 2)):
+            with self.assertRaises(ValueError):
+                operation()
+        self.assertEqual(len(self.llist), 0)
+        self.assertEqual(list(merged), [1, 2, 3, 4, 5])
+        self.assertEqual(len(merged), 5)
+
+    def test_split_parts_are_independent(self):
+        """Test split parts keep handles and orientation but reverse alone"""
+        handles = [self.llist.append(i) for i in range(9)]
+        self.llist.reverse()
+        parts = self.llist.split_into(3)
+        expected = [[8, 7, 6], [5, 4, 3], [2, 1, 0]]
+        for part, values in zip(parts, expected):
+            self.llist = part
+            self._assert_links(values)
+
+        parts[1].reverse()
+        parts[1].remove(handles[4])
+        parts[2].insert_after(handles[2], 1.5)
+        with self.assertRaises(ValueError):
+            parts[0].remove(handles[0])
+        for part, values in zip(parts, [[8, 7, 6], [3, 5], [2, 1.5, 1, 0]]):
+            self.llist = part
+            self._assert_links(values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.instrumentation import HopStats, track_hops
+from src.linked_list_base import LinkedList, Node
+from src.multiple_pass import MultiplePassLinkedList
+from src.slow_fast import SlowFastLinkedList
+from src.temporary_head import TemporaryHeadLinkedList
+
+
+class TestHopStats(unittest.TestCase):
+    def _filled(self, list_class, size=10):
+        """Return a list_class instance holding 0 .. size - 1"""
+        llist = list_class()
+        llist.extend(range(size))
+        return llist
+
+    def test_find_middle_hops(self):
+        """Test hop counts of the two-pass and slow-fast middle finders"""
+        llist = self._filled(MultiplePassLinkedList)
+        with track_hops(llist) as stats:
+            self.assertEqual(llist.find_middle(), 5)
+            llist._mutated()
+            self.assertEqual(llist.find_middle(method="slow_fast"), 5)
+
+        # Two passes: n reads to count, n // 2 to reach the middle
+        self.assertEqual(stats["find_middle[two_pass]"].hops, 15)
+        self.assertEqual(stats["find_middle[two_pass]"].visits, 1)
+        self.assertEqual(stats["find_middle[slow_fast]"].calls, 1)
+        self.assertGreater(stats["find_middle[slow_fast]"].hops, 0)
+
+    def test_floyd_and_brent_are_recorded_separately(self):
+        """Test that method arguments split the counters"""
+        llist = self._filled(SlowFastLinkedList, 20)
+        llist.create_cycle(5)
+        with track_hops(llist) as stats:
+            for method in ("floyd", "brent"):
+                llist._mutated()
+                self.assertEqual(llist.find_cycle_start(method=method), 5)
+
+        self.assertEqual(set(stats.operations),
+                         {"find_cycle_start[floyd]", "find_cycle_start[brent]"})
+        self.assertGreater(stats["find_cycle_start[floyd]"].hops, 0)
+        self.assertGreater(stats["find_cycle_start[brent]"].hops, 0)
+        self.assertTrue(all(type(node) is Node for node in llist.iter_nodes()))
+
+    def test_delete_reverse_and_len(self):
+        """Test counts for deletion, reversal and the O(1) length"""
+        llist = self._filled(TemporaryHeadLinkedList)
+        with track_hops(llist) as stats:
+            self.assertTrue(llist.delete_node(3))
+            self.assertFalse(llist.delete_node(99))
+            llist.reverse()
+            self.assertEqual(len(llist), 9)
+
+        delete = stats["delete_node"]
+        self.assertEqual(delete.calls, 2)
+        self.assertEqual(delete.visits, 4 + 9)
+        self.assertEqual(stats["reverse"].hops, 9)
+        self.assertEqual(stats["__len__"].hops, 0)
+        self.assertEqual(stats["__len__"].calls, 1)
+        self.assertEqual(list(llist), [9, 8, 7, 6, 5, 4, 2, 1, 0])
+
+    def test_memoized_calls_record_zero_hops(self):
+        """Test that a repeated query between writes costs no hops"""
+        llist = self._filled(MultiplePassLinkedList)
+        llist.find_middle()
+        with track_hops(llist) as stats:
+            llist.find_middle()
+        self.assertEqual(stats["find_middle[two_pass]"].calls, 1)
+        self.assertEqual(stats["find_middle[two_pass]"].hops, 0)
+
+    def test_tracking_is_undone_on_exit(self):
+        """Test that the list and every node get their plain classes back"""
+        llist = self._filled(TemporaryHeadLinkedList)
+        deleted = llist.head
+        with self.assertRaises(RuntimeError):
+            with track_hops(llist):
+                self.assertIsNot(type(llist), TemporaryHeadLinkedList)
+                llist.delete_node(0)
+                llist.append(10)
+                raise RuntimeError("fail inside the block")
+
+        self.assertIs(type(llist), TemporaryHeadLinkedList)
+        self.assertNotIn("node_class", vars(llist))
+        self.assertIs(llist.node_class, Node)
+        self.assertIs(type(deleted), Node)
+        self.assertTrue(all(type(node) is Node for node in llist.iter_nodes()))
+
+    def test_untracked_lists_are_not_counted(self):
+        """Test that only the tracked list records, and stats can be shared"""
+        tracked = self._filled(MultiplePassLinkedList)
+        untracked = self._filled(MultiplePassLinkedList)
+        stats = HopStats()
+        with stats.track(tracked):
+            untracked.find_middle()
+        with track_hops(tracked, stats):
+            tracked.find_middle()
+        self.assertEqual(stats["find_middle[two_pass]"].calls, 1)
+
+        stats.reset()
+        self.assertEqual(stats.operations, {})
+        self.assertEqual(stats["find_middle[two_pass]"].hops_per_call, 0.0)
+
+    def test_str_table(self):
+        """Test the printable per-operation report"""
+        llist = self._filled(LinkedList)
+        with track_hops(llist) as stats:
+            len(llist)
+        table = str(stats).splitlines()
+        self.assertIn("hops/call", table[0])
+        self.assertTrue(table[1].startswith("__len__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,14 @@
 import unittest
+import copy
+import pickle
 from io import StringIO
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from src.linked_list_base import Node, LinkedList
+from src.linked_list_base import Node, NodePool, LinkedList
+from src.multiple_pass import MultiplePassLinkedList
+from src.slow_fast import SlowFastLinkedList
+from src.temporary_head import TemporaryHeadLinkedList, merge_sorted
 
 
 class TestNode(unittest.TestCase):
@@ -23,6 +28,13 @@ class TestNode(unittest.TestCase):
         self.assertEqual(node1.next.data, 2)
         self.assertIsNone(node2.next)
 
+    def test_node_is_slot_based(self):
+        """Test Node uses __slots__ and has no per-instance __dict__"""
+        node = Node(5)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
 
 class TestLinkedList(unittest.TestCase):
     def setUp(self):
@@ -72,6 +84,175 @@ class TestLinkedList(unittest.TestCase):
         current = current.next
         self.assertEqual(current.data, [1, 2, 3])
 
+    def test_tail_tracks_last_appended_node(self):
+        """Test that tail points to the last node after every append"""
+        self.assertIsNone(self.llist.tail)
+        for i in range(1, 6):
+            self.llist.append(i)
+            self.assertEqual(self.llist.tail.data, i)
+            self.assertIsNone(self.llist.tail.next)
+
+    def test_extend(self):
+        """Test extending with an iterable links all items in order"""
+        self.llist.append(1)
+        self.llist.extend([2, 3])
+        self.llist.extend(x for x in (4, 5))
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> 5 -> None")
+        self.assertEqual(self.llist.tail.data, 5)
+        self.assertIsNone(self.llist.tail.next)
+
+    def test_extend_empty_list_and_empty_iterable(self):
+        """Test extending an empty list, and extending with nothing"""
+        self.llist.extend([])
+        self.assertIsNone(self.llist.head)
+        self.assertIsNone(self.llist.tail)
+
+        self.llist.extend(["a", "b"])
+        self.assertEqual(self.llist.head.data, "a")
+        self.assertEqual(self.llist.tail.data, "b")
+
+        tail = self.llist.tail
+        self.llist.extend([])
+        self.assertIs(self.llist.tail, tail)
+
+    def test_len_tracks_append_and_extend(self):
+        """Test len() follows append and extend without re-counting"""
+        self.assertEqual(len(self.llist), 0)
+        self.llist.append(1)
+        self.assertEqual(len(self.llist), 1)
+        self.llist.extend(range(2, 11))
+        self.assertEqual(len(self.llist), 10)
+        self.assertEqual(self.llist._count_nodes(), 10)
+
+    def test_len_debug_mode_detects_out_of_sync_counter(self):
+        """Test debug mode checks the size counter against a traversal"""
+        self.llist.extend([1, 2, 3])
+        LinkedList.debug = True
+        try:
+            self.assertEqual(len(self.llist), 3)
+            self.llist._size = 5
+            with self.assertRaises(AssertionError):
+                len(self.llist)
+        finally:
+            LinkedList.debug = False
+
+    def test_custom_node_class(self):
+        """Test append and extend build nodes with node_class"""
+        class TaggedNode(Node):
+            __slots__ = ()
+
+        self.llist.node_class = TaggedNode
+        self.llist.append(1)
+        self.llist.extend([2, 3])
+
+        current = self.llist.head
+        while current:
+            self.assertIsInstance(current, TaggedNode)
+            current = current.next
+
+    def test_version_increments_on_mutation(self):
+        """Test the mutation version changes with every append and extend"""
+        version = self.llist.version
+        self.llist.append(1)
+        self.assertGreater(self.llist.version, version)
+
+        version = self.llist.version
+        self.llist.extend([2, 3])
+        self.assertGreater(self.llist.version, version)
+
+        version = self.llist.version
+        str(self.llist)
+        len(self.llist)
+        self.assertEqual(self.llist.version, version)
+
+    def test_iter_values_and_nodes(self):
+        """Test lazy iteration over values and over nodes"""
+        self.assertEqual(list(self.llist), [])
+        self.llist.extend(["a", "b", "c"])
+
+        self.assertEqual(list(self.llist), ["a", "b", "c"])
+        nodes = list(self.llist.iter_nodes())
+        self.assertIs(nodes[0], self.llist.head)
+        self.assertIs(nodes[-1], self.llist.tail)
+        self.assertEqual([node.data for node in nodes], ["a", "b", "c"])
+
+    def test_acyclic_traversals_skip_cycle_detection(self):
+        """Test that a tail ending the list spares iteration, str and repr a Brent pass"""
+        self.llist.extend(range(5))
+        self.llist._brent = lambda: self.fail("cycle detection ran on an acyclic list")
+
+        self.assertEqual(next(iter(self.llist)), 0)
+        self.assertEqual(str(self.llist), "0 -> 1 -> 2 -> 3 -> 4 -> None")
+        self.assertEqual(repr(self.llist), "LinkedList([0, 1, 2, 3, 4], len=5)")
+
+    def test_extend_keeps_items_taken_before_an_error(self):
+        """Test a failing iterable leaves a consistent, partly extended list"""
+        def failing_reader():
+            yield 1
+            yield 2
+            raise OSError("read failed")
+
+        for llist in (LinkedList(), MultiplePassLinkedList(track_middle=True)):
+            with self.subTest(llist=type(llist).__name__):
+                llist.append(0)
+                with self.assertRaises(OSError):
+                    llist.extend(failing_reader())
+                self.assertEqual(len(llist), 3)
+                self.assertEqual(llist.tail.data, 2)
+                llist.append(3)
+                self.assertEqual(list(llist), [0, 1, 2, 3])
+                self.assertEqual(len(llist), llist._count_nodes())
+
+        self.assertEqual(llist.find_middle(), 2)  # The tracked middle moved too
+
+    def test_extend_with_itself(self):
+        """Test extending a list with itself doubles it once"""
+        self.llist.extend([1, 2])
+        self.llist.extend(self.llist)
+        self.assertEqual(list(self.llist), [1, 2, 1, 2])
+
+    def test_write_to_streams_in_chunks(self):
+        """Test write_to writes one joined chunk per chunk_size nodes"""
+        class RecordingFile:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, text):
+                self.writes.append(text)
+                return len(text)
+
+        self.llist.extend(range(1, 6))
+        fp = RecordingFile()
+        written = self.llist.write_to(fp, chunk_size=2)
+
+        self.assertEqual(fp.writes, ["1 -> 2 -> ", "3 -> 4 -> ", "5 -> None"])
+        self.assertEqual("".join(fp.writes), str(self.llist))
+        self.assertEqual(written, len(str(self.llist)))
+
+        with self.assertRaises(ValueError):
+            self.llist.write_to(fp, chunk_size=0)
+
+    def test_write_to_empty_list(self):
+        """Test streaming an empty list writes just the end marker"""
+        fp = StringIO()
+        self.llist.write_to(fp)
+        self.assertEqual(fp.getvalue(), "None")
+
+    def test_repr_is_bounded(self):
+        """Test repr shows a limited number of abbreviated values"""
+        self.assertEqual(repr(self.llist), "LinkedList([], len=0)")
+
+        self.llist.extend([1, "two"])
+        self.assertEqual(repr(self.llist), "LinkedList([1, 'two'], len=2)")
+
+        long_list = LinkedList()
+        long_list.extend(range(100_000))
+        long_list.append("x" * 10_000)
+        text = repr(long_list)
+        self.assertTrue(text.startswith("LinkedList([0, 1, 2,"))
+        self.assertIn("...], len=100001)", text)
+        self.assertLess(len(text), 200)
+
     def test_print_list_empty(self):
         """Test printing an empty list"""
         captured_output = StringIO()
@@ -108,5 +289,189 @@ class TestLinkedList(unittest.TestCase):
         self.assertEqual(captured_output.getvalue().strip(), "1 -> 2 -> 3 -> 4 -> 5 -> None")
 
 
+class TestCopyAndPickle(unittest.TestCase):
+    LIST_CLASSES = [LinkedList, MultiplePassLinkedList, SlowFastLinkedList,
+                    TemporaryHeadLinkedList]
+
+    def _values(self, llist):
+        """Helper method to list the values of an acyclic list"""
+        result = []
+        current = llist.head
+        while current:
+            result.append(current.data)
+            current = current.next
+        return result
+
+    def test_long_lists_round_trip(self):
+        """Test pickle, copy and deepcopy work well past the recursion limit"""
+        length = sys.getrecursionlimit() * 5
+        for list_class in self.LIST_CLASSES:
+            llist = list_class()
+            llist.extend(range(length))
+            copies = [
+                pickle.loads(pickle.dumps(llist, protocol=pickle.HIGHEST_PROTOCOL)),
+                pickle.loads(pickle.dumps(llist, protocol=0)),
+                copy.copy(llist),
+                copy.deepcopy(llist),
+            ]
+            for result in copies:
+                with self.subTest(list_class=list_class.__name__):
+                    self.assertIs(type(result), list_class)
+                    self.assertEqual(len(result), length)
+                    self.assertEqual(self._values(result), list(range(length)))
+                    self.assertIsNot(result.head, llist.head)
+                    self.assertEqual(result.tail.data, length - 1)
+
+    def test_cycle_is_preserved(self):
+        """Test a cycle made by create_cycle survives pickling and copying"""
+        llist = SlowFastLinkedList()
+        llist.extend(range(1, 2001))
+        llist.create_cycle(10)
+
+        for result in (pickle.loads(pickle.dumps(llist)), copy.copy(llist),
+                       copy.deepcopy(llist)):
+            self.assertEqual(len(result), 2000)
+            self.assertEqual(result.find_cycle_start(), 11)
+            self.assertIs(result.tail.next, result.find_cycle().start)
+
+    def test_shallow_and_deep_copy_of_data(self):
+        """Test copy shares data objects and deepcopy duplicates them"""
+        llist = LinkedList()
+        llist.extend([[1], [2]])
+
+        shallow = copy.copy(llist)
+        deep = copy.deepcopy(llist)
+        self.assertIs(shallow.head.data, llist.head.data)
+        self.assertIsNot(deep.head.data, llist.head.data)
+        self.assertEqual(deep.head.data, [1])
+
+        shallow.append([3])
+        self.assertEqual(len(llist), 2)
+
+    def test_settings_are_preserved(self):
+        """Test instance settings like track_middle survive a round trip"""
+        llist = MultiplePassLinkedList(track_middle=True)
+        llist.extend(range(1, 6))
+
+        result = pickle.loads(pickle.dumps(llist))
+        self.assertTrue(result.track_middle)
+        self.assertEqual(result.find_middle(), 3)
+        result.append(6)
+        self.assertEqual(result.find_middle(), 4)
+
+
+
+class TestNodePool(unittest.TestCase):
+    def _pooled(self, list_class, values, **kwargs):
+        """Return a list of list_class using a fresh NodePool"""
+        llist = list_class(**kwargs)
+        llist.node_class = NodePool()
+        llist.extend(values)
+        return llist
+
+    def test_deleted_nodes_are_reused(self):
+        """Test that an append after a delete reuses the unlinked node"""
+        llist = self._pooled(TemporaryHeadLinkedList, [1, 2, 3])
+        pool = llist.node_class
+        second = llist.head.next
+        self.assertTrue(llist.delete_node(2))
+        self.assertEqual(len(pool), 1)
+        self.assertIsNone(second.data)
+
+        llist.append(4)
+        self.assertIs(llist.tail, second)
+        self.assertEqual(list(llist), [1, 3, 4])
+        self.assertEqual(pool.allocated, 3)
+        self.assertEqual(len(pool), 0)
+
+    def test_release_limits(self):
+        """Test max_size and foreign node classes are respected"""
+        pool = NodePool(max_size=2)
+        for _ in range(3):
+            pool.release(Node(1))
+        pool.release(object.__new__(type("OtherNode", (Node,), {"__slots__": ()})))
+        self.assertEqual(len(pool), 2)
+        node = pool("x")
+        self.assertEqual((node.data, node.next), ("x", None))
+        self.assertEqual(pool.allocated, 0)
+
+    def test_batch_and_indexed_deletes_recycle(self):
+        """Test every unlinked node is recycled without disturbing the walk"""
+        for indexed in (False, True):
+            with self.subTest(indexed=indexed):
+                llist = self._pooled(TemporaryHeadLinkedList, range(10), indexed=indexed)
+                self.assertEqual(llist.delete_where(lambda x: x % 2), 5)
+                self.assertEqual(list(llist), [0, 2, 4, 6, 8])
+                self.assertTrue(llist.delete_node(4))
+                self.assertEqual(llist.delete_all([0, 8]), 2)
+                self.assertEqual(list(llist), [2, 6])
+                self.assertEqual(len(llist.node_class), 8)
+
+                llist.extend(range(20, 28))
+                self.assertEqual(list(llist), [2, 6] + list(range(20, 28)))
+                self.assertEqual(llist.node_class.allocated, 10)
+
+    def test_multiple_pass_delete_recycles(self):
+        """Test the tracked middle survives recycled deletions"""
+        llist = self._pooled(MultiplePassLinkedList, range(7), track_middle=True)
+        for value in (3, 0, 6):
+            llist.delete_node(value)
+            llist.append(value + 10)
+            self.assertEqual(llist.find_middle(), llist._find_middle_two_pass())
+        self.assertEqual(llist.node_class.allocated, 7)
+
+    def test_temporary_head_is_reused(self):
+        """Test deletion and reversal share one sentinel per list"""
+        llist = TemporaryHeadLinkedList()
+        llist.extend([1, 2, 3])
+        sentinel = llist._temporary_head()
+        llist.delete_node(1)
+        llist.reverse()
+        self.assertIs(llist._temporary_head(), sentinel)
+        self.assertIs(sentinel.next, llist.head)
+        self.assertEqual(list(llist), [3, 2])
+        self.assertIsNot(TemporaryHeadLinkedList()._temporary_head(), sentinel)
+
+    def test_temporary_head_is_unlinked_after_use(self):
+        """Test the sentinel does not keep nodes alive after an operation"""
+        operations = {
+            "delete_node": lambda llist: llist.delete_node(3),
+            "delete_node_missing": lambda llist: llist.delete_node(99),
+            "delete_all": lambda llist: llist.delete_all([1, 2, 3]),
+            "reverse": lambda llist: llist.reverse(),
+            "sort": lambda llist: llist.sort(reverse=True),
+        }
+        for name, operation in operations.items():
+            with self.subTest(operation=name):
+                llist = TemporaryHeadLinkedList()
+                llist.extend([1, 2, 3])
+                operation(llist)
+                self.assertIsNone(llist._sentinel.next)
+
+        llist = MultiplePassLinkedList()
+        llist.extend([1, 2, 3])
+        llist.delete_node(1)
+        llist.delete_node(99)
+        self.assertIsNone(llist._sentinel.next)
+
+        first, second = TemporaryHeadLinkedList(), TemporaryHeadLinkedList()
+        first.extend([1, 3])
+        second.extend([2])
+        merged = merge_sorted([first, second])
+        self.assertEqual(list(merged), [1, 2, 3])
+        self.assertIsNone(merged._sentinel.next)
+
+    def test_pool_pickles_empty(self):
+        """Test that copies and pickles get an empty pool with the same settings"""
+        llist = self._pooled(TemporaryHeadLinkedList, [1, 2, 3])
+        llist.node_class.max_size = 5
+        llist.delete_node(2)
+        clone = pickle.loads(pickle.dumps(llist))
+        self.assertIsInstance(clone.node_class, NodePool)
+        self.assertEqual(clone.node_class.max_size, 5)
+        self.assertEqual(len(clone.node_class), 0)
+        self.assertEqual(list(clone), [1, 3])
+        self.assertIs(copy.copy(llist).node_class, llist.node_class)
+
 if __name__ == '__main__':
     unittest.main()
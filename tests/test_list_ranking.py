@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.array_linked_list import ArrayLinkedList
+from src.multiple_pass import MultiplePassLinkedList
+from src import list_ranking
+
+
+@unittest.skipIf(list_ranking.np is None, "NumPy is not installed")
+class TestListRanking(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.llist = ArrayLinkedList()
+
+    def test_pointer_jump_distances(self):
+        """Test distances to the end of a chain stored out of order"""
+        # Chain: 2 -> 0 -> 3 -> 1
+        result = list_ranking.pointer_jump([3, -1, 0, 1])
+        self.assertEqual(result.tolist(), [2, 0, 3, 1])
+
+    def test_list_ranks_in_order(self):
+        """Test ranks of a freshly built list follow the slot order"""
+        self.llist.extend(range(10))
+        self.assertEqual(list_ranking.list_ranks(self.llist).tolist(), list(range(10)))
+
+    def test_list_ranks_after_reverse_delete_and_cycle(self):
+        """Test ranks ignore freed slots and cut a created cycle"""
+        self.llist.extend(["a", "b", "c", "d", "e"])
+        self.llist.delete_node("b")
+        self.llist.reverse()  # e -> d -> c -> a
+        self.llist.create_cycle(1)
+
+        ranks = list_ranking.list_ranks(self.llist)
+        self.assertEqual(ranks.tolist(), [3, -1, 2, 1, 0])
+
+    def test_list_order(self):
+        """Test list_order returns slots from head to tail"""
+        self.llist.extend(range(5))
+        self.llist.delete_node(0)
+        self.llist.reverse()
+        order = list_ranking.list_order(self.llist)
+        self.assertEqual([self.llist.data[slot] for slot in order], [4, 3, 2, 1])
+
+    def test_kth_element(self):
+        """Test positional lookup and out-of-range positions"""
+        self.llist.extend(range(100, 110))
+        self.llist.reverse()
+        for k in range(10):
+            self.assertEqual(list_ranking.kth_element(self.llist, k), 109 - k)
+        with self.assertRaises(IndexError):
+            list_ranking.kth_element(self.llist, 10)
+        with self.assertRaises(IndexError):
+            list_ranking.kth_element(self.llist, -1)
+
+    def test_find_middle_matches_multiple_pass(self):
+        """Test find_middle agrees with MultiplePassLinkedList"""
+        self.assertIsNone(list_ranking.find_middle(self.llist))
+        for length in range(1, 40):
+            with self.subTest(length=length):
+                array_list = ArrayLinkedList()
+                node_list = MultiplePassLinkedList()
+                array_list.extend(range(length))
+                node_list.extend(range(length))
+                self.assertEqual(list_ranking.find_middle(array_list),
+                                 node_list.find_middle())
+
+
+if __name__ == '__main__':
+    unittest.main()
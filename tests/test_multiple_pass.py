@@ -1,4 +1,5 @@
 import unittest
+import random
 import os
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -86,6 +87,85 @@ class TestMultiplePassLinkedList(unittest.TestCase):
         result = self.llist.find_middle()
         self.assertEqual(result, 3.14)  # Middle element
 
+    def test_find_middle_is_memoized_until_mutation(self):
+        """Test repeated calls reuse the result until the list changes"""
+        for i in range(1, 6):
+            self.llist.append(i)
+
+        calls = []
+        compute = self.llist._find_middle_two_pass
+        self.llist._find_middle_two_pass = lambda: calls.append(1) or compute()
+
+        for _ in range(3):
+            self.assertEqual(self.llist.find_middle(), 3)
+        self.assertEqual(len(calls), 1)
+
+        self.llist.append(6)
+        self.assertEqual(self.llist.find_middle(), 4)
+        self.assertEqual(len(calls), 2)
+
+    def test_delete_node(self):
+        """Test deleting head, middle, tail and missing values"""
+        for i in range(1, 6):
+            self.llist.append(i)
+
+        self.assertTrue(self.llist.delete_node(1))
+        self.assertTrue(self.llist.delete_node(5))
+        self.assertFalse(self.llist.delete_node(99))
+        self.assertEqual(str(self.llist), "2 -> 3 -> 4 -> None")
+        self.assertEqual(self.llist.tail.data, 4)
+        self.assertEqual(len(self.llist), 3)
+        self.assertEqual(self.llist.find_middle(), 3)
+
+    def test_track_middle_append_and_extend(self):
+        """Test the tracked middle matches the two-pass result while growing"""
+        tracked = MultiplePassLinkedList(track_middle=True)
+        self.assertIsNone(tracked.find_middle())
+        for i in range(1, 12):
+            tracked.append(i)
+            self.assertEqual(tracked.find_middle(), tracked._find_middle_two_pass())
+
+        tracked.extend(range(12, 20))
+        self.assertEqual(tracked.find_middle(), tracked._find_middle_two_pass())
+        tracked.extend([])
+        self.assertEqual(tracked.find_middle(), 10)
+
+        empty = MultiplePassLinkedList(track_middle=True)
+        empty.extend([1, 2, 3, 4])
+        self.assertEqual(empty.find_middle(), 3)
+
+    def test_track_middle_deletions(self):
+        """Test deletions before, at and after the middle keep it correct"""
+        for length in range(1, 9):
+            for position in range(length):
+                with self.subTest(length=length, position=position):
+                    tracked = MultiplePassLinkedList(track_middle=True)
+                    tracked.extend(range(length))
+                    tracked.delete_node(position)
+                    self.assertEqual(tracked.find_middle(), tracked._find_middle_two_pass())
+
+    def test_track_middle_random_workload(self):
+        """Test the tracked middle through a random mix of appends and deletes"""
+        rng = random.Random(7)
+        tracked = MultiplePassLinkedList(track_middle=True)
+        for step in range(500):
+            if rng.random() < 0.6:
+                tracked.append(rng.randrange(20))
+            else:
+                tracked.delete_node(rng.randrange(20))
+            self.assertEqual(tracked.find_middle(), tracked._find_middle_two_pass(), step)
+
+    def test_find_middle_slow_fast_method(self):
+        """Test the single-pass method agrees with the two-pass default"""
+        for length in range(0, 12):
+            with self.subTest(length=length):
+                llist = MultiplePassLinkedList()
+                llist.extend(range(length))
+                self.assertEqual(llist.find_middle(method="slow_fast"), llist.find_middle())
+
+        with self.assertRaises(ValueError):
+            self.llist.find_middle(method="three_pass")
+
     def test_multiple_pass_technique_verification(self):
         """Test that the method actually uses two passes"""
         # This test verifies the algorithm works correctly
@@ -0,0 +1,159 @@
+import copy
+import pickle
+import random
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.linked_list_base import NodePool
+from src.multiple_pass import MultiplePassLinkedList
+from src.skip_list import SkipLinkedList, SkipNode
+from src.temporary_head import merge_sorted
+
+
+class TestSkipLinkedList(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.llist = SkipLinkedList()
+
+    def _assert_lanes_consistent(self):
+        """Helper method checking every lane link skips exactly its width"""
+        positions = {id(node): i for i, node in enumerate(self.llist.iter_nodes())}
+        header = self.llist._header
+        for level in range(len(header.lanes)):
+            node, position = header, -1
+            while node.lanes[level] is not None:
+                position += node.widths[level]
+                node = node.lanes[level]
+                self.assertEqual(positions[id(node)], position)
+        if self.llist.head is None:
+            self.assertIsNone(self.llist.tail)
+            self.assertEqual(header.lanes, [])
+        else:
+            self.assertIsNone(self.llist.tail.next)
+
+    def test_empty_list(self):
+        """Test indexing and deleting from an empty list"""
+        self.assertEqual(len(self.llist), 0)
+        self.assertIsNone(self.llist.find_middle())
+        with self.assertRaises(IndexError):
+            self.llist[0]
+        with self.assertRaises(IndexError):
+            self.llist.delete_at(-1)
+
+    def test_getitem(self):
+        """Test positive and negative indexes on a list built by extend"""
+        self.llist.extend(range(100))
+        self.llist.append(100)
+        self.assertEqual([self.llist[i] for i in range(101)], list(range(101)))
+        self.assertEqual(self.llist[-1], 100)
+        self.assertEqual(self.llist[-101], 0)
+        for index in (101, -102):
+            with self.assertRaises(IndexError):
+                self.llist[index]
+        with self.assertRaises(TypeError):
+            self.llist["1"]
+        self._assert_lanes_consistent()
+
+    def test_insert_clamps_like_list_insert(self):
+        """Test insert at the ends, in the middle and out of range"""
+        expected = []
+        for index, value in [(0, 1), (5, 3), (1, 2), (-1, 2.5), (-10, 0), (0, -1)]:
+            self.llist.insert(index, value)
+            expected.insert(index, value)
+        self.assertEqual(list(self.llist), expected)
+        self.assertEqual(self.llist.head.data, -1)
+        self.assertEqual(self.llist.tail.data, 3)
+        self._assert_lanes_consistent()
+
+    def test_delete_at(self):
+        """Test deleting the head, the tail and a middle value"""
+        self.llist.extend(range(10))
+        self.assertEqual(self.llist.delete_at(0), 0)
+        self.assertEqual(self.llist.delete_at(-1), 9)
+        self.assertEqual(self.llist.delete_at(3), 4)
+        self.assertEqual(list(self.llist), [1, 2, 3, 5, 6, 7, 8])
+        self.assertEqual(self.llist.tail.data, 8)
+        self._assert_lanes_consistent()
+
+        while len(self.llist):
+            self.llist.delete_at(len(self.llist) // 2)
+        self._assert_lanes_consistent()
+
+    def test_find_middle_matches_multiple_pass(self):
+        """Test find_middle agrees with MultiplePassLinkedList for many lengths"""
+        for length in range(1, 40):
+            with self.subTest(length=length):
+                self.llist = SkipLinkedList()
+                node_list = MultiplePassLinkedList()
+                self.llist.extend(range(length))
+                node_list.extend(range(length))
+                self.assertEqual(self.llist.find_middle(), node_list.find_middle())
+
+    def test_extend_keeps_items_taken_before_an_error(self):
+        """Test a failing iterable leaves the chain, lanes and length in step"""
+        def failing_reader():
+            yield from range(1, 200)
+            raise OSError("read failed")
+
+        self.llist.append(0)
+        with self.assertRaises(OSError):
+            self.llist.extend(failing_reader())
+        self.assertEqual(len(self.llist), 200)
+        self.assertEqual(self.llist.tail.data, 199)
+        self.assertEqual([self.llist[i] for i in range(200)], list(range(200)))
+        self.llist.insert(100, -1)
+        self.assertEqual(self.llist.delete_at(100), -1)
+        self.llist.append(200)
+        self.assertEqual(list(self.llist), list(range(201)))
+        self._assert_lanes_consistent()
+
+    def test_copy_pickle_and_merge(self):
+        """Test copies rebuild their lanes, and merging takes the nodes"""
+        self.llist.extend(range(0, 20, 2))
+        for clone in (copy.copy(self.llist), pickle.loads(pickle.dumps(self.llist))):
+            self.assertIsInstance(clone, SkipLinkedList)
+            self.assertEqual([clone[i] for i in range(10)], list(range(0, 20, 2)))
+
+        other = SkipLinkedList()
+        other.extend(range(1, 20, 2))
+        merged = merge_sorted([self.llist, other])
+        self.assertEqual(list(merged), list(range(20)))
+        self.assertEqual(len(self.llist), 0)
+        self._assert_lanes_consistent()
+        self.llist.extend([1, 2])
+        self.assertEqual(self.llist[1], 2)
+
+    def test_random_workload_matches_list(self):
+        """Test every operation against a Python list, with and without a NodePool"""
+        for use_pool in (False, True):
+            rng = random.Random(int(use_pool))
+            self.llist = SkipLinkedList()
+            if use_pool:
+                self.llist.node_class = NodePool(SkipNode)
+            expected = []
+            for step in range(500):
+                roll = rng.random()
+                if roll < 0.3:
+                    index = rng.randrange(-len(expected) - 2, len(expected) + 3)
+                    self.llist.insert(index, step)
+                    expected.insert(index, step)
+                elif roll < 0.4:
+                    values = list(range(rng.randrange(10)))
+                    self.llist.extend(values)
+                    expected.extend(values)
+                elif roll < 0.85 and expected:
+                    index = rng.randrange(-len(expected), len(expected))
+                    self.assertEqual(self.llist.delete_at(index), expected.pop(index))
+                elif expected:
+                    index = rng.randrange(-len(expected), len(expected))
+                    self.assertEqual(self.llist[index], expected[index])
+                with self.subTest(use_pool=use_pool, step=step):
+                    self.assertEqual(list(self.llist), expected)
+                    self.assertEqual(self.llist.find_middle(),
+                                     expected[len(expected) // 2] if expected else None)
+                    self._assert_lanes_consistent()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
+from io import StringIO
 import os
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from src.slow_fast import SlowFastLinkedList
+from src.slow_fast import SlowFastLinkedList, find_middle_streaming
+from src.multiple_pass import MultiplePassLinkedList
 
 
 class TestSlowFastLinkedList(unittest.TestCase):
@@ -154,12 +156,255 @@ class TestSlowFastLinkedList(unittest.TestCase):
         result = self.llist.find_cycle_start()
         self.assertEqual(result, 1)
 
+    def test_tail_after_create_cycle(self):
+        """Test tail stays on the node that closes the cycle"""
+        for i in range(1, 6):
+            self.llist.append(i)
+        tail = self.llist.tail
+
+        self.assertTrue(self.llist.create_cycle(1))
+        self.assertIs(self.llist.tail, tail)
+        self.assertEqual(self.llist.tail.next.data, 2)
+
+        # Appending splices the node in before the back-edge
+        self.llist.append(6)
+        self.assertEqual(self.llist.tail.data, 6)
+        self.assertEqual(self.llist.tail.next.data, 2)
+        self.assertEqual(self.llist.find_cycle_start(), 2)
+
+    def test_len_after_create_cycle(self):
+        """Test len() counts distinct nodes once a cycle exists"""
+        for i in range(1, 6):
+            self.llist.append(i)
+        self.llist.create_cycle(2)
+
+        self.assertEqual(len(self.llist), 5)
+        self.assertEqual(self.llist._count_nodes(), 5)
+
+    def test_str_and_print_list_with_cycle(self):
+        """Test rendering a cyclic list terminates and marks the cycle"""
+        for i in range(1, 6):
+            self.llist.append(i)
+        self.llist.create_cycle(1)
+
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> 5 -> (cycle back to 2)")
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+        self.llist.print_list()
+        sys.stdout = sys.__stdout__
+        self.assertEqual(captured_output.getvalue().strip(),
+                         "1 -> 2 -> 3 -> 4 -> 5 -> (cycle back to 2)")
+
+    def test_iter_and_repr_with_cycle(self):
+        """Test iteration visits each node once and repr shows the cycle"""
+        for i in range(1, 6):
+            self.llist.append(i)
+        self.llist.create_cycle(1)
+
+        self.assertEqual(list(self.llist), [1, 2, 3, 4, 5])
+        self.assertEqual(repr(self.llist), "SlowFastLinkedList([1, 2, 3, 4, 5], len=5, cycle_pos=1)")
+
+    def test_count_nodes_with_cycle_ignores_tail_reference(self):
+        """Test the debug traversal counts distinct nodes without relying on tail"""
+        for i in range(1, 5):
+            self.llist.append(i)
+        # Link nodes by hand so tail is stale: 1 -> 2 -> 3 -> 4 -> 2
+        self.llist.tail.next = self.llist.head.next
+        self.llist._mutated()
+        self.llist.tail = None
+
+        self.assertEqual(self.llist._count_nodes(), 4)
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> (cycle back to 2)")
+
+    def test_cycle_metadata_is_cached_until_mutation(self):
+        """Test repeated traversals reuse detection and mutations invalidate it"""
+        for i in range(1, 6):
+            self.llist.append(i)
+        self.llist.create_cycle(2)
+
+        calls = []
+        detect = self.llist._brent
+        self.llist._brent = lambda: calls.append(1) or detect()
+
+        str(self.llist)
+        str(self.llist)
+        self.llist._count_nodes()
+        self.assertEqual(len(calls), 1)
+
+        self.llist.append(6)
+        self.assertEqual(str(self.llist), "1 -> 2 -> 3 -> 4 -> 5 -> 6 -> (cycle back to 3)")
+        self.assertEqual(len(calls), 2)
+
+    def test_create_cycle_position_past_tail_on_cyclic_list(self):
+        """Test that an out-of-range position is rejected after a cycle exists"""
+        for i in range(1, 4):
+            self.llist.append(i)
+        self.llist.create_cycle(0)
+
+        self.assertFalse(self.llist.create_cycle(3))
+        self.assertEqual(self.llist.find_cycle_start(), 1)
+
+    def test_brent_matches_floyd(self):
+        """Test Brent's engine finds the same cycle start as Floyd's"""
+        for length in range(1, 9):
+            for cycle_pos in range(length):
+                with self.subTest(length=length, cycle_pos=cycle_pos):
+                    test_list = SlowFastLinkedList()
+                    test_list.extend(range(1, length + 1))
+                    test_list.create_cycle(cycle_pos)
+                    self.assertEqual(test_list.find_cycle_start(method="brent"),
+                                     test_list.find_cycle_start(method="floyd"))
+
+        self.assertIsNone(self.llist.find_cycle_start(method="brent"))
+        self.llist.extend([1, 2, 3])
+        self.assertIsNone(self.llist.find_cycle_start(method="brent"))
+
+    def test_find_cycle_metadata(self):
+        """Test find_cycle reports start node, cycle length and tail length"""
+        for i in range(1, 11):
+            self.llist.append(i)
+        self.assertIsNone(self.llist.find_cycle())
+        self.assertIsNone(self.llist.find_cycle(method="brent"))
+
+        # 10 -> 4 gives a tail of 3 nodes and a cycle of 7 nodes
+        self.llist.create_cycle(3)
+        for method in ("floyd", "brent"):
+            with self.subTest(method=method):
+                info = self.llist.find_cycle(method=method)
+                self.assertIs(info.start, self.llist.tail.next)
+                self.assertEqual(info.start.data, 4)
+                self.assertEqual(info.length, 7)
+                self.assertEqual(info.tail_length, 3)
+
+    def test_find_cycle_self_loop_at_head(self):
+        """Test metadata for a single node pointing to itself"""
+        self.llist.append(1)
+        self.llist.create_cycle(0)
+        for method in ("floyd", "brent"):
+            with self.subTest(method=method):
+                info = self.llist.find_cycle(method=method)
+                self.assertEqual((info.start.data, info.length, info.tail_length), (1, 1, 0))
+
+    def test_find_cycle_start_is_memoized_until_mutation(self):
+        """Test cycle queries are cached per method and invalidated by mutators"""
+        for i in range(1, 6):
+            self.llist.append(i)
+
+        calls = []
+        compute = self.llist._find_cycle_start
+        self.llist._find_cycle_start = lambda method: calls.append(method) or compute(method)
+
+        self.assertIsNone(self.llist.find_cycle_start())
+        self.assertIsNone(self.llist.find_cycle_start())
+        self.assertEqual(calls, ["floyd"])
+
+        self.llist.create_cycle(1)
+        self.assertEqual(self.llist.find_cycle_start(), 2)
+        self.assertEqual(self.llist.find_cycle_start(method="brent"), 2)
+        self.assertEqual(self.llist.find_cycle_start(method="brent"), 2)
+        self.assertEqual(calls, ["floyd", "floyd", "brent"])
+
+        info = self.llist.find_cycle()
+        self.assertIs(self.llist.find_cycle(), info)
+
+    def test_find_cycle_unknown_method(self):
+        """Test an unknown engine name is rejected"""
+        with self.assertRaises(ValueError):
+            self.llist.find_cycle_start(method="hare")
+        with self.assertRaises(ValueError):
+            self.llist.find_cycle(method="hare")
+
+    def test_find_middle_single_pass(self):
+        """Test slow-fast find_middle matches the two-pass result"""
+        self.assertIsNone(self.llist.find_middle())
+        for length in range(1, 12):
+            with self.subTest(length=length):
+                test_list = SlowFastLinkedList()
+                reference = MultiplePassLinkedList()
+                test_list.extend(range(length))
+                reference.extend(range(length))
+                self.assertEqual(test_list.find_middle(), reference.find_middle())
+
+    def test_find_middle_with_cycle(self):
+        """Test find_middle terminates on a cyclic list"""
+        for i in range(1, 8):
+            self.llist.append(i)
+        self.llist.create_cycle(2)
+        self.assertEqual(self.llist.find_middle(), 4)
+
+    def test_find_middle_streaming(self):
+        """Test the one-pass middle over iterators, sized iterables and sequences"""
+        for length in range(0, 12):
+            expected = length // 2 if length else None
+            with self.subTest(length=length):
+                self.assertEqual(find_middle_streaming(iter(range(length))), expected)
+                self.assertEqual(find_middle_streaming(x for x in range(length)), expected)
+                self.assertEqual(find_middle_streaming(range(length)), expected)
+                self.assertEqual(find_middle_streaming(list(range(length))), expected)
+
+        linked = SlowFastLinkedList()
+        linked.extend("abcde")
+        self.assertEqual(find_middle_streaming(linked), "c")
+        self.assertEqual(find_middle_streaming({"only": 1}), "only")
+
     def test_create_cycle_empty_list(self):
         """Test creating cycle on empty list"""
         self.llist.create_cycle(0)
         result = self.llist.find_cycle_start()
         self.assertIsNone(result)
 
+    def _assert_part(self, part, expected):
+        """Check a split part's values, length, tail and class"""
+        self.assertIsInstance(part, SlowFastLinkedList)
+        self.assertEqual(list(part), expected)
+        self.assertEqual(len(part), len(expected))
+        if expected:
+            self.assertEqual(part.tail.data, expected[-1])
+            self.assertIsNone(part.tail.next)
+        else:
+            self.assertIsNone(part.tail)
+
+    def test_split_half(self):
+        """Test the back half starts at find_middle and nodes are shared"""
+        for length in range(0, 10):
+            with self.subTest(length=length):
+                llist = SlowFastLinkedList()
+                llist.extend(range(length))
+                middle = llist.find_middle()
+                nodes = list(llist.iter_nodes())
+                front, back = llist.split_half()
+                self._assert_part(front, list(range(length // 2)))
+                self._assert_part(back, list(range(length // 2, length)))
+                self.assertEqual(back.head.data if back.head else None, middle)
+                self.assertEqual(list(front.iter_nodes()) + list(back.iter_nodes()), nodes)
+                self._assert_part(llist, [])
+        front.append(99)
+        self.assertEqual(list(back), [4, 5, 6, 7, 8])
+
+    def test_split_into(self):
+        """Test part sizes differ by at most one, including more parts than nodes"""
+        for length, k in [(10, 3), (10, 1), (10, 10), (3, 5), (0, 2), (7, 2)]:
+            with self.subTest(length=length, k=k):
+                llist = SlowFastLinkedList()
+                llist.extend(range(length))
+                parts = llist.split_into(k)
+                self.assertEqual(len(parts), k)
+                bounds = [length * i // k for i in range(k + 1)]
+                for i, part in enumerate(parts):
+                    self._assert_part(part, list(range(bounds[i], bounds[i + 1])))
+
+    def test_split_errors(self):
+        """Test invalid part counts and cyclic lists are rejected untouched"""
+        self.llist.extend(range(5))
+        with self.assertRaises(ValueError):
+            self.llist.split_into(0)
+        self.llist.create_cycle(1)
+        with self.assertRaises(ValueError):
+            self.llist.split_half()
+        self.assertEqual(len(self.llist), 5)
+        self.assertEqual(self.llist.find_cycle_start(), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
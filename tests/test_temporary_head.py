@@ -1,9 +1,13 @@
+import copy
+import pickle
+import random
 import unittest
 from io import StringIO
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from src.temporary_head import TemporaryHeadLinkedList
+from src.multiple_pass import MultiplePassLinkedList
+from src.temporary_head import TemporaryHeadLinkedList, merge_sorted, iter_merge_sorted
 
 
 class TestTemporaryHeadLinkedList(unittest.TestCase):
@@ -200,6 +204,79 @@ class TestTemporaryHeadLinkedList(unittest.TestCase):
         result = self._get_list_as_array()
         self.assertEqual(result, [5, 4])
 
+    def _assert_tail_is_last_node(self):
+        """Helper method to check that tail is the last reachable node"""
+        last = None
+        current = self.llist.head
+        while current:
+            last = current
+            current = current.next
+        self.assertIs(self.llist.tail, last)
+
+    def test_tail_after_delete(self):
+        """Test tail is maintained when deleting head, middle and tail nodes"""
+        for i in range(1, 6):
+            self.llist.append(i)
+
+        for value in [5, 1, 3, 4, 99, 2]:
+            self.llist.delete_node(value)
+            self._assert_tail_is_last_node()
+        self.assertIsNone(self.llist.tail)
+
+        # Appending after the list was emptied still works
+        self.llist.append(7)
+        self.assertEqual(self._get_list_as_array(), [7])
+        self._assert_tail_is_last_node()
+
+    def test_tail_after_reverse(self):
+        """Test tail is maintained by reverse and appends go to the new end"""
+        for i in range(1, 4):
+            self.llist.append(i)
+
+        self.llist.reverse()
+        self._assert_tail_is_last_node()
+        self.assertEqual(self.llist.tail.data, 1)
+
+        self.llist.append(0)
+        self.assertEqual(self._get_list_as_array(), [3, 2, 1, 0])
+        self._assert_tail_is_last_node()
+
+    def test_len_after_delete_and_reverse(self):
+        """Test the size counter is kept in sync by delete_node and reverse"""
+        TemporaryHeadLinkedList.debug = True
+        try:
+            for i in range(1, 6):
+                self.llist.append(i)
+
+            self.llist.delete_node(1)
+            self.llist.delete_node(99)
+            self.assertEqual(len(self.llist), 4)
+
+            self.llist.reverse()
+            self.assertEqual(len(self.llist), 4)
+
+            for value in [2, 3, 4, 5]:
+                self.llist.delete_node(value)
+            self.assertEqual(len(self.llist), 0)
+        finally:
+            TemporaryHeadLinkedList.debug = False
+
+    def test_version_after_delete_and_reverse(self):
+        """Test successful deletes and reverse bump the version, misses do not"""
+        for i in range(1, 4):
+            self.llist.append(i)
+
+        version = self.llist.version
+        self.llist.delete_node(99)
+        self.assertEqual(self.llist.version, version)
+
+        self.llist.delete_node(2)
+        self.assertGreater(self.llist.version, version)
+
+        version = self.llist.version
+        self.llist.reverse()
+        self.assertGreater(self.llist.version, version)
+
     def test_mixed_data_types(self):
         """Test with mixed data types"""
         data = [1, "hello", 3.14, [1, 2]]
@@ -212,5 +289,326 @@ class TestTemporaryHeadLinkedList(unittest.TestCase):
         self.assertEqual(result, [[1, 2], 3.14, 1])
 
 
+class TestIndexedDelete(unittest.TestCase):
+    def _assert_consistent(self, llist):
+        """Check the index and predecessors against a walk of the list"""
+        nodes = list(llist.iter_nodes())
+        self.assertEqual(len(llist), len(nodes))
+        self.assertIs(llist.tail, nodes[-1] if nodes else None)
+        for prev, node in zip([None] + nodes, nodes):
+            self.assertIs(llist._pred[node], prev)
+        self.assertEqual(len(llist._pred), len(nodes))
+        expected = {}
+        for node in nodes:
+            expected.setdefault(node.data, []).append(node)
+        self.assertEqual({value: list(found) for value, found in llist._index.items()}, expected)
+
+    def test_deletes_first_occurrence(self):
+        """Test head, middle, tail and duplicate deletions"""
+        llist = TemporaryHeadLinkedList(indexed=True)
+        llist.extend([1, 2, 1, 3, 2])
+
+        self.assertTrue(llist.delete_node(2))
+        self.assertEqual(list(llist), [1, 1, 3, 2])
+        self.assertTrue(llist.delete_node(1))
+        self.assertTrue(llist.delete_node(2))
+        self.assertEqual(list(llist), [1, 3])
+        self.assertEqual(llist.tail.data, 3)
+        self._assert_consistent(llist)
+
+        self.assertFalse(llist.delete_node(99))
+        self.assertFalse(llist.delete_node([1]))  # Unhashable, never stored
+        self.assertTrue(llist.delete_node(1))
+        self.assertTrue(llist.delete_node(3))
+        self.assertIsNone(llist.head)
+        self.assertIsNone(llist.tail)
+        self._assert_consistent(llist)
+
+    def test_reverse_keeps_first_occurrence(self):
+        """Test that after reverse the new first occurrence is deleted"""
+        llist = TemporaryHeadLinkedList(indexed=True)
+        llist.extend(["a", "b", "a", "c"])
+        first_a = llist.head
+        llist.reverse()
+        self._assert_consistent(llist)
+
+        self.assertTrue(llist.delete_node("a"))
+        self.assertEqual(list(llist), ["c", "b", "a"])
+        self.assertIs(llist.tail, first_a)
+        self._assert_consistent(llist)
+
+    def test_unhashable_append_is_rejected(self):
+        """Test that an unhashable value leaves the list untouched"""
+        llist = TemporaryHeadLinkedList(indexed=True)
+        llist.append(1)
+        with self.assertRaises(TypeError):
+            llist.append([2])
+        self.assertEqual(list(llist), [1])
+        self._assert_consistent(llist)
+
+    def test_random_workload_matches_scan(self):
+        """Test indexed and scanning lists agree through random operations"""
+        rng = random.Random(11)
+        indexed = TemporaryHeadLinkedList(indexed=True)
+        scanning = TemporaryHeadLinkedList()
+        for step in range(600):
+            roll = rng.random()
+            if roll < 0.5:
+                value = rng.randrange(15)
+                indexed.append(value)
+                scanning.append(value)
+            elif roll < 0.95:
+                value = rng.randrange(15)
+                self.assertEqual(indexed.delete_node(value), scanning.delete_node(value), step)
+            else:
+                indexed.reverse()
+                scanning.reverse()
+            self.assertEqual(list(indexed), list(scanning), step)
+        self._assert_consistent(indexed)
+
+    def test_copy_and_pickle_rebuild_the_index(self):
+        """Test that copies are indexed and independent of the original"""
+        llist = TemporaryHeadLinkedList(indexed=True)
+        llist.extend([3, 1, 3])
+        for clone in (copy.copy(llist), pickle.loads(pickle.dumps(llist))):
+            with self.subTest(clone=type(clone).__name__):
+                self.assertTrue(clone.indexed)
+                self._assert_consistent(clone)
+                self.assertTrue(clone.delete_node(3))
+                self.assertEqual(list(clone), [1, 3])
+        self.assertEqual(list(llist), [3, 1, 3])
+
+
+
+class TestBatchDelete(unittest.TestCase):
+    def _filled(self, values, indexed=False):
+        """Return a list holding the given values"""
+        llist = TemporaryHeadLinkedList(indexed=indexed)
+        llist.extend(values)
+        return llist
+
+    def _assert_linked(self, llist, expected):
+        """Check values, length and tail after a batch deletion"""
+        self.assertEqual(list(llist), expected)
+        self.assertEqual(len(llist), len(expected))
+        self.assertEqual(llist.tail.data if llist.tail else None,
+                         expected[-1] if expected else None)
+
+    def test_delete_all(self):
+        """Test removing several values, including head and tail, in one pass"""
+        for indexed in (False, True):
+            with self.subTest(indexed=indexed):
+                llist = self._filled([1, 2, 3, 2, 4, 1], indexed)
+                self.assertEqual(llist.delete_all([1, 2, 99]), 4)
+                self._assert_linked(llist, [3, 4])
+                self.assertEqual(llist.delete_all([]), 0)
+                self.assertEqual(llist.delete_all(iter([3, 4])), 2)
+                self._assert_linked(llist, [])
+                if indexed:
+                    self.assertEqual(llist._index, {})
+
+    def test_delete_all_unhashable(self):
+        """Test unhashable values and data fall back to equality"""
+        llist = self._filled([[1], 2, [1], "x", {"a": 1}])
+        self.assertEqual(llist.delete_all([[1], "x"]), 3)
+        self._assert_linked(llist, [2, {"a": 1}])
+
+    def test_delete_where(self):
+        """Test predicate deletion and its removal count"""
+        llist = self._filled(range(10))
+        version = llist.version
+        self.assertEqual(llist.delete_where(lambda x: x > 100), 0)
+        self.assertEqual(llist.version, version)
+
+        self.assertEqual(llist.delete_where(lambda x: x % 3 == 0), 4)
+        self._assert_linked(llist, [1, 2, 4, 5, 7, 8])
+        self.assertGreater(llist.version, version)
+
+    def test_delete_where_predicate_raises(self):
+        """Test that a failing predicate leaves earlier removals consistent"""
+        llist = self._filled([0, 1, 2, "three", 4], indexed=True)
+
+        def odd_or_fail(x):
+            return x % 2 == 1 if isinstance(x, int) else 1 / 0
+
+        with self.assertRaises(ZeroDivisionError):
+            llist.delete_where(lambda x: x == 0 or odd_or_fail(x))
+        self._assert_linked(llist, [2, "three", 4])
+        self.assertTrue(llist.delete_node(4))
+        self._assert_linked(llist, [2, "three"])
+
+    def test_delete_first_n(self):
+        """Test removing only the first n occurrences"""
+        for indexed in (False, True):
+            with self.subTest(indexed=indexed):
+                llist = self._filled([7, 1, 7, 2, 7, 7], indexed)
+                self.assertEqual(llist.delete_first_n(7, 0), 0)
+                self.assertEqual(llist.delete_first_n(7, 2), 2)
+                self._assert_linked(llist, [1, 2, 7, 7])
+                self.assertEqual(llist.delete_first_n(7, 5), 2)
+                self._assert_linked(llist, [1, 2])
+                self.assertEqual(llist.delete_first_n(99, 3), 0)
+                with self.assertRaises(ValueError):
+                    llist.delete_first_n(1, -1)
+
+    def test_matches_repeated_delete_node(self):
+        """Test batch deletion agrees with delete_node in a loop"""
+        rng = random.Random(5)
+        values = [rng.randrange(30) for _ in range(300)]
+        doomed = set(rng.sample(range(30), 10))
+
+        batch = self._filled(values, indexed=True)
+        looped = self._filled(values)
+        removed = batch.delete_all(doomed)
+        for value in doomed:
+            while looped.delete_node(value):
+                pass
+        self.assertEqual(list(batch), list(looped))
+        self.assertEqual(removed, len(values) - len(looped))
+        self.assertTrue(batch.delete_node(batch.tail.data))
+        self.assertTrue(looped.delete_node(looped.tail.data))
+        self.assertEqual(list(batch), list(looped))
+
+
+class TestSort(unittest.TestCase):
+    def _assert_sorted(self, llist, expected):
+        """Check values, length, tail and the tail's next after a sort"""
+        self.assertEqual(list(llist), expected)
+        self.assertEqual(len(llist), len(expected))
+        if expected:
+            self.assertEqual(llist.tail.data, expected[-1])
+            self.assertIsNone(llist.tail.next)
+        else:
+            self.assertIsNone(llist.tail)
+
+    def test_sort_matches_sorted(self):
+        """Test every length up to a few full passes, including odd runs"""
+        rng = random.Random(3)
+        for size in list(range(18)) + [257, 1000]:
+            values = [rng.randrange(50) for _ in range(size)]
+            for reverse in (False, True):
+                with self.subTest(size=size, reverse=reverse):
+                    llist = TemporaryHeadLinkedList()
+                    llist.extend(values)
+                    llist.sort(reverse=reverse)
+                    self._assert_sorted(llist, sorted(values, reverse=reverse))
+
+    def test_sort_is_stable_in_place(self):
+        """Test that equal keys keep their order and no node is replaced"""
+        rng = random.Random(4)
+        values = [(rng.randrange(5), i) for i in range(200)]
+        llist = TemporaryHeadLinkedList()
+        llist.extend(values)
+        nodes = {id(node) for node in llist.iter_nodes()}
+        version = llist.version
+
+        for reverse in (False, True):
+            llist.sort(key=lambda item: item[0], reverse=reverse)
+            self._assert_sorted(llist, sorted(values, key=lambda item: item[0], reverse=reverse))
+        self.assertEqual({id(node) for node in llist.iter_nodes()}, nodes)
+        self.assertGreater(llist.version, version)
+
+    def test_sort_indexed_list(self):
+        """Test that the index follows the new order"""
+        llist = TemporaryHeadLinkedList(indexed=True)
+        llist.extend([3, 1, 2, 1, 3])
+        llist.sort()
+        self._assert_sorted(llist, [1, 1, 2, 3, 3])
+        TestIndexedDelete._assert_consistent(self, llist)
+        self.assertTrue(llist.delete_node(3))
+        self._assert_sorted(llist, [1, 1, 2, 3])
+
+    def test_sort_failure_keeps_every_node(self):
+        """Test that an incomparable value or a cycle leaves the list whole"""
+        values = [5, 3, "x", 1, 4, 2, 0]
+        llist = TemporaryHeadLinkedList()
+        llist.extend(values)
+        with self.assertRaises(TypeError):
+            llist.sort()
+        self.assertEqual(sorted(map(str, llist)), sorted(map(str, values)))
+        self.assertEqual(len(llist), len(values))
+        self.assertIsNone(llist.tail.next)
+        self.assertTrue(llist.delete_node("x"))
+        llist.sort()
+        self._assert_sorted(llist, [0, 1, 2, 3, 4, 5])
+
+        llist.tail.next = llist.head.next  # Close a cycle by hand
+        llist._mutated()
+        with self.assertRaises(ValueError):
+            llist.sort()
+
+
+class TestMergeSorted(unittest.TestCase):
+    def _shards(self, *runs):
+        """Return one list per run of values"""
+        shards = []
+        for run in runs:
+            shard = TemporaryHeadLinkedList()
+            shard.extend(run)
+            shards.append(shard)
+        return shards
+
+    def test_merge_relinks_nodes(self):
+        """Test the merged order, that nodes are reused and inputs emptied"""
+        rng = random.Random(6)
+        runs = [sorted(rng.randrange(100) for _ in range(rng.randrange(30))) for _ in range(12)]
+        runs.append([])
+        shards = self._shards(*runs)
+        nodes = {id(node) for shard in shards for node in shard.iter_nodes()}
+
+        merged = merge_sorted(shards)
+        expected = sorted(value for run in runs for value in run)
+        self.assertEqual(list(merged), expected)
+        self.assertEqual(len(merged), len(expected))
+        self.assertEqual(merged.tail.data, expected[-1])
+        self.assertIsNone(merged.tail.next)
+        self.assertEqual({id(node) for node in merged.iter_nodes()}, nodes)
+        for shard in shards:
+            self.assertEqual((shard.head, shard.tail, len(shard)), (None, None, 0))
+        self.assertEqual(list(merge_sorted([])), [])
+
+    def test_merge_is_stable_with_key(self):
+        """Test that ties keep list order, across list classes"""
+        first = MultiplePassLinkedList(track_middle=True)
+        first.extend([(1, "a"), (3, "a")])
+        second, third = self._shards([(1, "b"), (2, "b")], [(3, "c")])
+        third.indexed = True
+        third._rebuild_index()
+
+        merged = merge_sorted([first, second, third], key=lambda item: item[0])
+        self.assertEqual(list(merged), [(1, "a"), (1, "b"), (2, "b"), (3, "a"), (3, "c")])
+        self.assertIsNone(first.find_middle())
+        self.assertEqual(third._index, {})
+
+    def test_lazy_merge(self):
+        """Test the generator yields incrementally and leaves the lists intact"""
+        shards = self._shards([1, 4, 9], [2, 3], [], [0, 10])
+        shards[0].extend([11])
+        values = iter_merge_sorted(shards)
+        self.assertEqual([next(values), next(values)], [0, 1])
+        self.assertEqual(list(values), [2, 3, 4, 9, 10, 11])
+        self.assertEqual(list(shards[0]), [1, 4, 9, 11])
+        descending = self._shards([9, 4], [8, 4, 1])
+        self.assertEqual(list(iter_merge_sorted(descending, key=lambda x: -x)), [9, 8, 4, 4, 1])
+
+    def test_merge_failures(self):
+        """Test rejected inputs and that a failing key loses no node"""
+        shards = self._shards([1, 2], [3, "x"], [0, 5])
+        with self.assertRaises(ValueError):
+            merge_sorted([shards[0], shards[0]])
+        shards[2].tail.next = shards[2].head
+        shards[2]._mutated()
+        with self.assertRaises(ValueError):
+            merge_sorted(shards)
+        shards[2].tail.next = None
+        shards[2]._mutated()
+
+        with self.assertRaises(TypeError):
+            merge_sorted(shards, key=lambda x: x + 0)
+        self.assertEqual(sorted(map(str, shards[0])), ["0", "1", "2", "3", "5", "x"])
+        self.assertEqual(len(shards[0]), 6)
+        self.assertIsNone(shards[0].tail.next)
+        self.assertEqual(len(shards[1]) + len(shards[2]), 0)
+
 if __name__ == '__main__':
     unittest.main()
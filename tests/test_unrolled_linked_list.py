@@ -0,0 +1,226 @@
+import copy
+import pickle
+import random
+import unittest
+from io import StringIO
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.unrolled_linked_list import UnrolledLinkedList
+from src.multiple_pass import MultiplePassLinkedList
+from src.slow_fast import SlowFastLinkedList
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.llist = UnrolledLinkedList(block_size=4)
+
+    def _get_blocks(self):
+        """Helper method returning the values of each block, head to tail"""
+        blocks = []
+        block = self.llist.head
+        remaining = len(self.llist)
+        while remaining > 0:
+            blocks.append(list(block.values))
+            remaining -= len(block.values)
+            if remaining > 0:
+                block = block.next
+        self.assertIs(self.llist.tail, block)
+        return blocks
+
+    def test_empty_list(self):
+        """Test an empty list has no blocks, length or middle"""
+        self.assertIsNone(self.llist.head)
+        self.assertIsNone(self.llist.tail)
+        self.assertEqual(len(self.llist), 0)
+        self.assertEqual(str(self.llist), "None")
+        self.assertIsNone(self.llist.find_middle())
+        self.assertIsNone(self.llist.find_cycle_start())
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(block_size=0)
+
+    def test_append_and_extend_fill_blocks(self):
+        """Test values are packed into full blocks in order"""
+        self.llist.append(0)
+        self.llist.extend(range(1, 6))
+        self.llist.append(6)
+        self.llist.extend(range(7, 10))
+        self.assertEqual(self._get_blocks(), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertEqual(list(self.llist), list(range(10)))
+        self.assertEqual(len(self.llist), 10)
+        self.assertEqual(repr(self.llist), "UnrolledLinkedList(len=10, blocks=3, block_size=4)")
+
+        self.llist.extend(self.llist)
+        self.assertEqual(list(self.llist), list(range(10)) * 2)
+
+    def test_print_list(self):
+        """Test printing a list that spans several blocks"""
+        self.llist.extend(range(1, 7))
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+
+        self.llist.print_list()
+
+        sys.stdout = sys.__stdout__
+        self.assertEqual(captured_output.getvalue().strip(), "1 -> 2 -> 3 -> 4 -> 5 -> 6 -> None")
+
+    def test_find_middle_matches_multiple_pass(self):
+        """Test find_middle agrees with MultiplePassLinkedList for many lengths"""
+        for length in range(1, 20):
+            with self.subTest(length=length):
+                unrolled = UnrolledLinkedList(block_size=3)
+                node_list = MultiplePassLinkedList()
+                unrolled.extend(range(length))
+                node_list.extend(range(length))
+                self.assertEqual(unrolled.find_middle(), node_list.find_middle())
+
+    def test_find_cycle_start_matches_slow_fast(self):
+        """Test cycles start at any position, splitting a block if needed"""
+        for pos in range(10):
+            with self.subTest(pos=pos):
+                self.llist = UnrolledLinkedList(block_size=4)
+                node_list = SlowFastLinkedList()
+                self.llist.extend(range(10))
+                node_list.extend(range(10))
+                self.assertTrue(self.llist.create_cycle(pos))
+                node_list.create_cycle(pos)
+                self.assertEqual(self.llist.find_cycle_start(), node_list.find_cycle_start())
+                self.assertEqual(list(self.llist), list(range(10)))
+                self.assertEqual(self.llist.find_middle(), 5)
+
+        self.assertFalse(self.llist.create_cycle(-1))
+        self.assertFalse(self.llist.create_cycle(10))
+        # The size bounds iteration, so a cycle cannot hang str()
+        self.assertEqual(str(self.llist), str(node_list))
+        self.assertTrue(str(self.llist).endswith("9 -> (cycle back to 9)"))
+        with self.assertRaises(ValueError):
+            self.llist.reverse()
+
+    def test_delete_node(self):
+        """Test deleting head, middle, tail and missing values"""
+        self.llist.extend(range(1, 11))
+
+        self.assertTrue(self.llist.delete_node(1))
+        self.assertTrue(self.llist.delete_node(6))
+        self.assertTrue(self.llist.delete_node(10))
+        self.assertFalse(self.llist.delete_node(99))
+        self.assertEqual(list(self.llist), [2, 3, 4, 5, 7, 8, 9])
+        self.assertEqual(len(self.llist), 7)
+
+        for value in [2, 3, 4, 5, 7, 8, 9]:
+            self.assertTrue(self.llist.delete_node(value))
+        self.assertIsNone(self.llist.head)
+        self.assertIsNone(self.llist.tail)
+        self.llist.append(1)
+        self.assertEqual(self._get_blocks(), [[1]])
+
+    def test_underfull_blocks_merge(self):
+        """Test a block under half full absorbs or borrows from its successor"""
+        self.llist.extend(range(6))
+        self.llist.delete_node(0)
+        self.llist.delete_node(1)
+        self.assertEqual(self._get_blocks(), [[2, 3], [4, 5]])
+        self.llist.delete_node(2)
+        self.assertEqual(self._get_blocks(), [[3, 4, 5]])
+
+        self.llist.extend(range(6, 14))
+        for value in (3, 4, 5):
+            self.llist.delete_node(value)
+        # [6] and [7, 8, 9, 10] do not fit in one block, so [6] borrows
+        self.assertEqual(self._get_blocks(), [[6, 7], [8, 9, 10], [11, 12, 13]])
+        self.assertIsNone(self.llist._dummy.next)
+
+        self.llist = UnrolledLinkedList(block_size=4)
+        self.llist.extend("abcdefgh")
+        for value in "abc":
+            self.llist.delete_node(value)
+        self.assertEqual(self._get_blocks(), [["d", "e"], ["f", "g", "h"]])
+
+    def test_extend_keeps_items_taken_before_an_error(self):
+        """Test a failing iterable leaves the blocks and length consistent"""
+        def failing_reader(count):
+            yield from range(1, count + 1)
+            raise OSError("read failed")
+
+        for count in (2, 5, 7, 8):
+            with self.subTest(count=count):
+                self.llist = UnrolledLinkedList(block_size=4)
+                self.llist.append(0)
+                with self.assertRaises(OSError):
+                    self.llist.extend(failing_reader(count))
+                self.llist.append(-1)
+                expected = list(range(count + 1)) + [-1]
+                self.assertEqual(list(self.llist), expected)
+                self.assertEqual(len(self.llist), len(expected))
+                self.assertEqual(sum(map(len, self._get_blocks())), len(expected))
+
+    def test_copy_and_pickle(self):
+        """Test long and cyclic lists copy and pickle without recursion"""
+        self.llist.extend(range(20_000))
+        self.llist.create_cycle(10_001)
+        clones = {
+            "copy": copy.copy(self.llist),
+            "deepcopy": copy.deepcopy(self.llist),
+            "pickle": pickle.loads(pickle.dumps(self.llist)),
+        }
+        for name, clone in clones.items():
+            with self.subTest(clone=name):
+                self.assertEqual(clone.block_size, 4)
+                self.assertEqual(len(clone), 20_000)
+                self.assertEqual(clone.find_cycle_start(), 10_001)
+                self.assertEqual(list(clone), list(self.llist))
+                self.assertIsNot(clone.head, self.llist.head)
+
+    def test_reverse(self):
+        """Test reversing reverses both the blocks and their contents"""
+        self.llist.reverse()
+        self.assertEqual(list(self.llist), [])
+
+        self.llist.extend(range(1, 7))
+        self.llist.reverse()
+        self.assertEqual(self._get_blocks(), [[6, 5], [4, 3, 2, 1]])
+
+        self.llist.append(0)
+        self.assertEqual(list(self.llist), [6, 5, 4, 3, 2, 1, 0])
+        self.assertEqual(self.llist.find_middle(), 3)
+
+    def test_random_workload_matches_list(self):
+        """Test every operation against a Python list, with cycles, at several block sizes"""
+        for block_size in (1, 2, 3, 8):
+            rng = random.Random(block_size)
+            self.llist = UnrolledLinkedList(block_size)
+            expected = []
+            for step in range(400):
+                roll = rng.random()
+                if roll < 0.35:
+                    value = rng.randrange(20)
+                    self.llist.append(value)
+                    expected.append(value)
+                elif roll < 0.45:
+                    values = [rng.randrange(20) for _ in range(rng.randrange(10))]
+                    self.llist.extend(values)
+                    expected.extend(values)
+                elif roll < 0.85:
+                    value = rng.randrange(20)
+                    self.assertEqual(self.llist.delete_node(value), value in expected)
+                    if value in expected:
+                        expected.remove(value)
+                elif roll < 0.95 and self.llist.tail and self.llist.tail.next is None:
+                    self.llist.reverse()
+                    expected.reverse()
+                elif expected:
+                    pos = rng.randrange(len(expected))
+                    self.llist.create_cycle(pos)
+                    self.assertEqual(self.llist.find_cycle_start(), expected[pos])
+                with self.subTest(block_size=block_size, step=step):
+                    self.assertEqual(list(self.llist), expected)
+                    self.assertEqual(self.llist.find_middle(),
+                                     expected[len(expected) // 2] if expected else None)
+                    for values in self._get_blocks():
+                        self.assertTrue(1 <= len(values) <= block_size)
+
+
+if __name__ == '__main__':
+    unittest.main()